@@ -20,6 +20,18 @@ def create_app():
     from . import db # db는 함수 밖에서 import 해도 안전합니다.
     app.teardown_appcontext(db.close_db)
 
+    # 요청별 SQL 실행 통계 (QUERY_STATS_ENABLED=true 일 때만 동작)
+    from . import query_stats
+    query_stats.init_app(app)
+
+    # 모든 라우트에 요청 수/지연시간/에러 메트릭 적용
+    from . import metrics
+    metrics.init_app(app)
+
+    # 요청 단위 프로파일링 (PROFILING_SECRET 또는 PROFILE_SAMPLE_RATE 설정 시)
+    from . import profiling
+    profiling.init_app(app)
+
     # 블루프린트 등록
     with app.app_context():
         from . import auth # 블루프린트 import를 함수 안으로 이동
@@ -28,6 +40,12 @@ def create_app():
         from . import profiles # 'students.py' -> 'profiles.py' 로 수정
         from . import ai
         from . import messages # 'chat.py' -> 'messages.py' 로 수정
+        from . import batch
+        from . import dashboard
+        from . import purge
+        from . import notifications
+        from . import semantic
+        from . import autocomplete
         # socket_events는 main.py에서 명시적으로 등록됨
 
     app.register_blueprint(auth.auth_bp, url_prefix='/auth')
@@ -36,6 +54,14 @@ def create_app():
     app.register_blueprint(profiles.profiles_bp, url_prefix='/profiles')
     app.register_blueprint(ai.ai_bp, url_prefix='/ai')
     app.register_blueprint(messages.messages_bp, url_prefix='/messages')
+    app.register_blueprint(batch.batch_bp, url_prefix='/batch')
+    app.register_blueprint(dashboard.dashboard_bp, url_prefix='/dashboard')
+    app.register_blueprint(purge.purge_bp, url_prefix='/purge-jobs')
+    app.register_blueprint(notifications.notifications_bp, url_prefix='/notifications')
+    app.register_blueprint(semantic.semantic_bp, url_prefix='/search')
+    app.register_blueprint(autocomplete.autocomplete_bp, url_prefix='/autocomplete')
+    app.register_blueprint(metrics.metrics_bp, url_prefix='/metrics')
+    app.register_blueprint(profiling.profiling_bp, url_prefix='/profiling')
 
     # 루트 경로 헬스체크 엔드포인트
     @app.route('/')
@@ -50,7 +76,14 @@ def create_app():
                 "applications": "/applications",
                 "profiles": "/profiles",
                 "ai": "/ai",
-                "messages": "/messages"
+                "messages": "/messages",
+                "batch": "/batch",
+                "dashboard": "/dashboard",
+                "purge_jobs": "/purge-jobs",
+                "notifications": "/notifications",
+                "search": "/search",
+                "autocomplete": "/autocomplete",
+                "metrics": "/metrics"
             }
         }, 200
 
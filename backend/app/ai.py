@@ -1,7 +1,10 @@
 from flask import Blueprint, request, jsonify
 import google.generativeai as genai
+from google.api_core import retry as api_retry
 import os
+import time
 from dotenv import load_dotenv
+from . import metrics
 
 load_dotenv()
 
@@ -9,8 +12,21 @@ ai_bp = Blueprint("ai", __name__, url_prefix="/ai")
 
 # Gemini API 설정
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# 설정 시 Google 대신 해당 주소로 요청 (예: 로컬 대체 서버 bench/fake_gemini.py). REST 전송으로 고정됩니다.
+GEMINI_API_ENDPOINT = os.getenv("GEMINI_API_ENDPOINT")
 if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
+    if GEMINI_API_ENDPOINT:
+        genai.configure(api_key=GEMINI_API_KEY, transport="rest", client_options={"api_endpoint": GEMINI_API_ENDPOINT})
+    else:
+        genai.configure(api_key=GEMINI_API_KEY)
+
+# 사용할 모델과 요청 타임아웃(초). 429/503 재시도를 포함한 전체 대기 시간도 GEMINI_TIMEOUT으로 제한합니다.
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT", "60"))
+GEMINI_REQUEST_OPTIONS = {
+    "timeout": GEMINI_TIMEOUT,
+    "retry": api_retry.Retry(initial=0.5, maximum=4.0, multiplier=2.0, timeout=GEMINI_TIMEOUT)
+}
 
 # ==================================================
 #   AI 자기소개 생성 API (POST /ai/generate-intro)
@@ -46,7 +62,7 @@ def generate_intro():
 
     try:
         # Gemini 모델 설정 (빠르고 효율적인 최신 모델)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+        model = genai.GenerativeModel(GEMINI_MODEL)
 
         # 입력 길이에 따른 자동 스타일 결정
         input_length = len(user_input)
@@ -138,9 +154,16 @@ def generate_intro():
 버전3: [임팩트와 비전 중심 자기소개 - 2-3문단]
 """
 
-        # AI 생성 요청
-        response = model.generate_content(prompt)
-        generated_text = response.text
+        # AI 생성 요청 (지연시간/실패 메트릭 기록)
+        started = time.perf_counter()
+        try:
+            response = model.generate_content(prompt, request_options=GEMINI_REQUEST_OPTIONS)
+            generated_text = response.text
+        except Exception:
+            metrics.AI_FAILURES.inc()
+            raise
+        finally:
+            metrics.AI_LATENCY.observe(time.perf_counter() - started)
 
         # 응답 파싱 (버전별로 분리)
         versions = parse_versions(generated_text)
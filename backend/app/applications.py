@@ -1,9 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from app.db import get_db
 from .auth import token_required
-from .utils import format_records # 데이터 포맷팅 유틸리티 가져오기
+from .utils import format_records, encode_cursor, decode_cursor # 데이터 포맷팅 유틸리티 가져오기
 import os
+import io
+import csv
+import datetime
+import psycopg2.extensions
+from collections import defaultdict
 from dotenv import load_dotenv
+from . import notifications
+from . import idempotency
+from . import popularity
 
 load_dotenv()
 
@@ -13,6 +21,31 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY must be set in environment variables")
 
+# 지원자 CSV 내보내기에서 서버 측 커서로 한 번에 가져올 행 수
+APPLICATIONS_EXPORT_FETCH_ROWS = int(os.getenv("APPLICATIONS_EXPORT_FETCH_ROWS", "500"))
+
+# PUT /applications/bulk 한 번에 처리할 수 있는 최대 지원서 수
+APPLICATIONS_BULK_MAX = int(os.getenv("APPLICATIONS_BULK_MAX", "1000"))
+
+APPLICATION_STATUSES = ["PENDING", "ACCEPTED", "REJECTED"]
+
+# GET /applications/project/<id> 한 페이지 기본/최대 지원자 수
+APPLICATIONS_PAGE_SIZE = int(os.getenv("APPLICATIONS_PAGE_SIZE", "50"))
+APPLICATIONS_PAGE_MAX = int(os.getenv("APPLICATIONS_PAGE_MAX", "200"))
+
+# 내보낼 수 있는 컬럼 (CSV 헤더 이름 -> SQL 식). ?columns= 로 일부만 고를 수 있으며 기본은 전체
+EXPORT_COLUMNS = {
+    "application_id": "a.id",
+    "student_name": "s.name",
+    "student_email": "u.email",
+    "status": "a.status",
+    "cover_letter": "a.cover_letter",
+    "skills": "s.skills",
+    "portfolio_url": "s.portfolio_url",
+    "github_url": "s.github_url",
+    "applied_at": "a.created_at",
+}
+
 # projects.py에서 token_required를 가져오는 대신 auth.py에서 가져오도록 수정
 # from app.projects import token_required -> from .auth import token_required
 
@@ -21,6 +54,60 @@ if not SECRET_KEY:
 # ============================
 #   프로젝트에 지원하기 API (학생만 가능)
 # ============================
+# 모집 중인 프로젝트일 때만 지원서를 넣는 한 문장. 이미 지원했으면 ON CONFLICT로 아무것도 하지 않음
+# (예외/롤백 없이 결과 행으로 created / duplicate / project_unavailable 을 구분)
+APPLY_SQL = """
+WITH project AS (
+    SELECT id, business_id, title FROM projects
+    WHERE id = %(project_id)s AND status = 'OPEN' AND deleted_at IS NULL
+),
+inserted AS (
+    INSERT INTO applications (project_id, student_id, cover_letter)
+    SELECT id, %(student_id)s, %(cover_letter)s FROM project
+    ON CONFLICT (project_id, student_id) DO NOTHING
+    RETURNING id
+)
+SELECT p.id AS project_id, p.business_id, p.title, i.id AS application_id
+FROM (SELECT 1) one
+LEFT JOIN project p ON TRUE
+LEFT JOIN inserted i ON TRUE
+"""
+
+
+def _apply(cursor, project_id, cover_letter):
+    """지원 처리 후 (응답 본문, 상태 코드) 반환. 커밋은 호출한 쪽에서 합니다."""
+    cursor.execute(APPLY_SQL, {"project_id": project_id, "student_id": request.user["id"], "cover_letter": cover_letter})
+    result = cursor.fetchone()
+
+    if result["project_id"] is None:
+        return {"message": "project not found or not open", "outcome": "project_unavailable"}, 404
+
+    if result["application_id"] is None:
+        # 같은 문장 안에서는 동시에 커밋된 지원서가 보이지 않으므로 새 문장으로 기존 지원서를 조회
+        cursor.execute("SELECT id FROM applications WHERE project_id = %s AND student_id = %s",
+                       (project_id, request.user["id"]))
+        existing = cursor.fetchone()
+        return {
+            "message": "You have already applied to this project",
+            "outcome": "duplicate",
+            "application_id": existing["id"] if existing else None
+        }, 409
+
+    # 사장님에게 새 지원자 알림 (지원서와 같은 트랜잭션)
+    notifications.publish(cursor, result["business_id"], "APPLICATION_CREATED", {
+        "application_id": result["application_id"],
+        "project_id": result["project_id"],
+        "project_title": result["title"],
+        "student_id": request.user["id"],
+        "student_name": request.user.get("name", "")
+    })
+    return {
+        "message": "application submitted successfully",
+        "outcome": "created",
+        "application_id": result["application_id"]
+    }, 201
+
+
 @applications_bp.route("", methods=["POST"])
 @token_required
 def create_application():
@@ -28,13 +115,18 @@ def create_application():
     if request.user.get("role") != "STUDENT":
         return jsonify({"message": "only students can apply to projects"}), 403
 
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     project_id = data.get("project_id")
     cover_letter = data.get("cover_letter", "")
 
     if not project_id:
         return jsonify({"message": "project_id is required"}), 400
 
+    try:
+        key = idempotency.request_key()
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
     conn = None
     cursor = None
 
@@ -42,33 +134,27 @@ def create_application():
         conn = get_db()
         cursor = conn.cursor()
 
-        # 프로젝트 존재 여부 확인
-        cursor.execute("SELECT id FROM projects WHERE id = %s AND status = 'OPEN'", (project_id,))
-        project = cursor.fetchone()
-
-        if not project:
-            return jsonify({"message": "project not found or not open"}), 404
+        # 같은 Idempotency-Key로 이미 처리한 요청이면 저장된 응답을 그대로 반환
+        if key:
+            replay = idempotency.begin(cursor, request.user["id"], key, "POST /applications", data)
+            if replay is not None:
+                conn.rollback()
+                return replay
 
-        # 지원 등록
-        sql = """
-        INSERT INTO applications (project_id, student_id, cover_letter)
-        VALUES (%s, %s, %s) RETURNING id
-        """
-        cursor.execute(sql, (project_id, request.user["id"], cover_letter))
+        body, status = _apply(cursor, project_id, cover_letter)
+        if key:
+            idempotency.save(cursor, request.user["id"], key, body, status)
         conn.commit()
-        application_id = cursor.fetchone()[0] # DictRow가 아닌 경우를 대비해 인덱스로 접근
 
-        return jsonify({
-            "message": "application submitted successfully",
-            "application_id": application_id
-        }), 201
+        # 새 지원은 프로젝트 인기도에 반영
+        if status == 201:
+            popularity.record_application(project_id)
+
+        return jsonify(body), status
 
     except Exception as e:
         if conn:
             conn.rollback()
-        # 중복 지원 체크
-        if "violates unique constraint" in str(e):
-            return jsonify({"message": "You have already applied to this project"}), 409
         return jsonify({"message": "Failed to submit application"}), 500
 
     finally:
@@ -78,10 +164,53 @@ def create_application():
 
 # ============================
 #   특정 프로젝트의 지원자 목록 조회 (프로젝트 작성자만 가능)
+#   GET /applications/project/<id>?status=&sort=created|match&order=desc|asc&limit=&cursor=&view=summary
 # ============================
+# 학생 기술(students.skills)과 프로젝트 요구 기술(required_skills)이 겹치는 비율(0~100).
+# 둘 다 쉼표로 구분된 문자열이므로 소문자/공백 제거 후 비교합니다.
+MATCH_SCORE_SQL = """
+CROSS JOIN LATERAL (
+    SELECT COALESCE(ROUND(100.0 * COUNT(*) FILTER (
+               WHERE req.skill = ANY(ARRAY(SELECT lower(trim(x)) FROM unnest(string_to_array(s.skills, ',')) AS x))
+           ) / NULLIF(COUNT(*), 0)), 0)::int AS match_score
+    FROM (
+        SELECT DISTINCT lower(trim(x)) AS skill FROM unnest(string_to_array(%(required_skills)s, ',')) AS x
+    ) req
+    WHERE req.skill <> ''
+) score
+"""
+
+# 정렬 기준별 키셋 정렬 식. 동률은 a.id로 구분
+APPLICATION_SORTS = {
+    "created": "a.created_at",
+    "match": "score.match_score",
+}
+
+# view=summary 는 자기소개서(cover_letter)를 빼고 목록 화면에 필요한 컬럼만 반환
+SUMMARY_COLUMNS = "a.id, a.project_id, a.student_id, a.status, a.created_at, s.name AS student_name, u.email AS student_email, score.match_score"
+DETAIL_COLUMNS = "a.*, s.name AS student_name, u.email AS student_email, s.skills AS student_skills, score.match_score"
+
+
 @applications_bp.route("/project/<int:project_id>", methods=["GET"])
 @token_required
 def get_project_applications(project_id):
+    status = request.args.get("status")
+    sort = request.args.get("sort", "created")
+    order = request.args.get("order", "desc")
+    view = request.args.get("view", "detail")
+
+    if status is not None and status not in APPLICATION_STATUSES:
+        return jsonify({"message": "invalid status"}), 400
+    if sort not in APPLICATION_SORTS or order not in ("asc", "desc") or view not in ("detail", "summary"):
+        return jsonify({"message": "invalid sort, order or view"}), 400
+    try:
+        limit = min(int(request.args.get("limit", APPLICATIONS_PAGE_SIZE)), APPLICATIONS_PAGE_MAX)
+        after = decode_cursor(request.args["cursor"], 2) if request.args.get("cursor") else None
+    except ValueError as e:
+        return jsonify({"message": f"invalid limit or cursor: {e}"}), 400
+    if limit < 1:
+        return jsonify({"message": "limit must be positive"}), 400
+
     conn = None
     cursor = None
 
@@ -89,8 +218,20 @@ def get_project_applications(project_id):
         conn = get_db()
         cursor = conn.cursor()
 
-        # 프로젝트 소유자 확인
-        cursor.execute("SELECT business_id FROM projects WHERE id = %s", (project_id,))
+        # 프로젝트 소유자 확인과 상태별 지원자 수(facet)를 한 번에 조회
+        cursor.execute("""
+            SELECT
+                p.business_id,
+                p.required_skills,
+                COUNT(a.id) AS total,
+                COUNT(a.id) FILTER (WHERE a.status = 'PENDING') AS pending,
+                COUNT(a.id) FILTER (WHERE a.status = 'ACCEPTED') AS accepted,
+                COUNT(a.id) FILTER (WHERE a.status = 'REJECTED') AS rejected
+            FROM projects p
+            LEFT JOIN applications a ON a.project_id = p.id
+            WHERE p.id = %s AND p.deleted_at IS NULL
+            GROUP BY p.id
+        """, (project_id,))
         project = cursor.fetchone()
 
         if not project:
@@ -99,27 +240,53 @@ def get_project_applications(project_id):
         if project["business_id"] != request.user["id"]:
             return jsonify({"message": "unauthorized"}), 403
 
-        # 지원자 목록 조회
-        sql = """
-        SELECT
-            a.*,
-            s.name as student_name,
-            u.email as student_email
+        sort_sql = APPLICATION_SORTS[sort]
+        direction = "DESC" if order == "desc" else "ASC"
+        params = {
+            "project_id": project_id,
+            "status": status,
+            "required_skills": project["required_skills"] or "",
+            "limit": limit + 1
+        }
+
+        # 지원자 목록 조회 (정렬 값, id) 키셋 페이지네이션
+        sql = f"""
+        SELECT {SUMMARY_COLUMNS if view == "summary" else DETAIL_COLUMNS}
         FROM applications a
         JOIN users u ON a.student_id = u.id
         JOIN students s ON u.id = s.user_id
-        WHERE a.project_id = %s
-        ORDER BY a.created_at DESC
+        {MATCH_SCORE_SQL}
+        WHERE a.project_id = %(project_id)s AND (%(status)s::varchar IS NULL OR a.status = %(status)s)
         """
-        cursor.execute(sql, (project_id,))
+        if after is not None:
+            sql += f" AND ({sort_sql}, a.id) {'<' if order == 'desc' else '>'} (%(after_value)s, %(after_id)s)"
+            params.update(after_value=after[0], after_id=after[1])
+        sql += f" ORDER BY {sort_sql} {direction}, a.id {direction} LIMIT %(limit)s"
+
+        cursor.execute(sql, params)
         applications = cursor.fetchall()
 
+        has_more = len(applications) > limit
+        applications = applications[:limit]
+        next_cursor = None
+        if has_more:
+            last = applications[-1]
+            next_cursor = encode_cursor([last["created_at"] if sort == "created" else last["match_score"], last["id"]])
+
         formatted_applications = format_records(applications)
 
         return jsonify({
             "message": "success",
             "count": len(formatted_applications),
-            "applications": formatted_applications
+            "applications": formatted_applications,
+            "facets": {
+                "total": project["total"],
+                "PENDING": project["pending"],
+                "ACCEPTED": project["accepted"],
+                "REJECTED": project["rejected"]
+            },
+            "has_more": has_more,
+            "next_cursor": next_cursor
         }), 200
 
     except Exception as e:
@@ -130,6 +297,103 @@ def get_project_applications(project_id):
             cursor.close()
 
 
+# ============================
+#   특정 프로젝트의 지원자 CSV 내보내기 (프로젝트 작성자만 가능)
+# ============================
+def _csv_cell(value):
+    """CSV 셀 값 변환. 엑셀이 수식으로 해석하지 않도록 =, +, -, @ 로 시작하는 문자열 앞에 '를 붙입니다."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+
+def _export_rows(conn, project_id, columns):
+    """
+    서버 측(named) 커서로 APPLICATIONS_EXPORT_FETCH_ROWS행씩 읽어 CSV 조각을 생성합니다.
+    지원자 수와 관계없이 메모리에는 한 묶음만 올라갑니다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 엑셀이 UTF-8로 인식하도록 BOM을 먼저 보냄
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+
+    select_sql = ", ".join(f"{EXPORT_COLUMNS[column]} AS {column}" for column in columns)
+    cursor = conn.cursor(name=f"applications_export_{project_id}", cursor_factory=psycopg2.extensions.cursor)
+    cursor.itersize = APPLICATIONS_EXPORT_FETCH_ROWS
+    try:
+        cursor.execute(f"""
+            SELECT {select_sql}
+            FROM applications a
+            JOIN users u ON a.student_id = u.id
+            JOIN students s ON u.id = s.user_id
+            WHERE a.project_id = %s
+            ORDER BY a.created_at DESC
+        """, (project_id,))
+        while True:
+            rows = cursor.fetchmany(APPLICATIONS_EXPORT_FETCH_ROWS)
+            for row in rows:
+                writer.writerow([_csv_cell(value) for value in row])
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            if len(rows) < APPLICATIONS_EXPORT_FETCH_ROWS:
+                break
+    finally:
+        cursor.close()
+        # 읽기 전용 트랜잭션 종료 (named 커서는 트랜잭션 안에서만 유지됨)
+        conn.rollback()
+
+
+@applications_bp.route("/project/<int:project_id>/export", methods=["GET"])
+@token_required
+def export_project_applications(project_id):
+    columns = list(EXPORT_COLUMNS)
+    if request.args.get("columns"):
+        columns = [column.strip() for column in request.args["columns"].split(",") if column.strip()]
+        unknown = [column for column in columns if column not in EXPORT_COLUMNS]
+        if unknown or not columns:
+            return jsonify({
+                "message": f"invalid columns: {', '.join(unknown)}",
+                "available_columns": list(EXPORT_COLUMNS)
+            }), 400
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        # 프로젝트 소유자 확인 (get_project_applications와 같음)
+        cursor.execute("SELECT business_id FROM projects WHERE id = %s AND deleted_at IS NULL", (project_id,))
+        project = cursor.fetchone()
+
+        if not project:
+            return jsonify({"message": "project not found"}), 404
+
+        if project["business_id"] != request.user["id"]:
+            return jsonify({"message": "unauthorized"}), 403
+
+    except Exception as e:
+        return jsonify({"message": "Failed to export applications"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+    filename = f"applications-{project_id}-{datetime.date.today():%Y%m%d}.csv"
+    return Response(
+        stream_with_context(_export_rows(conn, project_id, columns)),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
 # ============================
 #   내가 지원한 프로젝트 목록 조회 (학생만 가능)
 # ============================
@@ -161,7 +425,7 @@ def get_my_applications():
         JOIN projects p ON a.project_id = p.id
         LEFT JOIN users u ON p.business_id = u.id
         LEFT JOIN businesses b ON u.id = b.user_id
-        WHERE a.student_id = %s
+        WHERE a.student_id = %s AND p.deleted_at IS NULL
         ORDER BY a.created_at DESC
         """
         cursor.execute(sql, (request.user["id"],))
@@ -192,7 +456,7 @@ def update_application_status(application_id):
     data = request.get_json()
     new_status = data.get("status")
 
-    if new_status not in ["PENDING", "ACCEPTED", "REJECTED"]:
+    if new_status not in APPLICATION_STATUSES:
         return jsonify({"message": "invalid status"}), 400
 
     conn = None
@@ -204,10 +468,10 @@ def update_application_status(application_id):
 
         # 지원 정보 및 프로젝트 소유자 확인
         sql = """
-        SELECT a.*, p.business_id
+        SELECT a.*, p.business_id, p.title AS project_title
         FROM applications a
         JOIN projects p ON a.project_id = p.id
-        WHERE a.id = %s
+        WHERE a.id = %s AND p.deleted_at IS NULL
         """
         cursor.execute(sql, (application_id,))
         application = cursor.fetchone()
@@ -223,6 +487,8 @@ def update_application_status(application_id):
             "UPDATE applications SET status = %s WHERE id = %s",
             (new_status, application_id)
         )
+        if application["status"] != new_status:
+            publish_status_changes(cursor, [application], new_status)
         conn.commit()
 
         return jsonify({"message": "application status updated successfully"}), 200
@@ -235,3 +501,162 @@ def update_application_status(application_id):
     finally:
         if cursor:
             cursor.close()
+
+
+# ============================
+#   지원 상태 일괄 변경 API (프로젝트 작성자만 가능)
+# ============================
+def publish_status_changes(cursor, changes, new_status):
+    """
+    상태가 바뀐 지원서마다 학생에게 보낼 알림을 한 문장으로 outbox에 추가합니다.
+    (같은 학생의 알림은 디스패처가 이벤트 하나로 묶어 보냄)
+    changes의 각 행은 id, project_id, project_title, student_id, status(변경 전)를 가집니다.
+    """
+    notifications.publish_many(cursor, [
+        (change["student_id"], "APPLICATION_STATUS_CHANGED", {
+            "application_id": change["id"],
+            "project_id": change["project_id"],
+            "project_title": change["project_title"],
+            "old_status": change["status"],
+            "status": new_status
+        })
+        for change in changes
+    ])
+
+
+# 요청한 지원서마다 결과(updated/unchanged/forbidden/not_found)를 계산하면서
+# 소유권 확인과 상태 변경을 한 문장으로 처리합니다. {requested}는 대상 id 목록을 만드는 SELECT
+BULK_UPDATE_SQL = """
+WITH requested AS ({requested}),
+owned AS (
+    SELECT a.id, a.status AS old_status
+    FROM applications a
+    JOIN projects p ON a.project_id = p.id
+    WHERE a.id IN (SELECT id FROM requested) AND p.business_id = %(user_id)s AND p.deleted_at IS NULL
+    FOR UPDATE OF a
+),
+updated AS (
+    UPDATE applications a SET status = %(status)s
+    FROM owned o
+    WHERE a.id = o.id AND o.old_status <> %(status)s
+    RETURNING a.id, a.project_id, a.student_id, o.old_status
+)
+SELECT
+    r.id,
+    u.project_id,
+    pr.title AS project_title,
+    u.student_id,
+    u.old_status AS status,
+    CASE
+        WHEN u.id IS NOT NULL THEN 'updated'
+        WHEN o.id IS NOT NULL THEN 'unchanged'
+        WHEN EXISTS (
+            SELECT 1 FROM applications a JOIN projects p ON a.project_id = p.id
+            WHERE a.id = r.id AND p.deleted_at IS NULL
+        ) THEN 'forbidden'
+        ELSE 'not_found'
+    END AS outcome
+FROM requested r
+LEFT JOIN owned o ON o.id = r.id
+LEFT JOIN updated u ON u.id = r.id
+LEFT JOIN projects pr ON pr.id = u.project_id
+ORDER BY r.id
+"""
+
+
+def _parse_id_list(value, name):
+    """정수 id 목록 검증. 잘못되었으면 ValueError"""
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        raise ValueError(f"{name} must be a list of integers")
+    return sorted(set(value))
+
+
+@applications_bp.route("/bulk", methods=["PUT"])
+@token_required
+def update_application_status_bulk():
+    """
+    요청 형식 (둘 중 하나)
+    - {"status": "REJECTED", "ids": [1, 2, 3]}
+    - {"status": "REJECTED", "project_id": 10, "all_pending": true, "except_ids": [4, 5]}
+    """
+    data = request.get_json(silent=True) or {}
+    new_status = data.get("status")
+
+    if new_status not in APPLICATION_STATUSES:
+        return jsonify({"message": "invalid status"}), 400
+
+    try:
+        ids = _parse_id_list(data.get("ids"), "ids")
+        except_ids = _parse_id_list(data.get("except_ids"), "except_ids")
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    project_id = data.get("project_id")
+    all_pending = data.get("all_pending") is True
+    if all_pending == bool(ids):
+        return jsonify({"message": "either ids or project_id with all_pending is required"}), 400
+    if all_pending and (not isinstance(project_id, int) or isinstance(project_id, bool)):
+        return jsonify({"message": "project_id is required for all_pending"}), 400
+    if len(ids) > APPLICATIONS_BULK_MAX:
+        return jsonify({"message": f"too many applications (max {APPLICATIONS_BULK_MAX})"}), 400
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        params = {"user_id": request.user["id"], "status": new_status}
+        if all_pending:
+            # 프로젝트 소유자 확인
+            cursor.execute("SELECT business_id FROM projects WHERE id = %s AND deleted_at IS NULL", (project_id,))
+            project = cursor.fetchone()
+
+            if not project:
+                return jsonify({"message": "project not found"}), 404
+
+            if project["business_id"] != request.user["id"]:
+                return jsonify({"message": "unauthorized"}), 403
+
+            requested = """
+                SELECT id FROM applications
+                WHERE project_id = %(project_id)s AND status = 'PENDING' AND id <> ALL(%(except_ids)s::int[])
+                LIMIT %(limit)s
+            """
+            params.update(project_id=project_id, except_ids=except_ids, limit=APPLICATIONS_BULK_MAX + 1)
+        else:
+            requested = "SELECT unnest(%(ids)s::int[]) AS id"
+            params["ids"] = ids
+
+        cursor.execute(BULK_UPDATE_SQL.format(requested=requested), params)
+        results = cursor.fetchall()
+
+        if len(results) > APPLICATIONS_BULK_MAX:
+            conn.rollback()
+            return jsonify({"message": f"too many applications (max {APPLICATIONS_BULK_MAX})"}), 400
+
+        publish_status_changes(cursor, [row for row in results if row["outcome"] == "updated"], new_status)
+        conn.commit()
+
+        summary = defaultdict(int)
+        for row in results:
+            summary[row["outcome"]] += 1
+
+        return jsonify({
+            "message": "success",
+            "status": new_status,
+            "summary": dict(summary),
+            "results": [{"id": row["id"], "outcome": row["outcome"]} for row in results]
+        }), 200
+
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        return jsonify({"message": "Failed to update application statuses"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
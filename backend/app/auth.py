@@ -1,6 +1,8 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from werkzeug.security import generate_password_hash, check_password_hash
 from app.db import get_db
+from . import autocomplete
+from . import geo
 from functools import wraps
 import jwt
 import datetime
@@ -15,37 +17,63 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY must be set in environment variables")
 
+# 관리자 이메일 목록 (쉼표로 구분). 관리자는 다른 사용자의 데이터도 조회할 수 있습니다.
+ADMIN_EMAILS = {email.strip().lower() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip()}
+
 
 # ============================
 #   JWT 토큰 검증 데코레이터
 # ============================
+def verify_token():
+    """
+    Authorization 헤더의 Bearer 토큰을 검증합니다.
+    (payload, None) 또는 (None, 에러 응답) 튜플을 반환합니다.
+    """
+    token = None
+    auth_header = request.headers.get('Authorization')
+
+    if auth_header and auth_header.startswith("Bearer "):
+        try:
+            token = auth_header.split(" ")[1]
+        except IndexError:
+            return None, (jsonify({"message": "Invalid token format. It must be 'Bearer <token>'"}), 401)
+
+    if not token:
+        return None, (jsonify({"message": "Authentication token is missing"}), 401)
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    except jwt.ExpiredSignatureError:
+        return None, (jsonify({"message": "Token has expired"}), 401)
+    except jwt.InvalidTokenError:
+        return None, (jsonify({"message": "Invalid token"}), 401)
+
+    return payload, None
+
+
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-        auth_header = request.headers.get('Authorization')
+        # /batch 하위 요청은 상위 요청에서 한 번 검증한 사용자 정보를 재사용
+        batch_user = g.get("batch_user")
+        if batch_user is not None:
+            request.user = batch_user
+            return f(*args, **kwargs)
 
-        if auth_header and auth_header.startswith("Bearer "):
-            try:
-                token = auth_header.split(" ")[1]
-            except IndexError:
-                return jsonify({"message": "Invalid token format. It must be 'Bearer <token>'"}), 401
-
-        if not token:
-            return jsonify({"message": "Authentication token is missing"}), 401
-
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            request.user = payload  # 요청 객체에 사용자 정보 추가
-        except jwt.ExpiredSignatureError:
-            return jsonify({"message": "Token has expired"}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({"message": "Invalid token"}), 401
+        payload, error = verify_token()
+        if error:
+            return error
 
+        request.user = payload  # 요청 객체에 사용자 정보 추가
         return f(*args, **kwargs)
     return decorated
 
 
+def is_admin(user):
+    """토큰 사용자(request.user)가 ADMIN_EMAILS에 포함된 관리자인지 확인"""
+    return bool(user) and (user.get("email") or "").lower() in ADMIN_EMAILS
+
+
 # ============================
 #   회원가입 API
 # ============================
@@ -95,13 +123,19 @@ def signup():
             cursor.execute(sql_student, (user_id, name))
 
         elif role == "BUSINESS":
+            # 주소를 지명 사전으로 지오코딩해 반경 검색에 사용 (찾지 못하면 NULL)
             sql_business = """
-            INSERT INTO businesses (user_id, business_name, address)
-            VALUES (%s, %s, %s)
+            INSERT INTO businesses (user_id, business_name, address, latitude, longitude)
+            VALUES (%s, %s, %s, %s, %s)
             """
-            cursor.execute(sql_business, (user_id, business_name, address))
+            cursor.execute(sql_business, (user_id, business_name, address, *(geo.geocode(address) or (None, None))))
 
         conn.commit()
+
+        # 사장님 주소를 지역 자동완성에 반영
+        if role == "BUSINESS":
+            autocomplete.add_location(address)
+
         return jsonify({"message": "success"}), 201
 
     except Exception as e:
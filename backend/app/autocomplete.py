@@ -0,0 +1,304 @@
+"""
+기술/지역 자동완성
+projects.required_skills, students.skills(기술)와 projects.location, businesses.address(지역)에서 모은 단어를
+메모리의 접두어 트라이에 올려 두고, 요청은 DB 없이 트라이만 따라가 답합니다.
+
+- 한글은 자모 단위로 분해해 저장하므로 입력 중인 글자도 일치합니다. ("강ㄴ", "가" -> "강남구", "간" -> "가나")
+  겹받침/이중모음도 나눠 두어 IME 조합 중간 상태("달ㄱ" -> "닭")도 찾습니다.
+- 자음만 입력하면 초성 검색으로 처리합니다. ("ㄱㄴ" -> "강남구")
+- 트라이의 각 노드는 빈도가 높은 단어 AUTOCOMPLETE_TOP_K개를 미리 들고 있어, 조회 비용은 입력 길이에만 비례합니다.
+
+프로젝트/프로필 수정 API가 커밋 후 add_*()로 빈도를 바로 올리고, 백그라운드 작업이
+AUTOCOMPLETE_REFRESH_INTERVAL초마다 DB에서 새로 만들어 교체합니다. (수정/삭제로 줄어든 빈도 반영)
+인덱스는 백그라운드 작업만 만들고(AUTOCOMPLETE_BUILD_BATCH행마다 다른 작업에 양보), 요청은 올라온 인덱스만 읽습니다.
+서버 시작 직후 아직 올라오지 않았으면 503을 반환합니다.
+"""
+from flask import Blueprint, request, jsonify
+from collections import Counter, defaultdict
+import logging
+import os
+import re
+import threading
+import unicodedata
+import psycopg2
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+autocomplete_bp = Blueprint("autocomplete", __name__)
+
+# 노드마다 미리 들고 있는 후보 수(= 요청할 수 있는 최대 개수)와 기본 응답 개수
+AUTOCOMPLETE_TOP_K = int(os.getenv("AUTOCOMPLETE_TOP_K", "10"))
+AUTOCOMPLETE_DEFAULT_LIMIT = int(os.getenv("AUTOCOMPLETE_DEFAULT_LIMIT", "8"))
+# DB에서 새로 만드는 주기(초, 0이면 서버 시작 시 한 번만 만듦)
+AUTOCOMPLETE_REFRESH_INTERVAL = float(os.getenv("AUTOCOMPLETE_REFRESH_INTERVAL", "300"))
+# 인덱스를 만들 때 이 행 수를 처리할 때마다 다른 작업(요청, 소켓)에 양보
+AUTOCOMPLETE_BUILD_BATCH = int(os.getenv("AUTOCOMPLETE_BUILD_BATCH", "1000"))
+MAX_QUERY_LENGTH = 50
+
+# ==================================================
+#   한글 자모 분해
+# ==================================================
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 겹받침/이중모음은 두 번에 나눠 입력되므로 나눠서 비교
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+CONSONANTS = set(CHOSEONG) | {"ㄳ", "ㄵ", "ㄶ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅄ"}
+
+
+def normalize(text):
+    """비교용 키: NFC 정규화, 소문자, 연속 공백 하나로"""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text or "")).strip().lower()
+
+
+def to_jamo(text):
+    """완성형 한글을 (겹자모를 나눈) 호환 자모열로 분해. 한글이 아닌 글자는 그대로"""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            jamo = CHOSEONG[index // 588] + JUNGSEONG[(index % 588) // 28] + JONGSEONG[index % 28]
+        else:
+            jamo = ch
+        result.append("".join(COMPOUND_JAMO.get(j, j) for j in jamo))
+    return "".join(result)
+
+
+def to_choseong(text):
+    """완성형 한글의 초성만 남긴 문자열 (한글이 아닌 글자는 그대로)"""
+    return "".join(
+        CHOSEONG[(ord(ch) - HANGUL_BASE) // 588] if HANGUL_BASE <= ord(ch) <= HANGUL_LAST else ch
+        for ch in text
+    )
+
+
+def is_choseong_query(query):
+    return len(query) >= 2 and all(ch in CONSONANTS or ch == " " for ch in query)
+
+
+# ==================================================
+#   빈도 순위를 들고 있는 접두어 트라이
+# ==================================================
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.top = []
+
+
+class PrefixIndex:
+    """단어별 빈도를 관리하고, 자모 접두어/초성 접두어로 빈도 상위 단어를 찾습니다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.display = {}
+        self.root = _Node()
+        self.choseong_root = _Node()
+
+    def _insert(self, root, path, key):
+        """경로의 모든 노드에서 key의 순위를 갱신 (빈도는 늘어나기만 하므로 상위 목록에 넣거나 재정렬만 하면 됨)"""
+        count = self.counts[key]
+        node = root
+        for ch in [""] + list(path):
+            if ch:
+                node = node.children.setdefault(ch, _Node())
+            top = node.top
+            if key in top:
+                top.sort(key=lambda k: (-self.counts[k], k))
+            elif len(top) < AUTOCOMPLETE_TOP_K or count > self.counts[top[-1]]:
+                top.append(key)
+                top.sort(key=lambda k: (-self.counts[k], k))
+                del top[AUTOCOMPLETE_TOP_K:]
+
+    def add(self, term, count=1):
+        key = normalize(term)
+        if not key:
+            return
+        with self.lock:
+            self.display.setdefault(key, re.sub(r"\s+", " ", term.strip()))
+            self.counts[key] += count
+            self._insert(self.root, to_jamo(key), key)
+            choseong = to_choseong(key)
+            if choseong != key:
+                self._insert(self.choseong_root, choseong, key)
+
+    def search(self, query, limit):
+        """[(표시 문자열, 빈도)]를 빈도 높은 순으로 반환"""
+        query = normalize(query)
+        root, path = (self.choseong_root, query) if is_choseong_query(query) else (self.root, to_jamo(query))
+        with self.lock:
+            node = root
+            for ch in path:
+                node = node.children.get(ch)
+                if node is None:
+                    return []
+            return [(self.display[key], self.counts[key]) for key in node.top[:limit]]
+
+
+# ==================================================
+#   원본 데이터에서 단어 추출
+# ==================================================
+def split_skills(skills):
+    """쉼표로 구분된 기술 문자열을 기술 목록으로 (한 문자열 안의 중복은 한 번만)"""
+    seen = {}
+    for skill in (skills or "").split(","):
+        skill = skill.strip()
+        if skill and normalize(skill) not in seen:
+            seen[normalize(skill)] = skill
+    return list(seen.values())
+
+
+def location_terms(location):
+    """'서울 강남구 테헤란로 1' -> ['서울', '서울 강남구', '강남구'] (시/도, 시/도 + 구/군, 구/군만 입력하는 경우)"""
+    parts = (location or "").split()
+    return [" ".join(parts[:n]) for n in (1, 2) if len(parts) >= n] + parts[1:2]
+
+
+SOURCES = {
+    "skills": ("""
+        SELECT required_skills FROM projects WHERE deleted_at IS NULL AND required_skills IS NOT NULL
+        UNION ALL
+        SELECT skills FROM students WHERE skills IS NOT NULL
+    """, split_skills),
+    "locations": ("""
+        SELECT location FROM projects WHERE deleted_at IS NULL AND location IS NOT NULL
+        UNION ALL
+        SELECT address FROM businesses WHERE address IS NOT NULL
+    """, location_terms),
+}
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def build_index(conn, name, pause=None):
+    """DB에서 인덱스를 새로 만듭니다. pause가 있으면 AUTOCOMPLETE_BUILD_BATCH행(단어)마다 호출"""
+    sql, extract = SOURCES[name]
+    counts = Counter()
+    forms = defaultdict(Counter)
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    while True:
+        rows = cursor.fetchmany(AUTOCOMPLETE_BUILD_BATCH)
+        if not rows:
+            break
+        for (value,) in rows:
+            for term in extract(value):
+                key = normalize(term)
+                counts[key] += 1
+                forms[key][term] += 1
+        if pause:
+            pause()
+    cursor.close()
+    conn.rollback()
+
+    index = PrefixIndex()
+    # 빈도 높은 단어부터 넣으면 노드 상위 목록이 거의 재정렬되지 않음
+    for i, (key, count) in enumerate(counts.most_common(), 1):
+        index.add(forms[key].most_common(1)[0][0], count)
+        if pause and i % AUTOCOMPLETE_BUILD_BATCH == 0:
+            pause()
+    return index
+
+
+def rebuild_all(database_url, pause=None):
+    """DB에서 모든 자동완성 인덱스를 새로 만들어 교체 (다 만든 뒤 잠금 안에서 바꿔 끼움)"""
+    conn = psycopg2.connect(database_url)
+    try:
+        for name in SOURCES:
+            index = build_index(conn, name, pause)
+            with _indexes_lock:
+                _indexes[name] = index
+    finally:
+        conn.close()
+
+
+def get_index(name):
+    """올라온 인덱스. 아직 백그라운드 작업이 만들지 않았으면 None (요청에서는 DB를 읽지 않음)"""
+    with _indexes_lock:
+        return _indexes.get(name)
+
+
+def add_skills(skills):
+    """프로젝트/프로필 저장 후 호출. 인덱스가 올라와 있을 때만 빈도를 올림"""
+    index = _indexes.get("skills")
+    if index is not None:
+        for skill in split_skills(skills):
+            index.add(skill)
+
+
+def add_location(location):
+    index = _indexes.get("locations")
+    if index is not None:
+        for term in location_terms(location):
+            index.add(term)
+
+
+def start_refresh(socketio):
+    """인덱스를 만들고 AUTOCOMPLETE_REFRESH_INTERVAL초마다 DB에서 새로 만드는 백그라운드 작업 시작 (0이면 처음 한 번만)"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        return
+
+    def loop():
+        while True:
+            try:
+                rebuild_all(database_url, lambda: socketio.sleep(0))
+            except Exception:
+                logger.exception("autocomplete rebuild failed")
+            if AUTOCOMPLETE_REFRESH_INTERVAL <= 0:
+                return
+            socketio.sleep(AUTOCOMPLETE_REFRESH_INTERVAL)
+
+    socketio.start_background_task(loop)
+
+
+# ==================================================
+#   자동완성 API (GET /autocomplete/skills?q=, GET /autocomplete/locations?q=)
+# ==================================================
+def _suggest(name):
+    query = request.args.get("q", "")[:MAX_QUERY_LENGTH]
+    try:
+        limit = min(int(request.args.get("limit", AUTOCOMPLETE_DEFAULT_LIMIT)), AUTOCOMPLETE_TOP_K)
+    except ValueError:
+        return jsonify({"message": "limit must be an integer"}), 400
+    if limit < 1:
+        return jsonify({"message": "limit must be positive"}), 400
+
+    index = get_index(name)
+    if index is None:
+        return jsonify({"message": "Autocomplete index is not ready yet"}), 503
+
+    try:
+        suggestions = index.search(query, limit)
+    except Exception as e:
+        logger.exception("autocomplete failed")
+        return jsonify({"message": "Failed to fetch suggestions"}), 500
+
+    return jsonify({
+        "message": "success",
+        "suggestions": [{"value": value, "count": count} for value, count in suggestions]
+    }), 200
+
+
+@autocomplete_bp.route("/skills", methods=["GET"])
+def autocomplete_skills():
+    return _suggest("skills")
+
+
+@autocomplete_bp.route("/locations", methods=["GET"])
+def autocomplete_locations():
+    return _suggest("locations")
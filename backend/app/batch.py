@@ -0,0 +1,94 @@
+from flask import Blueprint, request, jsonify, current_app, g
+from psycopg2.extensions import TRANSACTION_STATUS_INERROR
+from .auth import verify_token
+import os
+import traceback
+from dotenv import load_dotenv
+
+load_dotenv()
+
+batch_bp = Blueprint("batch", __name__)
+
+# 한 번의 배치 요청에 포함할 수 있는 최대 하위 요청 수
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+
+ALLOWED_METHODS = ["GET", "POST", "PUT", "DELETE"]
+
+
+def _dispatch(method, path, body, headers):
+    """
+    하위 요청 하나를 현재 앱 컨텍스트 안에서 실행합니다.
+    앱 컨텍스트(g)를 공유하므로 get_db()의 연결과 검증된 사용자 정보가 재사용됩니다.
+    """
+    with current_app.test_request_context(path, method=method, json=body, headers=headers):
+        try:
+            response = current_app.full_dispatch_request()
+        except Exception:
+            print(f"Error in batch sub-request {method} {path}:")
+            traceback.print_exc()
+            return 500, {"message": "Internal server error"}
+
+    # 실패한 하위 요청이 트랜잭션을 오류 상태로 남기면 다음 요청을 위해 롤백
+    conn = g.get("db")
+    if conn is not None and conn.get_transaction_status() == TRANSACTION_STATUS_INERROR:
+        conn.rollback()
+
+    return response.status_code, response.get_json(silent=True)
+
+
+# ==================================================
+#   배치 요청 API (POST /batch)
+# ==================================================
+@batch_bp.route("", methods=["POST"])
+def run_batch():
+    """
+    여러 API 요청을 한 번의 HTTP 요청으로 처리합니다.
+    요청 형식: {"requests": [{"id": "profile", "method": "GET", "path": "/profiles/my", "body": {...}}, ...]}
+    각 하위 요청의 결과는 요청 순서대로 status와 body를 담아 반환됩니다.
+    """
+    data = request.get_json(silent=True) or {}
+    sub_requests = data.get("requests")
+
+    if not isinstance(sub_requests, list) or not sub_requests:
+        return jsonify({"message": "requests must be a non-empty list"}), 400
+
+    if len(sub_requests) > BATCH_MAX_REQUESTS:
+        return jsonify({"message": f"too many requests (max {BATCH_MAX_REQUESTS})"}), 400
+
+    # 토큰이 있으면 배치 전체에서 한 번만 검증
+    headers = {}
+    auth_header = request.headers.get("Authorization")
+    if auth_header:
+        payload, error = verify_token()
+        if error:
+            return error
+        g.batch_user = payload
+        headers["Authorization"] = auth_header
+
+    responses = []
+    try:
+        for index, item in enumerate(sub_requests):
+            item = item if isinstance(item, dict) else {}
+            item_id = item.get("id", index)
+            method = str(item.get("method", "GET")).upper()
+            path = item.get("path")
+
+            if method not in ALLOWED_METHODS:
+                responses.append({"id": item_id, "status": 400, "body": {"message": "invalid method"}})
+                continue
+
+            # 배치 안에서 다시 배치를 호출하는 것은 허용하지 않음
+            if not isinstance(path, str) or not path.startswith("/") or path.split("?")[0].rstrip("/") == "/batch":
+                responses.append({"id": item_id, "status": 400, "body": {"message": "invalid path"}})
+                continue
+
+            status, body = _dispatch(method, path, item.get("body"), headers)
+            responses.append({"id": item_id, "status": status, "body": body})
+    finally:
+        g.pop("batch_user", None)
+
+    return jsonify({
+        "message": "success",
+        "count": len(responses),
+        "responses": responses
+    }), 200
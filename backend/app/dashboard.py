@@ -0,0 +1,180 @@
+from flask import Blueprint, request, jsonify
+from app.db import get_db
+from .auth import token_required
+from .utils import format_records # 데이터 포맷팅 유틸리티 가져오기
+from .messages import fetch_chat_rooms
+import os
+import traceback
+from dotenv import load_dotenv
+
+load_dotenv()
+
+dashboard_bp = Blueprint("dashboard", __name__)
+
+SECRET_KEY = os.getenv("SECRET_KEY")
+if not SECRET_KEY:
+    raise ValueError("SECRET_KEY must be set in environment variables")
+
+# 프로필 완성도 계산에 사용하는 항목
+PROFILE_FIELDS = ["introduction", "skills", "portfolio_url", "github_url", "linkedin_url"]
+
+
+def _int_arg(name, default, maximum):
+    """쿼리 파라미터를 1 ~ maximum 범위의 정수로 읽습니다."""
+    try:
+        value = int(request.args.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(1, min(value, maximum))
+
+
+def _business_dashboard(cursor, user_id):
+    """
+    사장님 대시보드: 프로젝트별 상태별 지원자 수와 최근 지원자 K명.
+    프로젝트 수와 관계없이 쿼리 2번으로 처리합니다.
+    """
+    recent = _int_arg("recent", 3, 20)
+
+    cursor.execute("""
+        SELECT
+            p.id,
+            p.title,
+            p.status,
+            p.location,
+            p.created_at,
+            COUNT(a.id) AS application_count,
+            COUNT(a.id) FILTER (WHERE a.status = 'PENDING') AS pending_count,
+            COUNT(a.id) FILTER (WHERE a.status = 'ACCEPTED') AS accepted_count,
+            COUNT(a.id) FILTER (WHERE a.status = 'REJECTED') AS rejected_count
+        FROM projects p
+        LEFT JOIN applications a ON p.id = a.project_id
+        WHERE p.business_id = %s AND p.deleted_at IS NULL
+        GROUP BY p.id
+        ORDER BY p.created_at DESC
+    """, (user_id,))
+    projects = format_records(cursor.fetchall())
+
+    # 프로젝트별 최근 지원자 K명 (커버레터 제외)
+    cursor.execute("""
+        SELECT id, project_id, student_id, status, created_at, student_name, student_email
+        FROM (
+            SELECT
+                a.id,
+                a.project_id,
+                a.student_id,
+                a.status,
+                a.created_at,
+                s.name as student_name,
+                u.email as student_email,
+                ROW_NUMBER() OVER (PARTITION BY a.project_id ORDER BY a.created_at DESC, a.id DESC) AS rn
+            FROM applications a
+            JOIN projects p ON a.project_id = p.id
+            JOIN users u ON a.student_id = u.id
+            JOIN students s ON u.id = s.user_id
+            WHERE p.business_id = %s AND p.deleted_at IS NULL
+        ) ranked
+        WHERE rn <= %s
+        ORDER BY project_id, rn
+    """, (user_id, recent))
+
+    recent_by_project = {}
+    for application in format_records(cursor.fetchall()):
+        recent_by_project.setdefault(application["project_id"], []).append(application)
+
+    for project in projects:
+        project["recent_applications"] = recent_by_project.get(project["id"], [])
+
+    return {
+        "project_count": len(projects),
+        "projects": projects
+    }
+
+
+def _student_dashboard(cursor, user):
+    """
+    학생 대시보드: 프로필 완성도, 지원 현황(프로젝트 정보 포함), 최근 채팅방.
+    쿼리 4번으로 처리합니다.
+    """
+    rooms_limit = _int_arg("rooms", 5, 50)
+
+    cursor.execute("""
+        SELECT
+            s.*,
+            u.email
+        FROM students s
+        JOIN users u ON s.user_id = u.id
+        WHERE s.user_id = %s
+    """, (user["id"],))
+    profile = cursor.fetchone()
+
+    completeness = None
+    if profile:
+        missing = [field for field in PROFILE_FIELDS if not profile[field]]
+        completeness = {
+            "percent": round(100 * (len(PROFILE_FIELDS) - len(missing)) / len(PROFILE_FIELDS)),
+            "missing_fields": missing
+        }
+
+    cursor.execute("""
+        SELECT
+            a.*,
+            p.title as project_title,
+            p.salary,
+            p.location,
+            p.status as project_status,
+            b.business_name,
+            u.email as business_email
+        FROM applications a
+        JOIN projects p ON a.project_id = p.id
+        LEFT JOIN users u ON p.business_id = u.id
+        LEFT JOIN businesses b ON u.id = b.user_id
+        WHERE a.student_id = %s AND p.deleted_at IS NULL
+        ORDER BY a.created_at DESC
+    """, (user["id"],))
+    applications = format_records(cursor.fetchall())
+
+    return {
+        "profile": format_records([profile])[0] if profile else None,
+        "profile_completeness": completeness,
+        "application_count": len(applications),
+        "applications": applications,
+        "recent_rooms": fetch_chat_rooms(cursor, user.get("id"), user.get("email"), limit=rooms_limit)
+    }
+
+
+# ============================
+#   마이페이지 대시보드 API (GET /dashboard)
+# ============================
+@dashboard_bp.route("", methods=["GET"])
+@token_required
+def get_dashboard():
+    role = request.user.get("role")
+    if role not in ["STUDENT", "BUSINESS"]:
+        return jsonify({"message": "invalid role"}), 403
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        if role == "BUSINESS":
+            dashboard = _business_dashboard(cursor, request.user["id"])
+        else:
+            dashboard = _student_dashboard(cursor, request.user)
+
+        return jsonify({
+            "message": "success",
+            "role": role,
+            "dashboard": dashboard
+        }), 200
+
+    except Exception as e:
+        print(f"Error in get_dashboard for user {request.user.get('id')}:")
+        traceback.print_exc()
+        return jsonify({"message": "Failed to fetch dashboard"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
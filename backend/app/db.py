@@ -3,6 +3,9 @@ from dotenv import load_dotenv
 import psycopg2
 from flask import g
 from psycopg2.extras import DictCursor
+from . import query_stats
+from . import metrics
+import time
 
 load_dotenv()  # .env 파일 불러오기
 
@@ -16,8 +19,14 @@ def get_db():
         database_url = os.getenv("DATABASE_URL")
         if not database_url:
             raise ValueError("DATABASE_URL must be set in environment variables for PostgreSQL")
+        # 쿼리 통계가 켜져 있으면 실행 시간을 기록하는 연결을 사용합니다.
+        connection_factory = query_stats.InstrumentedConnection if query_stats.is_enabled() else None
         # 연결 시 cursor_factory를 한 번만 설정합니다.
-        g.db = psycopg2.connect(database_url, cursor_factory=DictCursor)
+        started = time.perf_counter()
+        g.db = psycopg2.connect(database_url, cursor_factory=DictCursor, connection_factory=connection_factory)
+        metrics.DB_CONNECT_LATENCY.observe(time.perf_counter() - started)
+        metrics.DB_CONNECTIONS_OPENED.inc()
+        metrics.DB_CONNECTIONS_OPEN.inc()
     return g.db
 
 def close_db(e=None):
@@ -27,3 +36,4 @@ def close_db(e=None):
     db = g.pop('db', None)
     if db is not None:
         db.close()
+        metrics.DB_CONNECTIONS_OPEN.dec()
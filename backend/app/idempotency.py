@@ -0,0 +1,109 @@
+"""
+Idempotency-Key 헤더 처리
+같은 사용자가 같은 키로 다시 보낸 요청은 처리하지 않고 처음 응답을 그대로 돌려줍니다. (더블 클릭, 네트워크 재시도)
+
+키 행은 처리 결과와 같은 트랜잭션에서 INSERT되므로, 같은 키로 동시에 들어온 요청은 UNIQUE 인덱스에서
+앞선 요청의 커밋을 기다린 뒤 저장된 응답을 읽습니다. 처리 중 오류로 롤백되면 키도 남지 않아 다시 시도할 수 있습니다.
+IDEMPOTENCY_KEY_TTL_HOURS가 지난 키는 만료된 것으로 보고 백그라운드 작업이 정리합니다.
+"""
+from flask import request, jsonify
+import hashlib
+import json
+import logging
+import os
+import psycopg2
+from psycopg2.extras import Json
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# 저장된 응답을 재사용하는 기간(시간)과 만료된 키를 정리하는 주기(초, 0이면 끔)
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+IDEMPOTENCY_CLEANUP_INTERVAL = float(os.getenv("IDEMPOTENCY_CLEANUP_INTERVAL", "3600"))
+MAX_KEY_LENGTH = 255
+
+
+def request_key():
+    """요청의 Idempotency-Key 헤더 값. 없으면 None, 너무 길면 ValueError"""
+    key = (request.headers.get(IDEMPOTENCY_HEADER) or "").strip()
+    if not key:
+        return None
+    if len(key) > MAX_KEY_LENGTH:
+        raise ValueError(f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters")
+    return key
+
+
+def _request_hash(body):
+    return hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def begin(cursor, user_id, key, endpoint, body):
+    """
+    키를 등록합니다. 처음 보는 키면 None을 반환하고, 호출한 쪽은 요청을 처리한 뒤 같은 트랜잭션에서 save()를 호출합니다.
+    이미 처리된 키면 그때의 응답(Flask 응답 튜플)을 반환합니다.
+    """
+    request_hash = _request_hash(body)
+    cursor.execute("""
+        DELETE FROM idempotency_keys
+        WHERE user_id = %s AND key = %s AND created_at < CURRENT_TIMESTAMP - make_interval(hours => %s)
+    """, (user_id, key, IDEMPOTENCY_KEY_TTL_HOURS))
+    cursor.execute("""
+        INSERT INTO idempotency_keys (user_id, key, endpoint, request_hash) VALUES (%s, %s, %s, %s)
+        ON CONFLICT (user_id, key) DO NOTHING
+    """, (user_id, key, endpoint, request_hash))
+    if cursor.rowcount == 1:
+        return None
+
+    cursor.execute("""
+        SELECT endpoint, request_hash, response_status, response_body FROM idempotency_keys
+        WHERE user_id = %s AND key = %s
+    """, (user_id, key))
+    stored = cursor.fetchone()
+    if stored["endpoint"] != endpoint or stored["request_hash"] != request_hash:
+        return jsonify({"message": f"{IDEMPOTENCY_HEADER} was already used with a different request"}), 422
+
+    response = jsonify(stored["response_body"])
+    response.headers["Idempotent-Replayed"] = "true"
+    return response, stored["response_status"]
+
+
+def save(cursor, user_id, key, body, status):
+    """begin()으로 등록한 키에 응답을 기록 (호출한 쪽 트랜잭션과 함께 커밋)"""
+    cursor.execute("""
+        UPDATE idempotency_keys SET response_status = %s, response_body = %s WHERE user_id = %s AND key = %s
+    """, (status, Json(body), user_id, key))
+
+
+def delete_expired(database_url):
+    """만료된 키를 삭제하고 삭제한 수를 반환"""
+    conn = psycopg2.connect(database_url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            DELETE FROM idempotency_keys WHERE created_at < CURRENT_TIMESTAMP - make_interval(hours => %s)
+        """, (IDEMPOTENCY_KEY_TTL_HOURS,))
+        deleted = cursor.rowcount
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
+def start_cleanup(socketio):
+    """IDEMPOTENCY_CLEANUP_INTERVAL초마다 만료된 키를 정리하는 백그라운드 작업 시작"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or IDEMPOTENCY_CLEANUP_INTERVAL <= 0:
+        return
+
+    def loop():
+        while True:
+            try:
+                delete_expired(database_url)
+            except Exception:
+                logger.exception("idempotency key cleanup failed")
+            socketio.sleep(IDEMPOTENCY_CLEANUP_INTERVAL)
+
+    socketio.start_background_task(loop)
@@ -0,0 +1,345 @@
+"""
+messages 월별 파티션 관리와 콜드 아카이브
+- ensure_partitions: 이번 달부터 MESSAGE_PARTITION_MONTHS_AHEAD개월 뒤까지 파티션을 미리 생성
+- archive_expired: MESSAGE_RETENTION_MONTHS보다 오래된 파티션을 분리(DETACH)해 채팅방별 gzip JSON Lines 파일로 내보낸 뒤 삭제
+- read_archived: get_messages가 DB에 남은 메시지보다 이전 페이지를 요청하면 아카이브 파일에서 읽음
+
+서버(main.py)가 MESSAGE_MAINTENANCE_INTERVAL초마다 백그라운드로 실행하며, 직접 한 번 실행할 수도 있습니다.
+    python -m app.message_archive
+"""
+import datetime
+import gzip
+import json
+import logging
+import os
+import re
+import sys
+import psycopg2
+from psycopg2.extras import execute_values
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 현재 달 이후로 미리 만들어 둘 파티션 수
+MESSAGE_PARTITION_MONTHS_AHEAD = int(os.getenv("MESSAGE_PARTITION_MONTHS_AHEAD", "3"))
+# DB에 보관할 개월 수 (이번 달 포함). 0이면 아카이브하지 않음
+MESSAGE_RETENTION_MONTHS = int(os.getenv("MESSAGE_RETENTION_MONTHS", "0"))
+MESSAGE_ARCHIVE_DIR = os.getenv("MESSAGE_ARCHIVE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "message_archive"))
+# 백그라운드 관리 작업 주기(초)
+MESSAGE_MAINTENANCE_INTERVAL = int(os.getenv("MESSAGE_MAINTENANCE_INTERVAL", "21600"))
+
+# 여러 서버 프로세스가 동시에 관리 작업을 하지 않도록 잡는 advisory lock 키
+MAINTENANCE_LOCK_KEY = 38_001
+
+PARTITION_NAME_RE = re.compile(r"^messages_(\d{4})_(\d{2})$")
+PARTITION_BOUND_RE = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"messages_{month:%Y_%m}"
+
+
+def list_partitions(cursor):
+    """[(이름, 시작, 끝)] - DEFAULT 파티션은 시작/끝이 None"""
+    cursor.execute("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'messages'::regclass
+        ORDER BY c.relname
+    """)
+    partitions = []
+    for name, bound in cursor.fetchall():
+        match = PARTITION_BOUND_RE.search(bound)
+        if match:
+            lower, upper = (datetime.datetime.fromisoformat(value).date() for value in match.groups())
+        else:
+            lower = upper = None
+        partitions.append((name, lower, upper))
+    return partitions
+
+
+# ==================================================
+#   파티션 생성
+# ==================================================
+def create_partition(conn, month):
+    """
+    month 파티션을 만듭니다.
+    DEFAULT 파티션에 이미 그 달의 행이 있으면 바로 PARTITION OF로 만들 수 없으므로,
+    별도 테이블에 행을 옮긴 뒤 ATTACH합니다. (한 트랜잭션)
+    """
+    name = partition_name(month)
+    upper = add_months(month, 1)
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM messages_default WHERE created_at >= %s AND created_at < %s)",
+        (month, upper)
+    )
+    if not cursor.fetchone()[0]:
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF messages FOR VALUES FROM ('{month}') TO ('{upper}')")
+    else:
+        cursor.execute(f"CREATE TABLE {name} (LIKE messages INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        cursor.execute(f"""
+            WITH moved AS (
+                DELETE FROM messages_default WHERE created_at >= %s AND created_at < %s RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+        """, (month, upper))
+        logger.info(f"{cursor.rowcount} rows moved from messages_default to {name}")
+        cursor.execute(f"ALTER TABLE messages ATTACH PARTITION {name} FOR VALUES FROM ('{month}') TO ('{upper}')")
+    conn.commit()
+    cursor.close()
+
+
+def ensure_partitions(conn, start=None, months_ahead=None):
+    """
+    start가 속한 달(기본: 이번 달)부터 months_ahead개월 뒤까지 없는 파티션을 만들고 만든 이름 목록을 반환합니다.
+    DEFAULT 파티션에 들어간 행이 있으면 그 달부터 만들어 월별 파티션으로 옮깁니다.
+    """
+    months_ahead = MESSAGE_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    cursor = conn.cursor()
+    existing = {lower for _, lower, _ in list_partitions(cursor) if lower}
+    cursor.execute("SELECT MIN(created_at) FROM messages_default")
+    oldest_default = cursor.fetchone()[0]
+    conn.commit()
+    cursor.close()
+
+    created = []
+    month = month_start(start or datetime.date.today())
+    if oldest_default and oldest_default.date() < month:
+        month = month_start(oldest_default)
+    last = add_months(month_start(datetime.date.today()), months_ahead)
+    while month <= last:
+        if month not in existing:
+            create_partition(conn, month)
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+# ==================================================
+#   아카이브
+# ==================================================
+def archive_path(room_id, month):
+    """MESSAGE_ARCHIVE_DIR 기준 상대 경로"""
+    return os.path.join(str(room_id), f"{month:%Y-%m}.jsonl.gz")
+
+
+def _write_room_archive(archive_dir, room_id, month, rows):
+    relative = archive_path(room_id, month)
+    path = os.path.join(archive_dir, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 임시 파일에 쓴 뒤 이름을 바꿔, 중간에 실패해도 불완전한 파일이 남지 않게 함
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+    return (room_id, month, relative, len(rows), rows[0]["id"], rows[-1]["id"])
+
+
+def export_partition(conn, table, month, archive_dir, pause=None):
+    """
+    분리된 파티션 테이블을 채팅방별 파일로 내보내고 message_archives에 기록. 내보낸 행 수를 반환
+    pause가 있으면 채팅방 파일 하나를 쓸 때마다, 그리고 itersize행마다 호출 (eventlet 워커 하나를 오래 붙잡지 않도록)
+    """
+    # 서버 측 커서로 채팅방 순서대로 읽어 한 채팅방씩 파일에 씀 (파티션 전체를 메모리에 올리지 않음)
+    reader = conn.cursor(name=f"export_{table}")
+    reader.itersize = 5000
+    reader.execute(f"""
+        SELECT m.id, m.room_id, m.sender_id, u.email, m.message, m.is_read, m.created_at
+        FROM {table} m
+        LEFT JOIN users u ON u.id = m.sender_id
+        ORDER BY m.room_id, m.id
+    """)
+
+    archives = []
+    room_id, rows, total = None, [], 0
+    for message_id, message_room_id, sender_id, sender, message, is_read, created_at in reader:
+        if message_room_id != room_id and rows:
+            archives.append(_write_room_archive(archive_dir, room_id, month, rows))
+            rows = []
+            if pause:
+                pause()
+        room_id = message_room_id
+        rows.append({
+            "id": message_id,
+            "sender_id": sender_id,
+            "sender": sender,
+            "message": message,
+            "is_read": is_read,
+            "created_at": created_at.isoformat()
+        })
+        total += 1
+        if pause and total % reader.itersize == 0:
+            pause()
+    if rows:
+        archives.append(_write_room_archive(archive_dir, room_id, month, rows))
+    reader.close()
+
+    cursor = conn.cursor()
+    if archives:
+        execute_values(cursor, """
+            INSERT INTO message_archives (room_id, month, path, message_count, min_id, max_id) VALUES %s
+            ON CONFLICT (room_id, month) DO UPDATE
+            SET path = EXCLUDED.path, message_count = EXCLUDED.message_count,
+                min_id = EXCLUDED.min_id, max_id = EXCLUDED.max_id, archived_at = CURRENT_TIMESTAMP
+        """, archives)
+    cursor.execute(f"DROP TABLE {table}")
+    conn.commit()
+    cursor.close()
+    return total
+
+
+def archive_expired(conn, retention_months=None, archive_dir=None, pause=None):
+    """
+    보존 기간이 지난 파티션을 분리해 파일로 내보냅니다. [(파티션, 행 수)]를 반환합니다.
+    분리한 뒤에는 messages와 별개 테이블이므로 내보내는 동안 채팅 읽기/쓰기를 막지 않습니다.
+    """
+    retention_months = MESSAGE_RETENTION_MONTHS if retention_months is None else retention_months
+    archive_dir = archive_dir or MESSAGE_ARCHIVE_DIR
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(datetime.date.today()), -(retention_months - 1))
+
+    cursor = conn.cursor()
+    expired = [(name, lower) for name, lower, upper in list_partitions(cursor) if upper and upper <= cutoff]
+    # 이전 실행에서 분리만 하고 내보내기 전에 중단된 테이블
+    cursor.execute("""
+        SELECT c.relname FROM pg_class c
+        WHERE c.relkind = 'r' AND c.relname ~ '^messages_[0-9]{4}_[0-9]{2}$'
+          AND c.relnamespace = current_schema()::regnamespace AND NOT c.relispartition
+    """)
+    leftovers = [row[0] for row in cursor.fetchall()]
+    conn.commit()
+    cursor.close()
+
+    # DEFAULT 파티션이 있으면 DETACH ... CONCURRENTLY를 쓸 수 없으므로 일반 DETACH를 사용합니다.
+    # 카탈로그만 바뀌어 잠금은 짧지만, 긴 트랜잭션 뒤에서 잠금을 기다리며 요청을 막지 않도록 lock_timeout을 겁니다.
+    cursor = conn.cursor()
+    for name, lower in expired:
+        cursor.execute("SET LOCAL lock_timeout = '5s'")
+        cursor.execute(f"ALTER TABLE messages DETACH PARTITION {name}")
+        conn.commit()
+        leftovers.append(name)
+    cursor.close()
+
+    results = []
+    for name in sorted(set(leftovers)):
+        year, month = PARTITION_NAME_RE.match(name).groups()
+        count = export_partition(conn, name, datetime.date(int(year), int(month), 1), archive_dir, pause)
+        logger.info(f"archived {name}: {count} messages")
+        results.append((name, count))
+    return results
+
+
+def read_archived(cursor, room_id, before_id=None, limit=100, archive_dir=None):
+    """
+    아카이브에서 room_id 채팅방의 before_id보다 작은 메시지를 최신순으로 최대 limit개 반환합니다.
+    월 단위 파일을 최신 달부터 필요한 만큼만 엽니다.
+    """
+    archive_dir = archive_dir or MESSAGE_ARCHIVE_DIR
+    cursor.execute("""
+        SELECT path FROM message_archives
+        WHERE room_id = %s AND (%s IS NULL OR min_id < %s)
+        ORDER BY month DESC
+    """, (room_id, before_id, before_id))
+    paths = [row[0] for row in cursor.fetchall()]
+
+    messages = []
+    for relative in paths:
+        path = os.path.join(archive_dir, relative)
+        if not os.path.exists(path):
+            logger.error(f"message archive file missing: {path}")
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        rows = [row for row in rows if before_id is None or row["id"] < before_id]
+        messages.extend(reversed(rows))
+        if len(messages) >= limit:
+            break
+    return messages[:limit]
+
+
+def delete_archive_files(paths, archive_dir=None):
+    """채팅방 삭제 후 남은 아카이브 파일 정리"""
+    archive_dir = archive_dir or MESSAGE_ARCHIVE_DIR
+    for relative in paths:
+        try:
+            os.remove(os.path.join(archive_dir, relative))
+        except FileNotFoundError:
+            pass
+
+
+# ==================================================
+#   주기 실행
+# ==================================================
+def run_maintenance(database_url, pause=None):
+    """파티션 생성 + 만료 파티션 아카이브. 다른 프로세스가 실행 중이면 건너뜁니다. pause는 export_partition 참고"""
+    conn = psycopg2.connect(database_url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", (MAINTENANCE_LOCK_KEY,))
+        locked = cursor.fetchone()[0]
+        conn.commit()
+        if not locked:
+            return None
+        try:
+            created = ensure_partitions(conn)
+            archived = archive_expired(conn, pause=pause)
+        finally:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (MAINTENANCE_LOCK_KEY,))
+            conn.commit()
+            cursor.close()
+        return {"created": created, "archived": archived}
+    finally:
+        conn.close()
+
+
+def start_maintenance(socketio):
+    """서버 시작 시 한 번, 이후 MESSAGE_MAINTENANCE_INTERVAL초마다 run_maintenance 실행"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or MESSAGE_MAINTENANCE_INTERVAL <= 0:
+        return
+
+    def loop():
+        while True:
+            try:
+                result = run_maintenance(database_url, lambda: socketio.sleep(0))
+                if result and (result["created"] or result["archived"]):
+                    logger.info(f"message maintenance: {result}")
+            except Exception:
+                logger.exception("message maintenance failed")
+            socketio.sleep(MESSAGE_MAINTENANCE_INTERVAL)
+
+    socketio.start_background_task(loop)
+
+
+def main():
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        sys.exit("❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.")
+    result = run_maintenance(database_url)
+    if result is None:
+        print("⚠️ 다른 프로세스가 관리 작업을 실행 중입니다.")
+        return
+    print(f"✅ 생성한 파티션: {', '.join(result['created']) or '없음'}")
+    for name, count in result["archived"]:
+        print(f"✅ {name}: {count:,}개 메시지 아카이브")
+    if MESSAGE_RETENTION_MONTHS <= 0:
+        print("ℹ️ MESSAGE_RETENTION_MONTHS=0 이므로 아카이브하지 않습니다.")
+
+
+if __name__ == "__main__":
+    main()
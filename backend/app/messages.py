@@ -3,6 +3,8 @@ from app.db import get_db
 from urllib.parse import unquote
 from .auth import token_required
 from .utils import format_records # 데이터 포맷팅 유틸리티 가져오기
+from . import message_archive
+from . import purge
 import os
 from dotenv import load_dotenv
 
@@ -14,11 +16,120 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY must be set in environment variables")
 
+# GET /messages/<room_id> 한 페이지 기본/최대 메시지 수
+MESSAGES_PAGE_SIZE = int(os.getenv("MESSAGES_PAGE_SIZE", "200"))
+MESSAGES_PAGE_MAX = int(os.getenv("MESSAGES_PAGE_MAX", "1000"))
+
+def find_room_participants(cursor, room_key):
+    """
+    room_key("이메일A_이메일B")를 두 사용자 id로 변환합니다.
+    이메일에 '_'가 들어갈 수 있으므로 가능한 분할 위치를 모두 확인하며, 찾지 못한 쪽은 None입니다.
+    """
+    splits = [(room_key[:i], room_key[i + 1:]) for i, ch in enumerate(room_key) if ch == '_']
+    cursor.execute("SELECT id, email FROM users WHERE email = ANY(%s)", (list({e for pair in splits for e in pair}),))
+    ids = {row['email']: row['id'] for row in cursor.fetchall()}
+
+    participants = (None, None)
+    for a, b in splits:
+        if a in ids and b in ids:
+            return ids[a], ids[b]
+        if a in ids or b in ids:
+            participants = (ids.get(a), ids.get(b))
+    return participants
+
+
+def save_chat_message(cursor, room_key, sender_email, message):
+    """
+    채팅방이 없으면 만들고 메시지를 저장합니다. (HTTP API와 Socket.IO 공용)
+    보낸 사람 이메일을 users에서 찾을 수 없으면 None을 반환합니다.
+    """
+    cursor.execute("SELECT id FROM chat_rooms WHERE room_key = %s AND deleted_at IS NULL", (room_key,))
+    room = cursor.fetchone()
+    if room is None:
+        user_a_id, user_b_id = find_room_participants(cursor, room_key)
+        cursor.execute("""
+            INSERT INTO chat_rooms (room_key, user_a_id, user_b_id) VALUES (%s, %s, %s)
+            ON CONFLICT (room_key) WHERE deleted_at IS NULL DO UPDATE SET room_key = EXCLUDED.room_key
+            RETURNING id
+        """, (room_key, user_a_id, user_b_id))
+        room = cursor.fetchone()
+
+    cursor.execute("""
+        INSERT INTO messages (room_id, sender_id, message)
+        SELECT %s, id, %s FROM users WHERE email = %s
+        RETURNING id, created_at
+    """, (room['id'], message, sender_email))
+    return cursor.fetchone()
+
+
+def fetch_chat_rooms(cursor, my_id, my_email, limit=None):
+    """
+    내가 참여한 채팅방 목록을 마지막 메시지 시간 역순으로 반환합니다.
+    채팅방별 마지막 메시지는 (room_id, id) 인덱스로 한 건씩 읽고, 상대방 이름까지 쿼리 1번으로 처리합니다.
+    메시지가 모두 아카이브된 채팅방도 목록에 남기고, 마지막으로 아카이브된 달(없으면 채팅방 생성 시각)로 정렬합니다.
+    """
+    sql = """
+    SELECT
+        r.room_key AS room_id,
+        last.sender,
+        last.message,
+        COALESCE(last.created_at, (SELECT MAX(a.month) FROM message_archives a WHERE a.room_id = r.id), r.created_at) AS last_message_at,
+        o.email AS opponent_email,
+        COALESCE(s.name, b.business_name) AS opponent_name
+    FROM chat_rooms r
+    LEFT JOIN LATERAL (
+        SELECT u.email AS sender, m.message, m.created_at
+        FROM messages m
+        JOIN users u ON u.id = m.sender_id
+        WHERE m.room_id = r.id
+        ORDER BY m.id DESC
+        LIMIT 1
+    ) last ON TRUE
+    LEFT JOIN users o ON o.id = CASE WHEN r.user_a_id = %(me)s THEN r.user_b_id ELSE r.user_a_id END
+    LEFT JOIN students s ON s.user_id = o.id
+    LEFT JOIN businesses b ON b.user_id = o.id
+    WHERE (r.user_a_id = %(me)s OR r.user_b_id = %(me)s) AND r.deleted_at IS NULL
+    ORDER BY last_message_at DESC NULLS LAST
+    LIMIT %(limit)s
+    """
+    cursor.execute(sql, {"me": my_id, "limit": limit})
+
+    rooms_list = []
+    for room in cursor.fetchall():
+        # 상대방 계정을 찾지 못한 채팅방은 room_id에서 내 이메일을 뺀 나머지를 사용
+        opponent_email = room['opponent_email'] or room['room_id'].replace(my_email, '', 1).strip('_')
+        rooms_list.append({
+            'room_id': room['room_id'],
+            'opponent_email': opponent_email,
+            # 상대방 이름을 가져오지 못한 경우 이메일을 사용
+            'opponent_name': room['opponent_name'] or opponent_email,
+            'last_message': room['message'],
+            'last_sender': room['sender'],
+            'last_message_time': room['last_message_at'].isoformat() if hasattr(room['last_message_at'], 'isoformat') else str(room['last_message_at']),
+            # 간단한 미읽음 표시 (마지막 메시지가 상대방이 보낸 것이면. 모두 아카이브된 채팅방은 읽은 것으로 봄)
+            'unread': room['sender'] is not None and room['sender'] != my_email
+        })
+
+    return rooms_list
+
+
 # ==================================================
-#   특정 채팅방의 모든 메시지 조회 API (GET /messages/<room_id>)
+#   특정 채팅방의 메시지 조회 API (GET /messages/<room_id>?before=<id>&limit=<n>)
 # ==================================================
 @messages_bp.route("/<string:room_id>", methods=["GET"])
 def get_messages(room_id):
+    """
+    before(메시지 id)보다 이전 메시지를 최신 limit개까지 작성 순서대로 반환합니다.
+    DB에 남은 메시지로 페이지를 채우지 못하면 보존 기간이 지나 아카이브된 파일에서 이어서 읽습니다.
+    """
+    try:
+        limit = min(int(request.args.get("limit", MESSAGES_PAGE_SIZE)), MESSAGES_PAGE_MAX)
+        before = request.args.get("before", type=int)
+    except ValueError:
+        return jsonify({"message": "limit must be an integer"}), 400
+    if limit < 1:
+        return jsonify({"message": "limit must be positive"}), 400
+
     conn = None
     cursor = None
     try:
@@ -28,17 +139,43 @@ def get_messages(room_id):
         # URL-인코딩된 room_id를 디코딩하여 일관성을 보장합니다.
         decoded_room_id = unquote(room_id)
 
-        # 🔴 디버깅 로그 1: 어떤 room_id로 조회를 요청받았는지 확인
+        cursor.execute("SELECT id FROM chat_rooms WHERE room_key = %s AND deleted_at IS NULL", (decoded_room_id,))
+        room = cursor.fetchone()
+        if room is None:
+            return jsonify({"messages": [], "has_more": False, "next_before": None}), 200
+
+        # 최신 메시지부터 limit + 1개를 읽어 다음 페이지 여부를 판단합니다. (파티션별 (room_id, id) 인덱스 사용)
+        cursor.execute("""
+            SELECT m.id, %s AS room_id, u.email AS sender, m.message, m.created_at
+            FROM messages m
+            JOIN users u ON u.id = m.sender_id
+            WHERE m.room_id = %s AND (%s IS NULL OR m.id < %s)
+            ORDER BY m.id DESC
+            LIMIT %s
+        """, (decoded_room_id, room['id'], before, before, limit + 1))
+        messages = format_records(cursor.fetchall())
+
+        # DB에 남은 메시지가 부족하면 아카이브에서 이어서 읽기
+        if len(messages) <= limit:
+            oldest_id = messages[-1]['id'] if messages else before
+            for archived in message_archive.read_archived(cursor, room['id'], oldest_id, limit + 1 - len(messages)):
+                messages.append({
+                    "id": archived['id'],
+                    "room_id": decoded_room_id,
+                    "sender": archived['sender'] or "",
+                    "message": archived['message'],
+                    "created_at": archived['created_at']
+                })
+
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        messages.reverse()
 
-        # DB에서 room_id가 일치하는 모든 메시지를 시간순으로 정렬하여 가져옵니다.
-        sql = "SELECT room_id, sender, message, created_at FROM messages WHERE room_id = %s ORDER BY created_at ASC"
-        cursor.execute(sql, (decoded_room_id,))
-        messages = cursor.fetchall()
-
-        # DB 레코드를 API 응답에 적합한 형식으로 변환 (datetime -> str, None -> "")
-        formatted_messages = format_records(messages)
-
-        return jsonify({"messages": formatted_messages}), 200
+        return jsonify({
+            "messages": messages,
+            "has_more": has_more,
+            "next_before": messages[0]['id'] if has_more else None
+        }), 200
 
     except Exception as e:
         return jsonify({"message": "Failed to fetch messages"}), 500
@@ -70,10 +207,12 @@ def save_message():
         conn = get_db()
         cursor = conn.cursor()
         
-        sql = "INSERT INTO messages (room_id, sender, message) VALUES (%s, %s, %s)"
-        cursor.execute(sql, (decoded_room_id, sender, message))
+        saved = save_chat_message(cursor, decoded_room_id, sender, message)
+        if saved is None:
+            conn.rollback()
+            return jsonify({"message": "sender not found"}), 400
         conn.commit()
-        
+
         return jsonify({"message": "Message saved successfully"}), 201
 
     except Exception as e:
@@ -97,72 +236,7 @@ def get_my_chat_rooms():
         conn = get_db()
         cursor = conn.cursor()
 
-        # 내가 포함된 모든 채팅방 조회 (room_id에 내 이메일이 포함된 경우)
-        sql = """
-        SELECT
-            room_id,
-            sender,
-            message,
-            created_at
-        FROM messages
-        WHERE room_id LIKE %s
-        ORDER BY created_at DESC
-        """
-        cursor.execute(sql, (f"%{my_email}%",))
-        all_messages = cursor.fetchall()
-
-        # 채팅방별로 그룹화하고 마지막 메시지만 추출
-        rooms_dict = {}
-        for msg in all_messages:
-            room_id = msg['room_id']
-            if room_id not in rooms_dict:
-                # room_id에서 상대방 이메일 추출
-                parts = room_id.split('_')
-                opponent_email = parts[0] if parts[0] != my_email else (parts[1] if len(parts) > 1 else '')
-
-                # 상대방 이름 조회
-                opponent_name = opponent_email
-                try:
-                    # 학생인지 확인
-                    cursor.execute("""
-                        SELECT s.name
-                        FROM students s
-                        JOIN users u ON s.user_id = u.id
-                        WHERE u.email = %s
-                    """, (opponent_email,))
-                    student = cursor.fetchone()
-                    if student:
-                        opponent_name = student['name']
-                    else:
-                        # 사업자인지 확인
-                        cursor.execute("""
-                            SELECT b.business_name
-                            FROM businesses b
-                            JOIN users u ON b.user_id = u.id
-                            WHERE u.email = %s
-                        """, (opponent_email,))
-                        business = cursor.fetchone()
-                        if business:
-                            opponent_name = business['business_name']
-                except Exception:
-                    # 상대방 이름을 가져오지 못한 경우 이메일을 사용
-                    pass
-
-                rooms_dict[room_id] = {
-                    'room_id': room_id,
-                    'opponent_email': opponent_email,
-                    'opponent_name': opponent_name,
-                    'last_message': msg['message'],
-                    'last_sender': msg['sender'],
-                    'last_message_time': msg['created_at'].isoformat() if hasattr(msg['created_at'], 'isoformat') else str(msg['created_at']),
-                    'unread': msg['sender'] != my_email  # 간단한 미읽음 표시 (마지막 메시지가 상대방이 보낸 것이면)
-                }
-
-        # 리스트로 변환
-        rooms_list = list(rooms_dict.values())
-
-        # 마지막 메시지 시간 기준으로 정렬
-        rooms_list.sort(key=lambda x: x['last_message_time'], reverse=True)
+        rooms_list = fetch_chat_rooms(cursor, request.user.get("id"), my_email)
 
         return jsonify({
             "message": "success",
@@ -197,17 +271,20 @@ def delete_chat_room(room_id):
         conn = get_db()
         cursor = conn.cursor()
 
-        # 해당 채팅방의 모든 메시지 삭제
-        sql = "DELETE FROM messages WHERE room_id = %s"
-        cursor.execute(sql, (decoded_room_id,))
-        deleted_count = cursor.rowcount
-
+        # 즉시 숨기고 메시지/아카이브는 백그라운드 작업이 나눠서 삭제
+        cursor.execute("""
+            UPDATE chat_rooms SET deleted_at = CURRENT_TIMESTAMP
+            WHERE room_key = %s AND deleted_at IS NULL
+            RETURNING id
+        """, (decoded_room_id,))
+        room = cursor.fetchone()
+        if room is None:
+            return jsonify({"message": "chat room not found"}), 404
+
+        job_id = purge.request_purge(cursor, "CHAT_ROOM", room['id'], request.user["id"])
         conn.commit()
 
-        return jsonify({
-            "message": "chat room deleted successfully",
-            "deleted_messages": deleted_count
-        }), 200
+        return purge.purge_response(job_id, "chat room deletion scheduled")
 
     except Exception as e:
         if conn:
@@ -0,0 +1,250 @@
+"""
+Prometheus 텍스트 형식의 /metrics 엔드포인트와 메트릭 수집기
+- HTTP: 블루프린트/라우트별 요청 수, 지연시간 히스토그램, 에러 수 (create_app에서 일괄 적용)
+- DB: 열린 연결 수, 연결 생성 시간
+- Socket.IO: 접속자 수, 채팅방 수, 전송 메시지 수/초
+- AI: Gemini 호출 지연시간, 실패 수
+"""
+from flask import Blueprint, Response, request, jsonify
+from collections import deque
+import threading
+import time
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+metrics_bp = Blueprint("metrics", __name__)
+
+# 설정 시 /metrics 요청에 "Authorization: Bearer <METRICS_TOKEN>" 헤더가 필요합니다.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = []
+_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        if not self.labelnames and self.type_name != "histogram":
+            self.values[()] = 0
+        _registry.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        lines = self.header()
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name, help_text, labelnames=(), callback=None):
+        super().__init__(name, help_text, labelnames)
+        # callback이 있으면 /metrics 요청 시점에 값을 계산합니다.
+        self.callback = callback
+
+    def set(self, value, **labels):
+        with _lock:
+            self.values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def render(self):
+        lines = self.header()
+        values = self.values
+        if self.callback is not None:
+            try:
+                values = {(): self.callback()}
+            except Exception:
+                values = {}
+        for key, value in sorted(values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with _lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = self.values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry["counts"][index] += 1
+                    break
+            entry["sum"] += value
+            entry["count"] += 1
+
+    def render(self):
+        lines = self.header()
+        for key, entry in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry["counts"]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(entry['sum'])}")
+            lines.append(f"{self.name}_count{labels} {entry['count']}")
+        return lines
+
+
+class RateWindow:
+    """최근 window초 동안의 이벤트 발생률(초당)을 1초 단위 버킷으로 계산합니다."""
+
+    def __init__(self, window=60):
+        self.window = window
+        self.buckets = deque()  # [초, 이벤트 수]
+
+    def mark(self):
+        second = int(time.monotonic())
+        with _lock:
+            if self.buckets and self.buckets[-1][0] == second:
+                self.buckets[-1][1] += 1
+            else:
+                self.buckets.append([second, 1])
+            self._trim(second)
+
+    def rate(self):
+        with _lock:
+            self._trim(int(time.monotonic()))
+            return sum(count for _, count in self.buckets) / self.window
+
+    def _trim(self, second):
+        while self.buckets and self.buckets[0][0] <= second - self.window:
+            self.buckets.popleft()
+
+
+def _socketio_room_count():
+    """클라이언트별 개인 방(sid)을 제외한 채팅방 수"""
+    from . import socketio
+    rooms = socketio.server.manager.rooms.get("/", {})
+    sids = set(rooms.get(None, {}).keys())
+    return sum(1 for room in rooms if room is not None and room not in sids)
+
+
+# ============================
+#   메트릭 정의
+# ============================
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP requests by route and status", ("blueprint", "route", "method", "status"))
+HTTP_ERRORS = Counter("http_request_errors_total", "HTTP requests that returned a 5xx status", ("blueprint", "route", "method"))
+HTTP_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency", ("blueprint", "route", "method"))
+
+DB_CONNECTIONS_OPEN = Gauge("db_connections_open", "Database connections currently held by requests")
+DB_CONNECTIONS_OPENED = Counter("db_connections_opened_total", "Database connections opened")
+DB_CONNECT_LATENCY = Histogram("db_connect_duration_seconds", "Time spent opening database connections")
+
+SOCKETIO_CONNECTIONS = Gauge("socketio_connections", "Active Socket.IO connections")
+SOCKETIO_ROOMS = Gauge("socketio_rooms", "Socket.IO chat rooms with at least one member", callback=_socketio_room_count)
+SOCKETIO_MESSAGES = Counter("socketio_messages_emitted_total", "Chat messages broadcast over Socket.IO")
+_socketio_message_rate = RateWindow(60)
+SOCKETIO_MESSAGE_RATE = Gauge("socketio_messages_per_second", "Chat messages broadcast per second (last 60s)", callback=_socketio_message_rate.rate)
+
+AI_LATENCY = Histogram("ai_request_duration_seconds", "Gemini generate_content latency", buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0))
+AI_FAILURES = Counter("ai_request_failures_total", "Failed Gemini generate_content calls")
+
+
+def record_socketio_message():
+    SOCKETIO_MESSAGES.inc()
+    _socketio_message_rate.mark()
+
+
+def render():
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ============================
+#   요청 훅 (create_app에서 등록)
+# ============================
+def _before_request():
+    request.metrics_started = time.perf_counter()
+
+
+def _after_request(response):
+    started = getattr(request, "metrics_started", None)
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+
+    blueprint = request.blueprint or "app"
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    method = request.method
+
+    HTTP_REQUESTS.inc(blueprint=blueprint, route=route, method=method, status=response.status_code)
+    HTTP_LATENCY.observe(elapsed, blueprint=blueprint, route=route, method=method)
+    if response.status_code >= 500:
+        HTTP_ERRORS.inc(blueprint=blueprint, route=route, method=method)
+    return response
+
+
+def init_app(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+
+
+# ============================
+#   메트릭 조회 API (GET /metrics)
+# ============================
+@metrics_bp.route("", methods=["GET"])
+def get_metrics():
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        return jsonify({"message": "unauthorized"}), 401
+
+    return Response(render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,256 @@
+"""
+알림 (outbox + Socket.IO 푸시)
+지원 등록/상태 변경 API는 업무 데이터와 같은 트랜잭션에서 publish()로 notifications에 행만 넣습니다.
+커밋된 알림만 존재하므로 롤백된 변경은 알림이 나가지 않고, 푸시 전에 서버가 죽어도 알림이 사라지지 않습니다.
+
+디스패처는 dispatched_at이 비어 있는 알림을 SKIP LOCKED로 가져와 사용자별로 묶고,
+사용자마다 'notifications' 이벤트 하나(알림 목록 + 읽지 않은 수)를 user:<id> 방으로 보냅니다.
+서버(main.py)가 디스패처를 실행하며, 클라이언트는 io(url, { auth: { token } })으로 연결하면 자기 방에 참여합니다.
+user:<id> 방은 connect에서 JWT를 검증한 본인만 참여하며 join_room 이벤트로는 참여할 수 없습니다. (socket_events.handle_join_room)
+"""
+from flask import Blueprint, request, jsonify
+from app.db import get_db
+from .auth import token_required
+from .utils import format_records
+from .socket_events import user_room
+from collections import defaultdict
+import logging
+import os
+import psycopg2
+from psycopg2.extras import DictCursor, Json, execute_values
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+notifications_bp = Blueprint("notifications", __name__)
+
+# 디스패처가 보내지 않은 알림을 확인하는 주기(초, 0이면 디스패처를 띄우지 않음)와 한 번에 가져갈 최대 알림 수
+NOTIFICATION_POLL_INTERVAL = float(os.getenv("NOTIFICATION_POLL_INTERVAL", "1"))
+NOTIFICATION_DISPATCH_BATCH = int(os.getenv("NOTIFICATION_DISPATCH_BATCH", "500"))
+# GET /notifications 한 페이지 기본/최대 알림 수
+NOTIFICATIONS_PAGE_SIZE = int(os.getenv("NOTIFICATIONS_PAGE_SIZE", "20"))
+NOTIFICATIONS_PAGE_MAX = int(os.getenv("NOTIFICATIONS_PAGE_MAX", "100"))
+
+
+def publish(cursor, user_id, notification_type, payload):
+    """알림 하나를 outbox에 추가. 호출한 쪽의 트랜잭션이 커밋되어야 발송됩니다."""
+    publish_many(cursor, [(user_id, notification_type, payload)])
+
+
+def publish_many(cursor, notifications):
+    """(user_id, type, payload) 목록을 한 문장으로 outbox에 추가"""
+    if not notifications:
+        return
+    execute_values(cursor, "INSERT INTO notifications (user_id, type, payload) VALUES %s",
+                   [(user_id, notification_type, Json(payload)) for user_id, notification_type, payload in notifications],
+                   page_size=len(notifications))
+
+
+def unread_counts(cursor, user_ids):
+    """사용자별 읽지 않은 알림 수 (부분 인덱스 idx_notifications_user_id_unread 사용)"""
+    cursor.execute("""
+        SELECT user_id, COUNT(*) AS unread FROM notifications
+        WHERE user_id = ANY(%s) AND is_read = FALSE
+        GROUP BY user_id
+    """, (list(user_ids),))
+    counts = {user_id: 0 for user_id in user_ids}
+    counts.update({row[0]: row[1] for row in cursor.fetchall()})
+    return counts
+
+
+def _format_notification(row):
+    return {
+        "id": row["id"],
+        "type": row["type"],
+        "payload": row["payload"],
+        "is_read": row["is_read"],
+        "created_at": row["created_at"].isoformat()
+    }
+
+
+# ==================================================
+#   디스패처
+# ==================================================
+def dispatch_pending(conn, socketio):
+    """
+    보내지 않은 알림을 최대 NOTIFICATION_DISPATCH_BATCH개 가져와 사용자별로 한 번씩 푸시하고 보낸 수를 반환.
+    푸시한 뒤 dispatched_at을 커밋하므로 중간에 실패하면 다음 주기에 다시 보냅니다. (최소 한 번 전달)
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT id, user_id, type, payload, is_read, created_at FROM notifications
+        WHERE dispatched_at IS NULL
+        ORDER BY id
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    """, (NOTIFICATION_DISPATCH_BATCH,))
+    rows = cursor.fetchall()
+    if not rows:
+        conn.rollback()
+        cursor.close()
+        return 0
+
+    by_user = defaultdict(list)
+    for row in rows:
+        by_user[row["user_id"]].append(_format_notification(row))
+    counts = unread_counts(cursor, by_user.keys())
+
+    for user_id, notifications in by_user.items():
+        socketio.emit("notifications", {
+            "notifications": notifications,
+            "unread_count": counts[user_id]
+        }, to=user_room(user_id))
+
+    cursor.execute("UPDATE notifications SET dispatched_at = CURRENT_TIMESTAMP WHERE id = ANY(%s)",
+                   ([row["id"] for row in rows],))
+    conn.commit()
+    cursor.close()
+    return len(rows)
+
+
+def start_dispatcher(socketio):
+    """NOTIFICATION_POLL_INTERVAL초마다 보내지 않은 알림을 푸시하는 백그라운드 작업 시작"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or NOTIFICATION_POLL_INTERVAL <= 0:
+        return
+
+    def loop():
+        conn = None
+        while True:
+            try:
+                if conn is None or conn.closed:
+                    conn = psycopg2.connect(database_url, cursor_factory=DictCursor)
+                # 한 배치를 가득 채웠으면 쉬지 않고 이어서 보냄
+                while dispatch_pending(conn, socketio) >= NOTIFICATION_DISPATCH_BATCH:
+                    pass
+            except Exception:
+                logger.exception("notification dispatcher failed")
+                if conn is not None:
+                    conn.close()
+                conn = None
+            socketio.sleep(NOTIFICATION_POLL_INTERVAL)
+
+    socketio.start_background_task(loop)
+
+
+# ==================================================
+#   내 알림 목록 조회 API (GET /notifications?before=<id>&limit=<n>&unread=true)
+# ==================================================
+@notifications_bp.route("", methods=["GET"])
+@token_required
+def get_notifications():
+    try:
+        limit = min(int(request.args.get("limit", NOTIFICATIONS_PAGE_SIZE)), NOTIFICATIONS_PAGE_MAX)
+        before = request.args.get("before", type=int)
+    except ValueError:
+        return jsonify({"message": "limit must be an integer"}), 400
+    if limit < 1:
+        return jsonify({"message": "limit must be positive"}), 400
+    unread_only = request.args.get("unread") == "true"
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT id, type, payload, is_read, created_at FROM notifications
+            WHERE user_id = %s AND (%s IS NULL OR id < %s) AND (%s IS FALSE OR is_read = FALSE)
+            ORDER BY id DESC
+            LIMIT %s
+        """, (request.user["id"], before, before, unread_only, limit + 1))
+        notifications = format_records(cursor.fetchall())
+
+        has_more = len(notifications) > limit
+        notifications = notifications[:limit]
+
+        return jsonify({
+            "message": "success",
+            "notifications": notifications,
+            "unread_count": unread_counts(cursor, [request.user["id"]])[request.user["id"]],
+            "has_more": has_more,
+            "next_before": notifications[-1]["id"] if has_more else None
+        }), 200
+
+    except Exception as e:
+        return jsonify({"message": "Failed to fetch notifications"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+
+# ==================================================
+#   읽지 않은 알림 수 API (GET /notifications/unread-count)
+# ==================================================
+@notifications_bp.route("/unread-count", methods=["GET"])
+@token_required
+def get_unread_count():
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        return jsonify({
+            "message": "success",
+            "unread_count": unread_counts(cursor, [request.user["id"]])[request.user["id"]]
+        }), 200
+
+    except Exception as e:
+        return jsonify({"message": "Failed to fetch unread count"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+
+# ==================================================
+#   알림 읽음 처리 API (POST /notifications/read)
+#   {"ids": [1, 2]} 또는 {"all": true}
+# ==================================================
+@notifications_bp.route("/read", methods=["POST"])
+@token_required
+def mark_notifications_read():
+    data = request.get_json(silent=True) or {}
+    ids = data.get("ids")
+    mark_all = data.get("all") is True
+
+    if not mark_all and (not isinstance(ids, list) or not ids
+                         or not all(isinstance(item, int) and not isinstance(item, bool) for item in ids)):
+        return jsonify({"message": "ids (list of integers) or all=true is required"}), 400
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            UPDATE notifications SET is_read = TRUE
+            WHERE user_id = %s AND is_read = FALSE AND (%s OR id = ANY(%s))
+        """, (request.user["id"], mark_all, ids or []))
+        updated = cursor.rowcount
+        counts = unread_counts(cursor, [request.user["id"]])
+        conn.commit()
+
+        return jsonify({
+            "message": "success",
+            "updated": updated,
+            "unread_count": counts[request.user["id"]]
+        }), 200
+
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        return jsonify({"message": "Failed to mark notifications as read"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
@@ -0,0 +1,162 @@
+"""
+프로젝트 조회수 버퍼와 인기도 점수
+GET /projects/<id>는 가장 많이 불리는 읽기 API라 조회마다 UPDATE를 하지 않고, 워커 메모리의 카운터만 올립니다.
+백그라운드 작업이 POPULARITY_FLUSH_INTERVAL초마다 모인 조회수/지원 수를 UPDATE 한 문장으로 projects에 반영합니다.
+(서버가 비정상 종료되면 마지막 주기의 조회수는 잃을 수 있습니다. 정상 종료 시에는 남은 카운터를 반영)
+
+인기도(popularity_score)는 조회 1회 = POPULARITY_VIEW_WEIGHT, 지원 1건 = POPULARITY_APPLICATION_WEIGHT 가중치가
+POPULARITY_HALF_LIFE_HOURS마다 절반으로 줄어드는 감쇠 합계입니다.
+모든 점수를 고정 기준 시각(POPULARITY_EPOCH)으로 환산해(forward decay) 자연로그로 저장하므로
+- 시간이 지나도 점수를 다시 계산할 필요가 없고 (모든 프로젝트가 같은 비율로 줄어들어 순서가 그대로)
+- 새 활동만 더하면 되어 (log-sum-exp) 인덱스(idx_projects_status_popularity)로 sort=popular를 바로 읽습니다.
+현재 시점의 감쇠 합계는 current_popularity()로 구합니다. 활동이 없는 프로젝트는 NULL입니다.
+"""
+from collections import Counter
+from psycopg2.extras import execute_values
+import atexit
+import datetime
+import logging
+import math
+import os
+import threading
+import psycopg2
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 버퍼를 DB에 반영하는 주기(초, 0이면 조회수를 모으지 않음)
+POPULARITY_FLUSH_INTERVAL = float(os.getenv("POPULARITY_FLUSH_INTERVAL", "10"))
+POPULARITY_HALF_LIFE_HOURS = float(os.getenv("POPULARITY_HALF_LIFE_HOURS", "72"))
+POPULARITY_VIEW_WEIGHT = float(os.getenv("POPULARITY_VIEW_WEIGHT", "1"))
+POPULARITY_APPLICATION_WEIGHT = float(os.getenv("POPULARITY_APPLICATION_WEIGHT", "10"))
+# 점수 환산 기준 시각 (바꾸면 저장된 점수를 다시 계산해야 함)
+# 마이그레이션 0012는 기존 지원 기록을 가중치 10, 반감기 72시간, 이 기준 시각으로 고정해 채움
+# (지원 가중치/반감기를 바꿔 배포하면 기존 점수는 이전 값 기준으로 남음)
+POPULARITY_EPOCH = datetime.datetime(2025, 1, 1)
+
+_lock = threading.Lock()
+_views = Counter()
+_applications = Counter()
+_enabled = False
+
+
+def decay_exponent(at=None):
+    """기준 시각부터 at까지 감쇠 지수 (가중치 w의 활동은 ln(w) + decay_exponent(at)로 저장)"""
+    at = at or datetime.datetime.now()
+    hours = (at - POPULARITY_EPOCH).total_seconds() / 3600
+    return math.log(2) * hours / POPULARITY_HALF_LIFE_HOURS
+
+
+def current_popularity(score, at=None):
+    """저장된 점수 -> at 시점의 감쇠 합계 (조회 1회 = POPULARITY_VIEW_WEIGHT 단위)"""
+    if score is None:
+        return 0.0
+    return math.exp(score - decay_exponent(at))
+
+
+def record_view(project_id):
+    if _enabled:
+        with _lock:
+            _views[project_id] += 1
+
+
+def record_application(project_id):
+    if _enabled:
+        with _lock:
+            _applications[project_id] += 1
+
+
+# 잠금 순서를 id 순으로 고정해 여러 워커가 동시에 반영해도 교착 상태가 생기지 않게 함
+# 가중치가 0인 활동(POPULARITY_VIEW_WEIGHT=0일 때 조회만 있는 경우)은 score가 NULL이라 조회수만 올림
+FLUSH_SQL = """
+WITH counts (id, views, score) AS (VALUES %s),
+locked AS (
+    SELECT p.id FROM projects p JOIN counts c ON c.id = p.id
+    ORDER BY p.id
+    FOR UPDATE OF p
+)
+UPDATE projects p SET
+    view_count = p.view_count + c.views,
+    popularity_score = CASE
+        WHEN c.score IS NULL THEN p.popularity_score
+        WHEN p.popularity_score IS NULL THEN c.score
+        ELSE GREATEST(p.popularity_score, c.score) + ln(1 + exp(-abs(p.popularity_score - c.score)))
+    END
+FROM counts c JOIN locked l ON l.id = c.id
+WHERE p.id = c.id
+"""
+
+
+def flush(conn):
+    """모인 카운터를 한 문장으로 반영하고 반영한 프로젝트 수를 반환. 실패하면 카운터를 되돌려 다음 주기에 다시 시도"""
+    global _views, _applications
+    with _lock:
+        views, applications = _views, _applications
+        _views, _applications = Counter(), Counter()
+    project_ids = set(views) | set(applications)
+    if not project_ids:
+        return 0
+
+    exponent = decay_exponent()
+    rows = []
+    for project_id in project_ids:
+        weight = views[project_id] * POPULARITY_VIEW_WEIGHT + applications[project_id] * POPULARITY_APPLICATION_WEIGHT
+        score = math.log(weight) + exponent if weight > 0 else None
+        rows.append((project_id, views[project_id], score))
+
+    try:
+        cursor = conn.cursor()
+        execute_values(cursor, FLUSH_SQL, rows, template="(%s::int, %s::bigint, %s::float8)", page_size=len(rows))
+        conn.commit()
+        cursor.close()
+    except Exception:
+        conn.rollback()
+        with _lock:
+            _views.update(views)
+            _applications.update(applications)
+        raise
+    return len(rows)
+
+
+def _flush_once(database_url):
+    conn = psycopg2.connect(database_url)
+    try:
+        flush(conn)
+    finally:
+        conn.close()
+
+
+def start_flusher(socketio):
+    """조회수 수집을 켜고 POPULARITY_FLUSH_INTERVAL초마다 DB에 반영하는 백그라운드 작업 시작"""
+    global _enabled
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or POPULARITY_FLUSH_INTERVAL <= 0:
+        return
+    _enabled = True
+
+    def loop():
+        conn = None
+        while True:
+            socketio.sleep(POPULARITY_FLUSH_INTERVAL)
+            try:
+                if conn is None or conn.closed:
+                    conn = psycopg2.connect(database_url)
+                flush(conn)
+            except Exception:
+                logger.exception("popularity flush failed")
+                if conn is not None:
+                    conn.close()
+                conn = None
+
+    socketio.start_background_task(loop)
+
+    # 정상 종료 시 남은 카운터 반영
+    def flush_at_exit():
+        try:
+            _flush_once(database_url)
+        except Exception:
+            logger.exception("popularity flush at exit failed")
+
+    atexit.register(flush_at_exit)
@@ -1,8 +1,11 @@
 from flask import Blueprint, request, jsonify
 from app.db import get_db
 from .auth import token_required # auth.py에서 데코레이터 가져오기
-from .utils import format_records # 데이터 포맷팅 유틸리티 가져오기
+from .utils import format_records, encode_cursor, decode_cursor # 데이터 포맷팅 유틸리티 가져오기
+from . import semantic
+from . import autocomplete
 import os
+import re
 from dotenv import load_dotenv
 import traceback # 에러 로깅을 위해 상단으로 이동
 
@@ -14,6 +17,13 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY must be set in environment variables")
 
+# GET /profiles/search 한 페이지 기본/최대 프로필 수
+PROFILES_SEARCH_PAGE_SIZE = int(os.getenv("PROFILES_SEARCH_PAGE_SIZE", "20"))
+PROFILES_SEARCH_PAGE_MAX = int(os.getenv("PROFILES_SEARCH_PAGE_MAX", "100"))
+# 검색에 쓸 수 있는 최대 기술 수/검색어 단어 수
+MAX_SEARCH_SKILLS = 10
+MAX_SEARCH_TERMS = 5
+
 
 # ============================
 #   내 프로필 조회 API (학생만 가능)
@@ -93,11 +103,21 @@ def update_my_profile():
             return jsonify({"message": "no fields to update"}), 400
 
         params.append(request.user["id"])
-        sql = f"UPDATE students SET {', '.join(update_fields)} WHERE user_id = %s"
+        sql = f"""
+        UPDATE students SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP WHERE user_id = %s
+        RETURNING introduction, skills, is_profile_public
+        """
 
         cursor.execute(sql, params)
+        profile = cursor.fetchone()
         conn.commit()
 
+        # 의미 검색 인덱스에 바뀐 프로필 반영
+        if profile:
+            semantic.index_student(request.user["id"], profile)
+        if "skills" in data:
+            autocomplete.add_skills(data["skills"])
+
         return jsonify({"message": "profile updated successfully"}), 200
 
     except Exception as e:
@@ -168,6 +188,104 @@ def get_public_profiles():
             cursor.close()
 
 
+# ============================
+#   인재 검색 API (누구나 가능)
+#   GET /profiles/search?skills=Python,React&match=all|any&q=자기소개 검색어&limit=&cursor=
+# ============================
+def _search_query(q):
+    """검색어를 단어별 접두어 검색 tsquery 문자열로 변환 ('데이터 분석' -> '데이터:* & 분석:*')"""
+    terms = [term for term in re.sub(r"[^\w\s]", " ", q).split() if term][:MAX_SEARCH_TERMS]
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+@profiles_bp.route("/search", methods=["GET"])
+def search_profiles():
+    """
+    공개 프로필을 기술/자기소개로 검색합니다.
+    점수 = 일치한 기술 수 x 100 + 자기소개 관련도(0~99). 점수가 높은 순, 같으면 최근 가입 순이며
+    (점수, user_id) 키셋 커서로 다음 페이지를 가져옵니다.
+    """
+    skills = sorted({skill.strip().lower() for skill in request.args.get("skills", "").split(",") if skill.strip()})
+    match = request.args.get("match", "all")
+    tsquery = _search_query(request.args.get("q", ""))
+
+    if match not in ("all", "any"):
+        return jsonify({"message": "match must be 'all' or 'any'"}), 400
+    if len(skills) > MAX_SEARCH_SKILLS:
+        return jsonify({"message": f"too many skills (max {MAX_SEARCH_SKILLS})"}), 400
+    try:
+        limit = min(int(request.args.get("limit", PROFILES_SEARCH_PAGE_SIZE)), PROFILES_SEARCH_PAGE_MAX)
+        after = [int(value) for value in decode_cursor(request.args["cursor"], 2)] if request.args.get("cursor") else None
+    except (ValueError, TypeError) as e:
+        return jsonify({"message": f"invalid limit or cursor: {e}"}), 400
+    if limit < 1:
+        return jsonify({"message": "limit must be positive"}), 400
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        params = {"skills": skills, "tsquery": tsquery, "limit": limit + 1}
+        # 부분 인덱스를 쓰려면 공개 프로필 조건을 인덱스 정의와 똑같이 적어야 함
+        conditions = ["s.is_profile_public IS TRUE", "s.introduction IS NOT NULL"]
+        if skills:
+            conditions.append(f"skill_tags(s.skills) {'@>' if match == 'all' else '&&'} %(skills)s::text[]")
+        if tsquery:
+            conditions.append("to_tsvector('simple', s.introduction) @@ to_tsquery('simple', %(tsquery)s)")
+
+        # 조건이 없는 부분은 상수 0으로 두어 조건 없는 검색이 user_id 인덱스 순서로 읽히도록 함
+        skill_rank = "cardinality(ARRAY(SELECT unnest(skill_tags(s.skills)) INTERSECT SELECT unnest(%(skills)s::text[]))) * 100" if skills else "0"
+        text_rank = "LEAST(99, ROUND(100 * ts_rank(to_tsvector('simple', s.introduction), to_tsquery('simple', %(tsquery)s))))::int" if tsquery else "0"
+
+        sql = f"""
+        SELECT * FROM (
+            SELECT
+                s.user_id as id,
+                s.name as username,
+                s.introduction,
+                s.skills,
+                s.portfolio_url,
+                s.github_url,
+                s.linkedin_url,
+                u.email,
+                ARRAY(SELECT unnest(skill_tags(s.skills)) INTERSECT SELECT unnest(%(skills)s::text[])) AS matched_skills,
+                {skill_rank} + {text_rank} AS score
+            FROM students s
+            JOIN users u ON s.user_id = u.id
+            WHERE {" AND ".join(conditions)}
+        ) ranked
+        """
+        if after is not None:
+            sql += " WHERE (score, id) < (%(after_score)s, %(after_id)s)"
+            params.update(after_score=after[0], after_id=after[1])
+        sql += " ORDER BY score DESC, id DESC LIMIT %(limit)s"
+
+        cursor.execute(sql, params)
+        profiles = cursor.fetchall()
+
+        has_more = len(profiles) > limit
+        profiles = profiles[:limit]
+
+        formatted_profiles = format_records(profiles)
+        return jsonify({
+            "message": "success",
+            "count": len(formatted_profiles),
+            "profiles": formatted_profiles,
+            "has_more": has_more,
+            "next_cursor": encode_cursor([profiles[-1]["score"], profiles[-1]["id"]]) if has_more else None
+        }), 200
+
+    except Exception as e:
+        return jsonify({"message": "Failed to search profiles"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+
 # ============================
 #   특정 프로필 조회 API (누구나 가능)
 # ============================
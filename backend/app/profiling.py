@@ -0,0 +1,224 @@
+"""
+요청 단위 프로파일링
+- 온디맨드: "X-Profile: <PROFILING_SECRET>" 헤더 또는 ?__profile=<PROFILING_SECRET> 쿼리로 요청 하나를 프로파일링
+- 샘플링: PROFILE_SAMPLE_RATE=N 이면 N개 요청마다 1개를 프로파일링
+결과는 PROFILE_DIR에 flamegraph.pl/speedscope에서 바로 쓸 수 있는 collapsed stack 파일(.collapsed)과
+요청 정보 및 쿼리별 실행 시간(.json)으로 저장되며, 응답의 X-Profile-Id 헤더로 ID를 알려줍니다.
+"""
+from flask import Blueprint, current_app, request, jsonify, g
+from collections import Counter
+from . import query_stats
+import hmac
+import itertools
+import json
+import os
+import re
+import sys
+import time
+import uuid
+from urllib.parse import urlencode
+from dotenv import load_dotenv
+
+load_dotenv()
+
+profiling_bp = Blueprint("profiling", __name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_ARG = "__profile"
+PROFILE_ID_RE = re.compile(r"^[0-9]+-[0-9a-f]{8}$")
+
+# 프로파일링 대상에서 제외할 블루프린트
+EXCLUDED_BLUEPRINTS = ["metrics", "profiling"]
+
+_request_counter = itertools.count(1)
+
+
+class StackProfiler:
+    """
+    sys.setprofile 기반의 결정적(deterministic) 프로파일러.
+    호출 스택 경로별 self time을 누적하여 collapsed stack 형식으로 출력합니다.
+    sys.setprofile은 현재 스레드에만 적용되며, eventlet 환경에서는 같은 스레드의 다른 green thread 호출이 섞일 수 있습니다.
+    """
+
+    def __init__(self):
+        self.stack = []  # [경로, 시작 시각, 하위 호출 시간]
+        self.self_times = Counter()
+        self.started = None
+        self.duration = 0.0
+
+    @staticmethod
+    def _label(frame, event, arg):
+        if event == "c_call":
+            module = getattr(arg, "__module__", None) or "builtins"
+            return f"{module}.{getattr(arg, '__qualname__', getattr(arg, '__name__', repr(arg)))}"
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        return f"{module}.{code.co_name}:{code.co_firstlineno}"
+
+    def _callback(self, frame, event, arg):
+        now = time.perf_counter()
+        if event == "call" or event == "c_call":
+            label = self._label(frame, event, arg)
+            parent = self.stack[-1][0] + ";" if self.stack else ""
+            self.stack.append([parent + label, now, 0.0])
+        elif self.stack:
+            # 프로파일링 시작 전에 진입한 프레임의 return은 스택이 비어 있으므로 무시됩니다.
+            path, started, child_time = self.stack.pop()
+            elapsed = now - started
+            self.self_times[path] += elapsed - child_time
+            if self.stack:
+                self.stack[-1][2] += elapsed
+
+    def start(self):
+        self.started = time.perf_counter()
+        sys.setprofile(self._callback)
+
+    def stop(self):
+        sys.setprofile(None)
+        self.duration = time.perf_counter() - self.started
+
+    def collapsed(self):
+        """'a;b;c <마이크로초>' 형식의 collapsed stack 문자열"""
+        lines = []
+        for path, seconds in self.self_times.most_common():
+            micros = int(seconds * 1_000_000)
+            if micros > 0:
+                lines.append(f"{path} {micros}")
+        return "\n".join(lines) + "\n"
+
+
+def _secret_matches(value):
+    secret = current_app.config["PROFILING_SECRET"]
+    return bool(secret and value and hmac.compare_digest(value, secret))
+
+
+def _should_profile():
+    if request.blueprint in EXCLUDED_BLUEPRINTS or sys.getprofile() is not None:
+        return None
+
+    if _secret_matches(request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_QUERY_ARG)):
+        return "on-demand"
+
+    sample_rate = current_app.config["PROFILE_SAMPLE_RATE"]
+    if sample_rate > 0 and next(_request_counter) % sample_rate == 0:
+        return "sampled"
+
+    return None
+
+
+def _before_request():
+    mode = _should_profile()
+    if mode is None:
+        return
+
+    # 쿼리 통계가 꺼져 있어도 프로파일링 중인 요청의 쿼리는 기록
+    g.force_query_stats = True
+    own_stats = getattr(request, "query_stats", None) is None
+    request.profile = {
+        "mode": mode,
+        "stats": query_stats.start_request_stats() if own_stats else request.query_stats,
+        "own_stats": own_stats,
+        "profiler": StackProfiler()
+    }
+    request.profile["profiler"].start()
+
+
+def _finish_profile():
+    profile = getattr(request, "profile", None)
+    if profile is None:
+        return None
+    request.profile = None
+
+    profile["profiler"].stop()
+    stats = profile["stats"]
+    if profile["own_stats"]:
+        query_stats.stop_request_stats()
+    return profile, stats
+
+
+def _report_path():
+    """보고서/로그에 남길 경로. ?__profile=<PROFILING_SECRET>이 저장되지 않도록 그 인자만 빼고 쿼리 문자열을 다시 만듦"""
+    args = [(key, value) for key, value in request.args.items(multi=True) if key != PROFILE_QUERY_ARG]
+    return f"{request.path}?{urlencode(args)}" if args else request.path
+
+
+def _after_request(response):
+    finished = _finish_profile()
+    if finished is None:
+        return response
+    profile, stats = finished
+
+    profile_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    user = getattr(request, "user", None) or {}
+    report = {
+        "id": profile_id,
+        "mode": profile["mode"],
+        "method": request.method,
+        "path": _report_path(),
+        "route": request.url_rule.rule if request.url_rule else None,
+        "user_id": user.get("id"),
+        "status": response.status_code,
+        "duration_ms": round(profile["profiler"].duration * 1000, 3),
+        "queries": stats.summary()
+    }
+
+    try:
+        profile_dir = current_app.config["PROFILE_DIR"]
+        os.makedirs(profile_dir, exist_ok=True)
+        with open(os.path.join(profile_dir, f"{profile_id}.collapsed"), "w", encoding="utf-8") as f:
+            f.write(profile["profiler"].collapsed())
+        with open(os.path.join(profile_dir, f"{profile_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        current_app.logger.warning("Failed to store profile %s: %s", profile_id, e)
+        return response
+
+    current_app.logger.info("Stored %s profile %s for %s", profile["mode"], profile_id, report["path"])
+    response.headers["X-Profile-Id"] = profile_id
+    return response
+
+
+def _teardown_request(e=None):
+    # 예외로 after_request가 실행되지 않은 경우에도 프로파일러를 해제
+    _finish_profile()
+
+
+def init_app(app):
+    app.config.setdefault("PROFILING_SECRET", os.getenv("PROFILING_SECRET"))
+    app.config.setdefault("PROFILE_SAMPLE_RATE", int(os.getenv("PROFILE_SAMPLE_RATE", "0")))
+    app.config.setdefault("PROFILE_DIR", os.getenv("PROFILE_DIR", "profiles_output"))
+
+    if not app.config["PROFILING_SECRET"] and app.config["PROFILE_SAMPLE_RATE"] <= 0:
+        return
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+
+
+# ==================================================
+#   저장된 프로파일 조회 API (GET /profiling/<profile_id>)
+# ==================================================
+@profiling_bp.route("/<string:profile_id>", methods=["GET"])
+def get_profile(profile_id):
+    if not _secret_matches(request.headers.get(PROFILE_HEADER)):
+        return jsonify({"message": "unauthorized"}), 401
+
+    if not PROFILE_ID_RE.match(profile_id):
+        return jsonify({"message": "invalid profile id"}), 400
+
+    profile_dir = current_app.config["PROFILE_DIR"]
+    try:
+        with open(os.path.join(profile_dir, f"{profile_id}.json"), encoding="utf-8") as f:
+            report = json.load(f)
+        with open(os.path.join(profile_dir, f"{profile_id}.collapsed"), encoding="utf-8") as f:
+            collapsed = f.read()
+    except FileNotFoundError:
+        return jsonify({"message": "profile not found"}), 404
+
+    # ?format=collapsed 이면 flamegraph 도구에 바로 넣을 수 있는 텍스트만 반환
+    if request.args.get("format") == "collapsed":
+        return collapsed, 200, {"Content-Type": "text/plain; charset=utf-8"}
+
+    report["collapsed"] = collapsed
+    return jsonify({"message": "success", "profile": report}), 200
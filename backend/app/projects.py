@@ -1,8 +1,18 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from app.db import get_db
 import os
-from .auth import token_required # auth.py에서 데코레이터 가져오기
+import io
+import csv
+import json
+import datetime
+from psycopg2.extras import execute_values
+from .auth import token_required, is_admin # auth.py에서 데코레이터 가져오기
 from .utils import format_records # 데이터 포맷팅 유틸리티 가져오기
+from . import purge
+from . import semantic
+from . import autocomplete
+from . import geo
+from . import popularity
 import traceback # traceback 모듈 임포트
 from dotenv import load_dotenv
 
@@ -14,6 +24,26 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY must be set in environment variables")
 
+# POST /projects/bulk 한 번에 등록할 수 있는 최대 행 수
+PROJECTS_BULK_MAX_ROWS = int(os.getenv("PROJECTS_BULK_MAX_ROWS", "1000"))
+# GET /projects/export 가 COPY 한 번으로 내보내는 행 수 (응답은 이 단위로 스트리밍)
+PROJECTS_EXPORT_CHUNK_ROWS = int(os.getenv("PROJECTS_EXPORT_CHUNK_ROWS", "5000"))
+
+# 일괄 등록에서 받을 수 있는 컬럼과 길이 제한 (projects 테이블 정의와 같음)
+BULK_FIELDS = ["title", "description", "location", "salary", "duration", "required_skills", "status"]
+FIELD_MAX_LENGTHS = {"title": 200, "location": 200, "salary": 100, "duration": 100}
+PROJECT_STATUSES = ("OPEN", "CLOSED", "IN_PROGRESS", "COMPLETED")
+# 검증 실패 시 응답에 담을 최대 오류 행 수
+MAX_REPORTED_ERRORS = 100
+
+# 사장님이 입력한 텍스트 열은 엑셀이 수식으로 해석하지 않도록 =, +, -, @ 로 시작하면 앞에 '를 붙임 (지원자 내보내기의 _csv_cell과 같은 규칙)
+EXPORT_TEXT_COLUMNS = ["title", "description", "location", "salary", "duration", "required_skills"]
+EXPORT_COLUMNS = ", ".join(
+    ["id", "business_id"]
+    + [f"CASE WHEN {column} ~ '^[=+@-]' THEN '''' || {column} ELSE {column} END AS {column}" for column in EXPORT_TEXT_COLUMNS]
+    + ["status", "created_at", "updated_at"]
+)
+
 
 
 # ============================
@@ -45,9 +75,12 @@ def create_project():
         conn = get_db()
         cursor = conn.cursor()
 
+        # 반경 검색용 좌표 (위치를 찾지 못하면 사장님 주소 좌표)
+        coords = geo.geocode(location) or geo.business_coordinates(cursor, request.user["id"]) or (None, None)
+
         sql = """
-        INSERT INTO projects (business_id, title, description, location, salary, duration, required_skills)
-        VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id
+        INSERT INTO projects (business_id, title, description, location, salary, duration, required_skills, latitude, longitude)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id
         """
         cursor.execute(sql, (
             request.user["id"],
@@ -56,12 +89,19 @@ def create_project():
             location,
             salary,
             duration,
-            required_skills
+            required_skills,
+            *coords
         ))
 
         conn.commit()
         project_id = cursor.fetchone()[0] # DictRow가 아닌 경우를 대비해 인덱스로 접근
 
+        # 의미 검색 인덱스에 새 프로젝트 추가
+        semantic.index_project(project_id, {"title": title, "description": description, "required_skills": required_skills})
+        # 자동완성 인덱스의 기술/지역 빈도 반영
+        autocomplete.add_skills(required_skills)
+        autocomplete.add_location(location)
+
         return jsonify({
             "message": "project created successfully",
             "project_id": project_id
@@ -77,6 +117,227 @@ def create_project():
             cursor.close()
 
 
+# ============================
+#   프로젝트 일괄 등록 API (사장님만 가능)
+# ============================
+def _parse_bulk_rows(body, content_type):
+    """
+    요청 본문을 (줄 번호, 행 dict) 목록으로 변환합니다.
+    Content-Type이 text/csv면 헤더가 있는 CSV, 그 외에는 JSON Lines(한 줄에 객체 하나)로 읽습니다.
+    형식 자체가 잘못되었으면 ValueError를 발생시킵니다.
+    """
+    text = body.decode("utf-8-sig")
+    rows = []
+
+    if "csv" in content_type:
+        reader = csv.DictReader(io.StringIO(text, newline=""))
+        unknown = [name for name in (reader.fieldnames or []) if name not in BULK_FIELDS]
+        if not reader.fieldnames:
+            raise ValueError("CSV header is missing")
+        if unknown:
+            raise ValueError(f"unknown columns: {', '.join(unknown)}")
+        for row in reader:
+            if None in row:
+                raise ValueError(f"line {reader.line_num}: too many values")
+            rows.append((reader.line_num, row))
+        return rows
+
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {line_no}: invalid JSON ({e.msg})")
+        if not isinstance(row, dict):
+            raise ValueError(f"line {line_no}: each line must be a JSON object")
+        rows.append((line_no, row))
+    return rows
+
+
+def _validate_bulk_row(row):
+    """행 하나를 검증하고 (INSERT 값 목록, 오류 목록)을 반환"""
+    errors = []
+    values = []
+
+    unknown = [key for key in row if key not in BULK_FIELDS]
+    if unknown:
+        errors.append(f"unknown fields: {', '.join(unknown)}")
+
+    for field in BULK_FIELDS:
+        value = row.get(field)
+        # JSON에서는 기술 목록을 배열로 보내도 쉼표 구분 문자열로 저장
+        if field == "required_skills" and isinstance(value, list):
+            value = ", ".join(str(skill).strip() for skill in value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = str(value)
+        if value is not None and not isinstance(value, str):
+            errors.append(f"{field} must be a string")
+            value = None
+        if isinstance(value, str):
+            value = value.strip() or None
+        if value and field in FIELD_MAX_LENGTHS and len(value) > FIELD_MAX_LENGTHS[field]:
+            errors.append(f"{field} must be at most {FIELD_MAX_LENGTHS[field]} characters")
+        values.append(value)
+
+    title, description, status = values[0], values[1], values[6]
+    if not title or not description:
+        errors.append("title and description are required")
+    if status is None:
+        values[6] = "OPEN"
+    elif status not in PROJECT_STATUSES:
+        errors.append(f"status must be one of {', '.join(PROJECT_STATUSES)}")
+
+    return values, errors
+
+
+@projects_bp.route("/bulk", methods=["POST"])
+@token_required
+def create_projects_bulk():
+    # 사장님만 프로젝트 등록 가능
+    if request.user.get("role") != "BUSINESS":
+        return jsonify({"message": "only business users can create projects"}), 403
+
+    try:
+        parsed = _parse_bulk_rows(request.get_data(), request.content_type or "")
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"message": f"invalid bulk body: {e}"}), 400
+
+    if not parsed:
+        return jsonify({"message": "no projects to create"}), 400
+    if len(parsed) > PROJECTS_BULK_MAX_ROWS:
+        return jsonify({"message": f"too many projects (max {PROJECTS_BULK_MAX_ROWS})"}), 400
+
+    # 모든 행을 먼저 검증하고, 하나라도 잘못되면 아무것도 등록하지 않음
+    rows = []
+    row_errors = []
+    for line_no, row in parsed:
+        values, errors = _validate_bulk_row(row)
+        if errors:
+            row_errors.append({"line": line_no, "errors": errors})
+        rows.append([request.user["id"]] + values)
+
+    if row_errors:
+        return jsonify({
+            "message": "validation failed",
+            "error_count": len(row_errors),
+            "errors": row_errors[:MAX_REPORTED_ERRORS]
+        }), 400
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        # 반경 검색용 좌표 (위치를 찾지 못한 행은 사장님 주소 좌표)
+        fallback = geo.business_coordinates(cursor, request.user["id"]) or (None, None)
+        values = [row + list(geo.geocode(row[3]) or fallback) for row in rows]
+
+        # 전체 행을 다중 VALUES INSERT 한 문장으로 등록 (행마다 왕복/커밋하지 않음)
+        inserted = execute_values(cursor, """
+            INSERT INTO projects (business_id, title, description, location, salary, duration, required_skills, status, latitude, longitude)
+            VALUES %s RETURNING id
+        """, values, page_size=len(values), fetch=True)
+        conn.commit()
+
+        # 의미 검색 인덱스에 새 프로젝트 추가
+        for (project_id,), row in zip(inserted, rows):
+            semantic.index_project(project_id, {"title": row[1], "description": row[2], "required_skills": row[6]})
+            autocomplete.add_skills(row[6])
+            autocomplete.add_location(row[3])
+
+        return jsonify({
+            "message": "projects created successfully",
+            "count": len(inserted),
+            "project_ids": [row[0] for row in inserted]
+        }), 201
+
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        return jsonify({"message": "Failed to create projects"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+
+# ============================
+#   프로젝트 내보내기 API (작성자 또는 관리자)
+# ============================
+def _export_chunks(conn, where_sql, params):
+    """
+    COPY ... TO STDOUT 결과를 PROJECTS_EXPORT_CHUNK_ROWS행 단위 CSV 조각으로 생성합니다.
+    copy_expert는 끝날 때까지 반환하지 않으므로 id 구간(keyset)으로 나눠 조각마다 COPY를 실행하고,
+    서버 메모리에는 한 조각만 올라갑니다.
+    """
+    cursor = conn.cursor()
+    last_id = 0
+    header = True
+    try:
+        while True:
+            # 이번 조각의 마지막 id (없으면 남은 행이 한 조각 이하)
+            cursor.execute(f"""
+                SELECT id FROM projects WHERE {where_sql} AND id > %s
+                ORDER BY id OFFSET %s LIMIT 1
+            """, params + [last_id, PROJECTS_EXPORT_CHUNK_ROWS - 1])
+            row = cursor.fetchone()
+            upper_id = row[0] if row else None
+
+            query = f"SELECT {EXPORT_COLUMNS} FROM projects WHERE {where_sql} AND id > %s"
+            query_params = params + [last_id]
+            if upper_id is not None:
+                query += " AND id <= %s"
+                query_params.append(upper_id)
+            query = cursor.mogrify(query + " ORDER BY id", query_params).decode()
+
+            buffer = io.BytesIO()
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv{', HEADER' if header else ''})", buffer)
+            yield buffer.getvalue()
+
+            if upper_id is None:
+                break
+            last_id = upper_id
+            header = False
+    finally:
+        cursor.close()
+
+
+@projects_bp.route("/export", methods=["GET"])
+@token_required
+def export_projects():
+    # 사장님은 자기 프로젝트, 관리자는 전체(또는 ?business_id=) 프로젝트를 내보낼 수 있음
+    admin = is_admin(request.user)
+    if not admin and request.user.get("role") != "BUSINESS":
+        return jsonify({"message": "unauthorized"}), 403
+
+    where_sql = "deleted_at IS NULL"
+    params = []
+    if not admin:
+        where_sql += " AND business_id = %s"
+        params.append(request.user["id"])
+    elif request.args.get("business_id"):
+        try:
+            params.append(int(request.args["business_id"]))
+        except ValueError:
+            return jsonify({"message": "business_id must be an integer"}), 400
+        where_sql += " AND business_id = %s"
+
+    try:
+        conn = get_db()
+    except Exception as e:
+        return jsonify({"message": "Failed to export projects"}), 500
+
+    filename = f"projects-{datetime.date.today():%Y%m%d}.csv"
+    return Response(
+        stream_with_context(_export_chunks(conn, where_sql, params)),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
 # ============================
 #   프로젝트 목록 조회 API (누구나 가능)
 # ============================
@@ -92,32 +353,74 @@ def get_projects():
         # 쿼리 파라미터로 필터링 (선택사항)
         status = request.args.get("status", "OPEN")  # 기본값: OPEN
         location = request.args.get("location")
+        near = request.args.get("near")  # "위도,경도" 또는 지명 (예: 강남구)
+        sort = request.args.get("sort", "distance" if near else "latest")  # latest | popular | distance(near와 함께)
+
+        if sort not in ("latest", "popular", "distance") or (sort == "distance" and not near):
+            return jsonify({"message": "sort must be latest, popular or distance (with near)"}), 400
+
+        center = None
+        distance_column = ""
+        if near:
+            try:
+                center = geo.parse_near(near)
+            except ValueError as e:
+                return jsonify({"message": str(e)}), 400
+            try:
+                radius_km = float(request.args.get("radius_km", geo.GEO_RADIUS_KM_DEFAULT))
+            except ValueError:
+                return jsonify({"message": "radius_km must be a number"}), 400
+            if not 0 < radius_km <= geo.GEO_RADIUS_KM_MAX:
+                return jsonify({"message": f"radius_km must be between 0 and {geo.GEO_RADIUS_KM_MAX:g}"}), 400
+            # 기준점까지 거리(km)를 응답에 포함
+            distance_column = ", ROUND(geo_distance_km(%s, %s, p.latitude, p.longitude)::numeric, 2)::float AS distance_km"
 
         # 기본 쿼리
-        sql = """
+        sql = f"""
         SELECT
             p.*,
             b.business_name,
-            b.address as business_address
+            b.address as business_address{distance_column}
         FROM projects p
         LEFT JOIN users u ON p.business_id = u.id
         LEFT JOIN businesses b ON u.id = b.user_id
-        WHERE p.status = %s
+        WHERE p.status = %s AND p.deleted_at IS NULL
         """
-        params = [status]
+        params = list(center or []) + [status]
 
         # 지역 필터 추가
         if location:
             sql += " AND p.location LIKE %s"
             params.append(f"%{location}%")
 
-        sql += " ORDER BY p.created_at DESC"
+        # 반경 필터: 반경을 감싸는 사각형으로 GiST 인덱스(idx_projects_geo)에서 후보를 찾고 정확한 거리로 거름
+        if center:
+            sql += """
+            AND p.latitude IS NOT NULL
+            AND point(p.longitude, p.latitude) <@ box(point(%s, %s), point(%s, %s))
+            AND geo_distance_km(%s, %s, p.latitude, p.longitude) <= %s
+            """
+            params.extend(geo.bounding_box(*center, radius_km))
+            params.extend([*center, radius_km])
+
+        if sort == "distance":
+            sql += " ORDER BY distance_km, p.id"
+        elif sort == "popular":
+            # 인기순: idx_projects_status_popularity 순서 그대로 읽음 (활동이 없는 프로젝트는 최신순으로 뒤에)
+            sql += " ORDER BY p.popularity_score DESC NULLS LAST, p.id DESC"
+        else:
+            sql += " ORDER BY p.created_at DESC"
 
         cursor.execute(sql, params)
         projects = cursor.fetchall()
 
         # 모든 레코드의 None 값을 빈 문자열로, datetime을 문자열로 변환
         formatted_projects = format_records(projects)
+        # 저장된 로그 점수 대신 현재 시점의 인기도(감쇠된 조회/지원 가중치 합)를 함께 전달
+        # (format_records가 NULL을 ""로 바꾸므로 ""만 활동 없음으로 봄. 0.0은 실제 점수)
+        for project in formatted_projects:
+            score = project["popularity_score"]
+            project["popularity"] = round(popularity.current_popularity(None if score == "" else score), 2)
 
         return jsonify({
             "message": "success",
@@ -161,7 +464,7 @@ def get_my_projects():
         JOIN users u ON p.business_id = u.id
         JOIN businesses b ON u.id = b.user_id
         LEFT JOIN applications a ON p.id = a.project_id
-        WHERE p.business_id = %s
+        WHERE p.business_id = %s AND p.deleted_at IS NULL
         GROUP BY p.id, b.business_name, b.address
         """
         cursor.execute(sql, (request.user["id"],))
@@ -206,7 +509,7 @@ def get_project_detail(project_id):
         FROM projects p
         LEFT JOIN users u ON p.business_id = u.id
         LEFT JOIN businesses b ON u.id = b.user_id
-        WHERE p.id = %s
+        WHERE p.id = %s AND p.deleted_at IS NULL
         """
         cursor.execute(sql, (project_id,))
         project = cursor.fetchone()
@@ -218,6 +521,9 @@ def get_project_detail(project_id):
         # 결과 리스트에서 첫 번째 항목을 다시 추출합니다.
         formatted_project = format_records([project])[0]
 
+        # 조회수는 메모리에서만 올리고 주기적으로 한 번에 반영
+        popularity.record_view(project_id)
+
         return jsonify({
             "message": "success",
             "project": formatted_project
@@ -248,7 +554,7 @@ def update_project(project_id):
         cursor = conn.cursor()
 
         # 프로젝트 소유자 확인
-        cursor.execute("SELECT business_id FROM projects WHERE id = %s", (project_id,))
+        cursor.execute("SELECT business_id FROM projects WHERE id = %s AND deleted_at IS NULL", (project_id,))
         project = cursor.fetchone()
 
         if not project:
@@ -272,12 +578,29 @@ def update_project(project_id):
         if not update_fields:
             return jsonify({"message": "no fields to update"}), 400
 
+        # 위치가 바뀌면 반경 검색용 좌표도 다시 계산
+        if "location" in data:
+            update_fields.append("latitude = %s, longitude = %s")
+            params.extend(geo.geocode(data["location"]) or geo.business_coordinates(cursor, request.user["id"]) or (None, None))
+
         params.append(project_id)
-        sql = f"UPDATE projects SET {', '.join(update_fields)} WHERE id = %s"
+        sql = f"""
+        UPDATE projects SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP WHERE id = %s
+        RETURNING title, description, required_skills
+        """
 
         cursor.execute(sql, params)
+        updated_project = cursor.fetchone()
         conn.commit()
 
+        # 의미 검색 인덱스에 바뀐 내용 반영
+        semantic.index_project(project_id, updated_project)
+        # 새로 입력된 기술/지역은 자동완성에 바로 반영 (줄어든 빈도는 주기적 재생성 때 반영)
+        if "required_skills" in data:
+            autocomplete.add_skills(data["required_skills"])
+        if "location" in data:
+            autocomplete.add_location(data["location"])
+
         return jsonify({"message": "project updated successfully"}), 200
 
     except Exception as e:
@@ -304,7 +627,7 @@ def delete_project(project_id):
         cursor = conn.cursor()
 
         # 프로젝트 소유자 확인
-        cursor.execute("SELECT business_id FROM projects WHERE id = %s", (project_id,))
+        cursor.execute("SELECT business_id FROM projects WHERE id = %s AND deleted_at IS NULL", (project_id,))
         project = cursor.fetchone()
 
         if not project:
@@ -313,10 +636,14 @@ def delete_project(project_id):
         if project["business_id"] != request.user["id"]:
             return jsonify({"message": "unauthorized"}), 403
 
-        cursor.execute("DELETE FROM projects WHERE id = %s", (project_id,))
+        # 즉시 숨기고 지원서 등 딸린 데이터는 백그라운드 작업이 나눠서 삭제
+        cursor.execute("UPDATE projects SET deleted_at = CURRENT_TIMESTAMP WHERE id = %s", (project_id,))
+        job_id = purge.request_purge(cursor, "PROJECT", project_id, request.user["id"])
         conn.commit()
 
-        return jsonify({"message": "project deleted successfully"}), 200
+        semantic.index_project(project_id, None)
+
+        return purge.purge_response(job_id, "project deletion scheduled")
 
     except Exception as e:
         if conn:
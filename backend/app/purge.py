@@ -0,0 +1,244 @@
+"""
+채팅방/프로젝트 비동기 삭제
+삭제 API는 deleted_at을 기록해 즉시 숨기고 purge_jobs에 작업만 등록한 뒤 바로 응답합니다.
+백그라운드 작업자가 딸린 행(메시지, 지원서)을 PURGE_BATCH_SIZE개씩 지우고 배치마다 커밋/대기하여
+한 번에 오래 잠금을 잡거나 WAL을 몰아서 만들지 않습니다. 진행 상황은 GET /purge-jobs/<id>로 확인합니다.
+
+서버(main.py)가 작업자를 실행하며, 대기 중인 작업을 직접 처리할 수도 있습니다.
+    python -m app.purge
+"""
+from flask import Blueprint, request, jsonify
+from app.db import get_db
+from .auth import token_required
+from .utils import format_records
+from . import message_archive
+import logging
+import os
+import sys
+import time
+import psycopg2
+from psycopg2.extras import DictCursor
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+purge_bp = Blueprint("purge", __name__)
+
+# 한 번에 지울 행 수와 배치 사이 대기 시간(초)
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "1000"))
+PURGE_BATCH_PAUSE = float(os.getenv("PURGE_BATCH_PAUSE", "0.1"))
+# 처리할 작업이 없을 때 다시 확인하는 주기(초, 0이면 작업자를 띄우지 않음)
+PURGE_POLL_INTERVAL = float(os.getenv("PURGE_POLL_INTERVAL", "2"))
+# RUNNING 상태로 이 시간(초) 동안 진행이 없으면 작업자가 죽은 것으로 보고 다시 가져감
+PURGE_STALE_SECONDS = int(os.getenv("PURGE_STALE_SECONDS", "300"))
+
+# 대상 종류별 (대상 테이블, [(딸린 테이블, 외래키 컬럼, 행을 식별하는 키 컬럼)])
+# 딸린 테이블을 먼저 배치로 비운 뒤 대상 행을 지우므로 마지막 DELETE의 CASCADE는 거의 일이 없습니다.
+PURGE_TARGETS = {
+    "PROJECT": ("projects", [("applications", "project_id", "id")]),
+    "CHAT_ROOM": ("chat_rooms", [("messages", "room_id", "id, created_at")]),
+}
+
+
+def request_purge(cursor, target_type, target_id, user_id):
+    """삭제 작업을 등록하고 작업 id를 반환. 실패했던 작업은 다시 대기 상태로 돌립니다."""
+    cursor.execute("""
+        INSERT INTO purge_jobs (target_type, target_id, requested_by) VALUES (%s, %s, %s)
+        ON CONFLICT (target_type, target_id) DO UPDATE
+        SET status = CASE WHEN purge_jobs.status = 'FAILED' THEN 'PENDING' ELSE purge_jobs.status END,
+            error = NULL,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING id
+    """, (target_type, target_id, user_id))
+    return cursor.fetchone()[0]
+
+
+def purge_response(job_id, message):
+    """삭제 API 공통 응답 (202 Accepted)"""
+    return jsonify({
+        "message": message,
+        "job_id": job_id,
+        "status_url": f"/purge-jobs/{job_id}"
+    }), 202
+
+
+# ==================================================
+#   작업자
+# ==================================================
+def claim_job(conn):
+    """대기 중이거나 멈춘 작업 하나를 RUNNING으로 바꾸고 반환. 여러 작업자가 같은 작업을 가져가지 않도록 SKIP LOCKED 사용"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE purge_jobs
+        SET status = 'RUNNING',
+            started_at = COALESCE(started_at, CURRENT_TIMESTAMP),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = (
+            SELECT id FROM purge_jobs
+            WHERE status = 'PENDING'
+               OR (status = 'RUNNING' AND updated_at < CURRENT_TIMESTAMP - make_interval(secs => %s))
+            ORDER BY id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING id, target_type, target_id, total_rows
+    """, (PURGE_STALE_SECONDS,))
+    job = cursor.fetchone()
+    conn.commit()
+    cursor.close()
+    return job
+
+
+def _count_rows(cursor, children, target_id):
+    total = 0
+    for table, foreign_key, _ in children:
+        cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE {foreign_key} = %s", (target_id,))
+        total += cursor.fetchone()[0]
+    return total
+
+
+def run_job(conn, job):
+    """딸린 행을 배치로 지우고 마지막에 대상 행을 삭제. 배치마다 진행 상황을 기록합니다."""
+    job_id, target_type, target_id = job["id"], job["target_type"], job["target_id"]
+    table, children = PURGE_TARGETS[target_type]
+    cursor = conn.cursor()
+
+    if job["total_rows"] is None:
+        cursor.execute("UPDATE purge_jobs SET total_rows = %s WHERE id = %s", (_count_rows(cursor, children, target_id), job_id))
+        conn.commit()
+
+    for child, foreign_key, key in children:
+        while True:
+            cursor.execute(f"""
+                DELETE FROM {child} WHERE ({key}) IN (
+                    SELECT {key} FROM {child} WHERE {foreign_key} = %s LIMIT %s
+                )
+            """, (target_id, PURGE_BATCH_SIZE))
+            deleted = cursor.rowcount
+            cursor.execute("""
+                UPDATE purge_jobs SET deleted_rows = deleted_rows + %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s
+            """, (deleted, job_id))
+            conn.commit()
+            if deleted < PURGE_BATCH_SIZE:
+                break
+            time.sleep(PURGE_BATCH_PAUSE)
+
+    archive_paths = []
+    if target_type == "CHAT_ROOM":
+        cursor.execute("SELECT path FROM message_archives WHERE room_id = %s", (target_id,))
+        archive_paths = [row[0] for row in cursor.fetchall()]
+
+    cursor.execute(f"DELETE FROM {table} WHERE id = %s AND deleted_at IS NOT NULL", (target_id,))
+    cursor.execute("""
+        UPDATE purge_jobs SET status = 'DONE', finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP WHERE id = %s
+    """, (job_id,))
+    conn.commit()
+    cursor.close()
+    message_archive.delete_archive_files(archive_paths)
+
+
+def fail_job(conn, job_id, error):
+    conn.rollback()
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE purge_jobs SET status = 'FAILED', error = %s, finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+        WHERE id = %s
+    """, (str(error)[:1000], job_id))
+    conn.commit()
+    cursor.close()
+
+
+def process_pending(database_url):
+    """대기 중인 작업을 모두 처리하고 처리한 작업 수를 반환"""
+    conn = psycopg2.connect(database_url, cursor_factory=DictCursor)
+    processed = 0
+    try:
+        while True:
+            job = claim_job(conn)
+            if job is None:
+                return processed
+            try:
+                run_job(conn, job)
+            except Exception as e:
+                logger.exception(f"purge job {job['id']} failed")
+                fail_job(conn, job["id"], e)
+            processed += 1
+    finally:
+        conn.close()
+
+
+def start_worker(socketio):
+    """PURGE_POLL_INTERVAL초마다 대기 중인 삭제 작업을 처리하는 백그라운드 작업 시작"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or PURGE_POLL_INTERVAL <= 0:
+        return
+
+    def loop():
+        while True:
+            try:
+                process_pending(database_url)
+            except Exception:
+                logger.exception("purge worker failed")
+            socketio.sleep(PURGE_POLL_INTERVAL)
+
+    socketio.start_background_task(loop)
+
+
+# ==================================================
+#   삭제 작업 진행 상황 조회 API (GET /purge-jobs/<job_id>)
+# ==================================================
+@purge_bp.route("/<int:job_id>", methods=["GET"])
+@token_required
+def get_purge_job(job_id):
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT id, target_type, target_id, requested_by, status, total_rows, deleted_rows, error,
+                   created_at, started_at, finished_at, updated_at
+            FROM purge_jobs WHERE id = %s
+        """, (job_id,))
+        job = cursor.fetchone()
+
+        if not job:
+            return jsonify({"message": "purge job not found"}), 404
+
+        if job["requested_by"] != request.user["id"]:
+            return jsonify({"message": "unauthorized"}), 403
+
+        formatted_job = format_records(job)
+        if job["status"] == "DONE":
+            formatted_job["progress"] = 100
+        elif job["total_rows"]:
+            formatted_job["progress"] = min(99, round(100 * job["deleted_rows"] / job["total_rows"]))
+        else:
+            formatted_job["progress"] = 0
+
+        return jsonify({
+            "message": "success",
+            "job": formatted_job
+        }), 200
+
+    except Exception as e:
+        return jsonify({"message": "Failed to fetch purge job"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def main():
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        sys.exit("❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.")
+    print(f"✅ 삭제 작업 {process_pending(database_url)}건 처리")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+요청별 SQL 실행 통계 수집 (쿼리 수, 총 DB 시간, 가장 느린 쿼리, N+1 감지)
+QUERY_STATS_ENABLED가 꺼져 있으면 훅과 커서 래핑을 모두 건너뛰므로 오버헤드가 없습니다.
+"""
+from flask import current_app, g, request, has_app_context
+from psycopg2.extras import DictCursor
+from collections import Counter
+import psycopg2.extensions
+import os
+import re
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 요청 하나에서 보관할 최대 쿼리 기록 수
+MAX_RECORDED_STATEMENTS = 1000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def statement_shape(sql):
+    """파라미터와 리터럴을 제거한 쿼리 형태를 반환합니다. (같은 형태 반복 = N+1 후보)"""
+    if isinstance(sql, bytes):
+        sql = sql.decode("utf-8", "replace")
+    sql = _LITERAL_RE.sub("?", str(sql))
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+class QueryStats:
+    """요청 하나 동안 실행된 쿼리 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement = None
+        self.shapes = Counter()
+        self.statements = []
+
+    def record(self, shape, duration):
+        self.count += 1
+        self.total_time += duration
+        self.shapes[shape] += 1
+        if duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = shape
+        if len(self.statements) < MAX_RECORDED_STATEMENTS:
+            self.statements.append({"statement": shape, "duration_ms": round(duration * 1000, 3)})
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_time * 1000, 3),
+            "slowest_ms": round(self.slowest_time * 1000, 3),
+            "slowest_statement": self.slowest_statement,
+            "statements": self.statements
+        }
+
+
+def _record(sql, duration):
+    if not has_app_context():
+        return
+    active = g.get("active_query_stats")
+    if not active:
+        return
+    shape = statement_shape(sql)
+    for stats in active:
+        stats.record(shape, duration)
+
+
+class InstrumentedCursor(DictCursor):
+    """실행 시간을 현재 요청의 QueryStats에 기록하는 DictCursor"""
+
+    def _timed(self, method, sql, *args):
+        started = time.perf_counter()
+        try:
+            return method(sql, *args)
+        except Exception as e:
+            if has_app_context():
+                current_app.logger.warning("Query failed (%s): %s", e.__class__.__name__, statement_shape(sql))
+            raise
+        finally:
+            _record(sql, time.perf_counter() - started)
+
+    def execute(self, query, vars=None):
+        return self._timed(super().execute, query, vars)
+
+    def executemany(self, query, vars_list):
+        return self._timed(super().executemany, query, vars_list)
+
+    def copy_expert(self, sql, file, size=8192):
+        return self._timed(super().copy_expert, sql, file, size)
+
+
+class InstrumentedConnection(psycopg2.extensions.connection):
+    """DictCursor 요청을 InstrumentedCursor로 바꿔주는 연결 (cursor_factory를 직접 지정한 경우 포함)"""
+
+    def cursor(self, *args, **kwargs):
+        factory = kwargs.get("cursor_factory") or self.cursor_factory
+        if factory is DictCursor:
+            kwargs["cursor_factory"] = InstrumentedCursor
+        return super().cursor(*args, **kwargs)
+
+
+def is_enabled():
+    # 프로파일링 중인 요청(g.force_query_stats)은 설정과 무관하게 기록
+    return has_app_context() and (current_app.config.get("QUERY_STATS_ENABLED", False) or g.get("force_query_stats", False))
+
+
+def start_request_stats():
+    """현재 요청에 대한 QueryStats를 시작합니다. (/batch 하위 요청은 상위 요청 통계에도 합산)"""
+    stats = QueryStats()
+    g.setdefault("active_query_stats", []).append(stats)
+    request.query_stats = stats
+    return stats
+
+
+def stop_request_stats():
+    stats = getattr(request, "query_stats", None)
+    if stats is None:
+        return None
+    active = g.get("active_query_stats", [])
+    if stats in active:
+        active.remove(stats)
+    request.query_stats = None
+    return stats
+
+
+def _before_request():
+    start_request_stats()
+
+
+def _after_request(response):
+    stats = stop_request_stats()
+    if stats is None:
+        return response
+
+    timing = f'db;dur={stats.total_time * 1000:.1f};desc="{stats.count} queries"'
+    existing = response.headers.get("Server-Timing")
+    response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+    config = current_app.config
+    route = f"{request.method} {request.url_rule.rule if request.url_rule else request.path}"
+    if stats.count > config["QUERY_STATS_MAX_QUERIES"] or stats.total_time * 1000 > config["QUERY_STATS_SLOW_MS"]:
+        current_app.logger.warning(
+            "Slow DB usage on %s: %d queries, %.1fms total, slowest %.1fms: %s",
+            route, stats.count, stats.total_time * 1000, stats.slowest_time * 1000, stats.slowest_statement
+        )
+
+    for shape, repeats in stats.shapes.items():
+        if repeats >= config["QUERY_STATS_REPEAT_THRESHOLD"]:
+            current_app.logger.warning("Possible N+1 on %s: statement repeated %d times: %s", route, repeats, shape)
+
+    return response
+
+
+def _teardown_request(e=None):
+    stop_request_stats()
+
+
+def init_app(app):
+    """환경 변수에서 설정을 읽고, 활성화된 경우에만 요청 훅을 등록합니다."""
+    app.config.setdefault("QUERY_STATS_ENABLED", os.getenv("QUERY_STATS_ENABLED", "false").lower() == "true")
+    app.config.setdefault("QUERY_STATS_SLOW_MS", float(os.getenv("QUERY_STATS_SLOW_MS", "200")))
+    app.config.setdefault("QUERY_STATS_MAX_QUERIES", int(os.getenv("QUERY_STATS_MAX_QUERIES", "30")))
+    app.config.setdefault("QUERY_STATS_REPEAT_THRESHOLD", int(os.getenv("QUERY_STATS_REPEAT_THRESHOLD", "10")))
+
+    if not app.config["QUERY_STATS_ENABLED"]:
+        return
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
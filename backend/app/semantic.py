@@ -0,0 +1,504 @@
+"""
+로컬 의미 검색 (학생 프로필, 프로젝트)
+외부 모델 없이 CPU에서 바로 계산되는 해시 n-gram 벡터로 문서를 임베딩합니다.
+- 단어, 단어의 글자 2~3-gram(조사가 붙은 한국어 단어도 겹치도록), 동의어 사전의 개념 태그를
+  SEMANTIC_DIM 차원으로 해싱(signed hashing trick)한 뒤 L2 정규화
+- "프론트엔드"와 "React"처럼 철자가 다른 관련 단어는 SYNONYM_GROUPS의 같은 개념 태그로 묶여 가까워집니다.
+
+벡터는 float32 행렬 하나에 모아 두고 코사인(정규화된 내적) 상위 K개를 찾습니다.
+프로필/프로젝트 수정 API가 커밋 후 해당 행만 갱신하고, 백그라운드 작업이 updated_at 기준으로
+다른 프로세스에서 바뀐 행을 따라잡은 뒤 SEMANTIC_INDEX_DIR에 저장합니다. (0014의 인덱스로 바뀐 행만 읽음)
+저장된 인덱스는 np.load(mmap_mode="c")로 읽으므로 서버 시작 시 전체를 메모리로 복사하지 않습니다.
+
+검색 요청은 인덱스를 만들지 않습니다. 메모리에 없으면 디스크에 저장된 인덱스만 열고, 그것도 없으면 503을 반환합니다.
+인덱스 생성은 백그라운드 작업(start_sync)이 SEMANTIC_BUILD_BATCH행마다 다른 작업에 양보하며 하거나,
+배포 전에 아래 명령으로 미리 만들어 둡니다.
+
+인덱스를 처음부터 다시 만들려면:
+    python -m app.semantic
+"""
+from flask import Blueprint, request, jsonify
+from app.db import get_db
+from .utils import format_records
+import datetime
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import zlib
+import numpy as np
+import psycopg2
+from psycopg2.extras import DictCursor
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+semantic_bp = Blueprint("semantic", __name__)
+
+# 벡터 차원 수 (바꾸면 저장된 인덱스는 다시 만들어짐)
+SEMANTIC_DIM = int(os.getenv("SEMANTIC_DIM", "512"))
+SEMANTIC_INDEX_DIR = os.getenv("SEMANTIC_INDEX_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "semantic_index"))
+# 다른 프로세스의 변경을 따라잡고 디스크에 저장하는 주기(초, 0이면 끔)
+SEMANTIC_SYNC_INTERVAL = float(os.getenv("SEMANTIC_SYNC_INTERVAL", "60"))
+# 백그라운드 생성/동기화 시 이 행 수만큼 임베딩할 때마다 다른 작업(요청, 소켓)에 양보
+SEMANTIC_BUILD_BATCH = int(os.getenv("SEMANTIC_BUILD_BATCH", "500"))
+# GET /search/semantic 기본/최대 결과 수와 결과에 포함할 최소 유사도
+SEMANTIC_TOP_K = int(os.getenv("SEMANTIC_TOP_K", "10"))
+SEMANTIC_TOP_K_MAX = int(os.getenv("SEMANTIC_TOP_K_MAX", "50"))
+SEMANTIC_MIN_SCORE = float(os.getenv("SEMANTIC_MIN_SCORE", "0.05"))
+
+# 동기화 시 마지막 동기화 시각보다 이만큼(초) 앞부터 다시 읽음 (그 전에 시작해 늦게 커밋된 트랜잭션 대비)
+SYNC_OVERLAP_SECONDS = 300
+
+# 임베딩 방식(특징/가중치/동의어)을 바꾸면 올려서 저장된 인덱스를 무효화
+EMBEDDING_VERSION = 1
+
+WORD_WEIGHT = 1.0
+NGRAM_WEIGHT = 0.5
+CONCEPT_WEIGHT = 2.0
+
+# 같은 분야로 보는 단어 묶음. 한국어 별칭은 조사가 붙어도 찾도록 접두어로 비교합니다.
+SYNONYM_GROUPS = {
+    "frontend": ["프론트엔드", "프론트", "frontend", "front-end", "react", "리액트", "vue", "뷰", "javascript", "자바스크립트",
+                 "typescript", "타입스크립트", "html", "css", "웹퍼블리셔", "퍼블리싱", "next.js", "nextjs"],
+    "backend": ["백엔드", "backend", "back-end", "서버", "server", "node.js", "nodejs", "node", "django", "장고", "spring",
+                "스프링", "flask", "플라스크", "api", "java", "자바", "데이터베이스", "database", "db"],
+    "data": ["데이터", "data", "분석", "analysis", "analytics", "sql", "pandas", "엑셀", "excel", "통계", "statistics",
+             "머신러닝", "machine-learning", "ml", "ai", "인공지능", "python", "파이썬"],
+    "design": ["디자인", "design", "디자이너", "designer", "figma", "피그마", "photoshop", "포토샵", "illustrator",
+               "일러스트", "ui", "ux", "로고", "logo", "브랜딩", "branding"],
+    "marketing": ["마케팅", "marketing", "sns", "인스타그램", "instagram", "콘텐츠", "content", "홍보", "블로그", "blog",
+                  "광고", "advertising", "바이럴"],
+    "mobile": ["모바일", "mobile", "앱", "app", "android", "안드로이드", "ios", "flutter", "플러터", "kotlin", "코틀린",
+               "swift", "스위프트", "react-native"],
+    "video": ["영상", "video", "편집", "editing", "유튜브", "youtube", "premiere", "프리미어", "촬영", "after-effects", "애프터이펙트"],
+    "language": ["번역", "translation", "통역", "영어", "english", "일본어", "japanese", "중국어", "chinese"],
+}
+
+WORD_RE = re.compile(r"[\w.+#-]+")
+KOREAN_RE = re.compile(r"[가-힣]")
+
+
+def _build_alias_table():
+    exact = {}
+    prefixes = []
+    for concept, aliases in SYNONYM_GROUPS.items():
+        for alias in aliases:
+            alias = alias.lower()
+            exact.setdefault(alias, set()).add(concept)
+            if KOREAN_RE.search(alias) and len(alias) >= 2:
+                prefixes.append((alias, concept))
+    return exact, prefixes
+
+
+ALIAS_EXACT, ALIAS_PREFIXES = _build_alias_table()
+
+
+def _concepts(word):
+    concepts = set(ALIAS_EXACT.get(word, ()))
+    for alias, concept in ALIAS_PREFIXES:
+        if word.startswith(alias):
+            concepts.add(concept)
+    return concepts
+
+
+def _features(text, weight=1.0):
+    """텍스트를 (특징 문자열, 가중치) 목록으로 변환"""
+    features = []
+    for word in WORD_RE.findall((text or "").lower()):
+        word = word.strip(".-")
+        if not word:
+            continue
+        features.append((f"w:{word}", WORD_WEIGHT * weight))
+        padded = f"<{word}>"
+        for n in (2, 3):
+            for i in range(len(padded) - n + 1):
+                features.append((f"g:{padded[i:i + n]}", NGRAM_WEIGHT * weight))
+        for concept in _concepts(word):
+            features.append((f"c:{concept}", CONCEPT_WEIGHT * weight))
+    return features
+
+
+def embed(*weighted_texts):
+    """(텍스트, 가중치) 목록을 L2 정규화된 float32 벡터로 임베딩. 특징이 없으면 영벡터"""
+    vector = np.zeros(SEMANTIC_DIM, dtype=np.float32)
+    for text, weight in weighted_texts:
+        for feature, value in _features(text, weight):
+            # Python hash()는 프로세스마다 달라지므로 고정된 crc32 사용. 최상위 비트는 부호로 사용
+            hashed = zlib.crc32(feature.encode("utf-8"))
+            vector[hashed % SEMANTIC_DIM] += value if hashed & 0x80000000 else -value
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def embed_student(row):
+    return embed((row["introduction"], 1.0), (row["skills"], 2.0))
+
+
+def embed_project(row):
+    return embed((row["title"], 2.0), (row["required_skills"], 2.0), (row["description"], 1.0))
+
+
+# ==================================================
+#   벡터 인덱스
+# ==================================================
+class VectorIndex:
+    """id별 float32 벡터를 연속된 행렬에 담고 코사인 상위 K개를 찾는 인덱스"""
+
+    def __init__(self, name, ids=None, vectors=None, synced_at=None):
+        self.name = name
+        self.lock = threading.Lock()
+        self.ids = np.zeros(0, dtype=np.int64) if ids is None else ids
+        self.vectors = np.zeros((0, SEMANTIC_DIM), dtype=np.float32) if vectors is None else vectors
+        self.size = len(self.ids)
+        self.rows = {int(item_id): row for row, item_id in enumerate(self.ids[:self.size])}
+        self.synced_at = synced_at
+        self.dirty = False
+
+    def __len__(self):
+        return self.size
+
+    def _reserve(self, size):
+        """행렬 용량이 모자라면 두 배로 늘림 (mmap으로 읽은 배열도 이때 메모리로 복사됨)"""
+        if size <= len(self.ids):
+            return
+        capacity = max(size, len(self.ids) * 2, 64)
+        ids = np.zeros(capacity, dtype=np.int64)
+        vectors = np.zeros((capacity, SEMANTIC_DIM), dtype=np.float32)
+        ids[:self.size] = self.ids[:self.size]
+        vectors[:self.size] = self.vectors[:self.size]
+        self.ids, self.vectors = ids, vectors
+
+    def upsert(self, item_id, vector):
+        with self.lock:
+            row = self.rows.get(item_id)
+            if row is None:
+                self._reserve(self.size + 1)
+                row = self.size
+                self.size += 1
+                self.ids[row] = item_id
+                self.rows[item_id] = row
+            self.vectors[row] = vector
+            self.dirty = True
+
+    def remove(self, item_id):
+        """마지막 행을 지운 자리로 옮겨 행렬을 빈틈없이 유지"""
+        with self.lock:
+            row = self.rows.pop(item_id, None)
+            if row is None:
+                return
+            last = self.size - 1
+            if row != last:
+                moved_id = int(self.ids[last])
+                self.ids[row] = moved_id
+                self.vectors[row] = self.vectors[last]
+                self.rows[moved_id] = row
+            self.size = last
+            self.dirty = True
+
+    def search(self, query, k):
+        """[(id, 유사도)]를 유사도 높은 순으로 최대 k개 반환"""
+        with self.lock:
+            if self.size == 0 or k <= 0:
+                return []
+            scores = self.vectors[:self.size] @ query
+            k = min(k, self.size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(int(self.ids[row]), float(scores[row])) for row in top]
+
+    # ----- 저장/불러오기 -----
+    def _paths(self, directory):
+        base = os.path.join(directory, self.name)
+        return f"{base}.ids.npy", f"{base}.vectors.npy", f"{base}.meta.json"
+
+    def save(self, directory=None):
+        """임시 파일에 쓴 뒤 교체하므로 저장 중에 죽어도 이전 인덱스가 남습니다."""
+        directory = directory or SEMANTIC_INDEX_DIR
+        os.makedirs(directory, exist_ok=True)
+        with self.lock:
+            ids = np.array(self.ids[:self.size])
+            vectors = np.array(self.vectors[:self.size])
+            meta = {"dim": SEMANTIC_DIM, "version": EMBEDDING_VERSION, "count": self.size,
+                    "synced_at": self.synced_at.isoformat() if self.synced_at else None}
+            self.dirty = False
+        for path, value in zip(self._paths(directory), (ids, vectors, meta)):
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                if isinstance(value, dict):
+                    f.write(json.dumps(value).encode("utf-8"))
+                else:
+                    np.save(f, value)
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, name, directory=None):
+        """저장된 인덱스를 memory-map으로 열기. 없거나 차원/버전이 다르면 None"""
+        index = cls(name)
+        ids_path, vectors_path, meta_path = index._paths(directory or SEMANTIC_INDEX_DIR)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["dim"] != SEMANTIC_DIM or meta["version"] != EMBEDDING_VERSION:
+                return None
+            # mmap_mode="c": 읽기는 파일에서 바로, 쓰기는 프로세스 사본에만 반영 (copy-on-write)
+            ids = np.load(ids_path, mmap_mode="c")
+            vectors = np.load(vectors_path, mmap_mode="c")
+        except (OSError, ValueError, KeyError):
+            return None
+        if len(ids) != meta["count"] or vectors.shape != (meta["count"], SEMANTIC_DIM):
+            return None
+        synced_at = datetime.datetime.fromisoformat(meta["synced_at"]) if meta["synced_at"] else None
+        return cls(name, ids, vectors, synced_at)
+
+
+# 인덱스 종류별 (원본을 읽는 SQL, 임베딩 함수)
+# 공개 프로필/삭제되지 않은 프로젝트만 인덱스에 남기고, 나머지는 동기화 때 제거합니다.
+SOURCES = {
+    "students": ("""
+        SELECT user_id AS id, introduction, skills,
+               (is_profile_public IS TRUE AND introduction IS NOT NULL) AS searchable
+        FROM students
+    """, "updated_at", embed_student),
+    "projects": ("""
+        SELECT id, title, description, required_skills, deleted_at IS NULL AS searchable
+        FROM projects
+    """, "GREATEST(updated_at, deleted_at)", embed_project),
+}
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _sync_rows(cursor, index, since=None, pause=None):
+    """원본 행을 읽어 인덱스에 반영하고 반영한 행 수를 반환. since가 있으면 그 이후 바뀐 행만
+    pause가 있으면 SEMANTIC_BUILD_BATCH행마다 호출 (eventlet 워커 하나를 임베딩이 오래 붙잡지 않도록)"""
+    sql, changed_column, embed_row = SOURCES[index.name]
+    cursor.execute("SELECT CURRENT_TIMESTAMP::timestamp")
+    started_at = cursor.fetchone()[0]
+    if since is None:
+        cursor.execute(sql)
+    else:
+        cursor.execute(f"{sql} WHERE {changed_column} >= %s", (since - datetime.timedelta(seconds=SYNC_OVERLAP_SECONDS),))
+    count = 0
+    while True:
+        rows = cursor.fetchmany(SEMANTIC_BUILD_BATCH)
+        if not rows:
+            break
+        for row in rows:
+            if row["searchable"]:
+                index.upsert(row["id"], embed_row(row))
+            else:
+                index.remove(row["id"])
+        count += len(rows)
+        if pause:
+            pause()
+    index.synced_at = started_at
+    return count
+
+
+def build_index(conn, name, pause=None):
+    """DB 전체를 읽어 인덱스를 새로 만듭니다."""
+    index = VectorIndex(name)
+    cursor = conn.cursor(cursor_factory=DictCursor)
+    _sync_rows(cursor, index, pause=pause)
+    cursor.close()
+    conn.rollback()
+    return index
+
+
+def get_index(name, conn=None, pause=None):
+    """프로세스에 올라온 인덱스. 처음 호출 시 디스크에서 읽고(없으면 DB에서 생성) 그 뒤 바뀐 행을 반영합니다.
+    오래 걸릴 수 있으므로 백그라운드 작업/오프라인 빌드에서만 호출 (요청에서는 loaded_index)"""
+    index = _indexes.get(name)
+    if index is not None:
+        return index
+    with _indexes_lock:
+        if name in _indexes:
+            return _indexes[name]
+        own_conn = conn is None
+        conn = conn or psycopg2.connect(os.getenv("DATABASE_URL"))
+        try:
+            index = VectorIndex.load(name)
+            if index is None:
+                index = build_index(conn, name, pause)
+                index.save()
+            else:
+                cursor = conn.cursor(cursor_factory=DictCursor)
+                _sync_rows(cursor, index, index.synced_at, pause)
+                cursor.close()
+                conn.rollback()
+        finally:
+            if own_conn:
+                conn.close()
+        _indexes[name] = index
+        return index
+
+
+def loaded_index(name):
+    """요청에서 쓰는 인덱스. 메모리에 없으면 디스크에 저장된 인덱스만 열고(바뀐 행은 다음 동기화 때 반영),
+    그것도 없거나 백그라운드 작업이 만드는 중이면 None"""
+    index = _indexes.get(name)
+    if index is not None:
+        return index
+    if not _indexes_lock.acquire(blocking=False):
+        return None
+    try:
+        if name not in _indexes:
+            index = VectorIndex.load(name)
+            if index is None:
+                return None
+            _indexes[name] = index
+        return _indexes[name]
+    finally:
+        _indexes_lock.release()
+
+
+def _update_loaded(name, item_id, row, embed_row):
+    """이미 올라온 인덱스에만 반영 (아직 안 올라왔으면 나중에 DB에서 읽을 때 반영됨). 실패해도 요청에는 영향 없음"""
+    index = _indexes.get(name)
+    if index is None:
+        return
+    try:
+        if row is None:
+            index.remove(item_id)
+        else:
+            index.upsert(item_id, embed_row(row))
+    except Exception:
+        logger.exception(f"semantic index update failed: {name} {item_id}")
+
+
+def index_student(user_id, row):
+    """프로필 수정 커밋 후 호출. row는 introduction, skills, is_profile_public을 가진 행"""
+    searchable = row["is_profile_public"] is True and row["introduction"] is not None
+    _update_loaded("students", user_id, row if searchable else None, embed_student)
+
+
+def index_project(project_id, row):
+    """프로젝트 등록/수정 커밋 후 호출. row는 title, description, required_skills를 가진 행 (None이면 제거)"""
+    _update_loaded("projects", project_id, row, embed_project)
+
+
+def sync_all(database_url, pause=None):
+    """올라온 인덱스에 다른 프로세스의 변경을 반영하고 바뀐 인덱스를 저장"""
+    conn = psycopg2.connect(database_url, cursor_factory=DictCursor)
+    try:
+        for name in SOURCES:
+            index = get_index(name, conn, pause)
+            cursor = conn.cursor()
+            _sync_rows(cursor, index, index.synced_at, pause)
+            cursor.close()
+            conn.rollback()
+            if index.dirty:
+                index.save()
+    finally:
+        conn.close()
+
+
+def start_sync(socketio):
+    """SEMANTIC_SYNC_INTERVAL초마다 인덱스를 동기화/저장하는 백그라운드 작업 시작 (시작 시 인덱스를 미리 올림)"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url or SEMANTIC_SYNC_INTERVAL <= 0:
+        return
+
+    def loop():
+        while True:
+            try:
+                sync_all(database_url, lambda: socketio.sleep(0))
+            except Exception:
+                logger.exception("semantic index sync failed")
+            socketio.sleep(SEMANTIC_SYNC_INTERVAL)
+
+    socketio.start_background_task(loop)
+
+
+# ==================================================
+#   의미 검색 API (GET /search/semantic?q=<검색어>&type=profiles|projects&k=<n>)
+# ==================================================
+SEARCH_TYPES = {
+    "profiles": ("students", """
+        SELECT s.user_id AS id, s.name AS username, s.introduction, s.skills, s.portfolio_url, s.github_url, s.linkedin_url, u.email
+        FROM students s JOIN users u ON s.user_id = u.id
+        WHERE s.user_id = ANY(%s) AND s.is_profile_public IS TRUE AND s.introduction IS NOT NULL
+    """),
+    "projects": ("projects", """
+        SELECT p.*, b.business_name, b.address AS business_address
+        FROM projects p LEFT JOIN businesses b ON b.user_id = p.business_id
+        WHERE p.id = ANY(%s) AND p.deleted_at IS NULL
+    """),
+}
+
+
+@semantic_bp.route("/semantic", methods=["GET"])
+def semantic_search():
+    q = (request.args.get("q") or "").strip()
+    search_type = request.args.get("type", "profiles")
+
+    if not q:
+        return jsonify({"message": "q is required"}), 400
+    if search_type not in SEARCH_TYPES:
+        return jsonify({"message": "type must be 'profiles' or 'projects'"}), 400
+    try:
+        k = min(int(request.args.get("k", SEMANTIC_TOP_K)), SEMANTIC_TOP_K_MAX)
+    except ValueError:
+        return jsonify({"message": "k must be an integer"}), 400
+    if k < 1:
+        return jsonify({"message": "k must be positive"}), 400
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_db()
+        index_name, sql = SEARCH_TYPES[search_type]
+        index = loaded_index(index_name)
+        if index is None:
+            return jsonify({"message": "Semantic index is not ready yet"}), 503
+        # 인덱스와 DB 사이에 지워진 행이 있을 수 있으므로 여유 있게 찾은 뒤 DB에서 다시 확인
+        hits = [(item_id, score) for item_id, score in index.search(embed((q, 1.0)), k * 2)
+                if score >= SEMANTIC_MIN_SCORE]
+
+        cursor = conn.cursor()
+        cursor.execute(sql, ([item_id for item_id, _ in hits],))
+        records = {row["id"]: row for row in format_records(cursor.fetchall())}
+
+        results = []
+        for item_id, score in hits:
+            if item_id in records and len(results) < k:
+                results.append(dict(records[item_id], score=round(score, 4)))
+
+        return jsonify({
+            "message": "success",
+            "count": len(results),
+            "results": results
+        }), 200
+
+    except Exception as e:
+        logger.exception("semantic search failed")
+        return jsonify({"message": "Failed to search"}), 500
+
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def main():
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        sys.exit("❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.")
+    conn = psycopg2.connect(database_url)
+    try:
+        for name in SOURCES:
+            index = build_index(conn, name)
+            index.save()
+            print(f"✅ {name}: {len(index):,}개 벡터 저장 ({SEMANTIC_INDEX_DIR})")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,43 @@
 Socket.IO 이벤트 핸들러
 이 모듈은 main.py에서 명시적으로 import되어야 합니다.
 """
+from flask import request
 from flask_socketio import emit, join_room
 from app.db import get_db
+from app.messages import save_chat_message
+from app.auth import SECRET_KEY
+from app import metrics
+import jwt
 import logging
 from urllib.parse import unquote
 
 logger = logging.getLogger(__name__)
 
+
+USER_ROOM_PREFIX = "user:"
+
+# 연결(sid)별로 connect에서 검증한 JWT payload. 채팅방 참여 권한 확인에 사용
+_socket_users = {}
+
+
+def user_room(user_id):
+    """사용자별 알림을 받는 Socket.IO 방 이름 (connect에서 JWT를 검증한 본인만 참여)"""
+    return f"{USER_ROOM_PREFIX}{user_id}"
+
+
+def _authorized_room(room_id):
+    """
+    (디코딩한 채팅방 이름, connect에서 검증한 사용자)를 반환. 권한이 없으면 None
+    JWT로 확인한 사용자의 이메일이 들어 있는 채팅방만 허용 (delete_chat_room과 같은 규칙). 알림 방(user:<id>)은 제외
+    """
+    decoded_room_id = unquote(room_id) if isinstance(room_id, str) else ""
+    user = _socket_users.get(request.sid)
+    if (decoded_room_id.startswith(USER_ROOM_PREFIX) or user is None
+            or not user.get("email") or user["email"] not in decoded_room_id):
+        return None
+    return decoded_room_id, user
+
+
 # socketio 인스턴스를 지연 import하여 순환 의존성 방지
 def register_socket_handlers(socketio):
     """
@@ -17,19 +47,42 @@ def register_socket_handlers(socketio):
     """
 
     @socketio.on('connect')
-    def handle_connect():
+    def handle_connect(auth=None):
+        metrics.SOCKETIO_CONNECTIONS.inc()
         logger.info('Client connected')
         print('Client connected')  # 디버깅용
 
+        # io(url, { auth: { token } }) 으로 JWT를 보내면 본인 알림 방(user:<id>)에 참여
+        token = auth.get('token') if isinstance(auth, dict) else None
+        if token:
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+            except jwt.InvalidTokenError:
+                logger.info('Invalid token on connect; user room not joined')
+                return
+            _socket_users[request.sid] = payload
+            join_room(user_room(payload["id"]))
+
     @socketio.on('disconnect')
     def handle_disconnect():
+        metrics.SOCKETIO_CONNECTIONS.dec()
+        _socket_users.pop(request.sid, None)
         logger.info('Client disconnected')
         print('Client disconnected')  # 디버깅용
 
     @socketio.on('join_room')
     def handle_join_room(room_id):
-        """클라이언트가 특정 채팅방에 참여. room_id를 디코딩하여 사용."""
-        decoded_room_id = unquote(room_id)
+        """
+        클라이언트가 특정 채팅방에 참여. room_id를 디코딩하여 사용.
+        connect에서 JWT로 확인한 사용자의 이메일이 들어 있는 채팅방만 참여할 수 있습니다. (delete_chat_room과 같은 규칙)
+        알림 방(user:<id>)은 connect에서만 참여합니다.
+        """
+        authorized = _authorized_room(room_id)
+        if authorized is None:
+            logger.info(f'Rejected join_room: {room_id}')
+            emit('join_room_error', {"room_id": room_id, "message": "unauthorized to join this chat room"})
+            return
+        decoded_room_id = authorized[0]
         join_room(decoded_room_id)
         logger.info(f'Client joined room: {decoded_room_id} (raw: {room_id})')
         print(f'Client joined room: {decoded_room_id} (raw: {room_id})')  # 디버깅용
@@ -40,22 +93,32 @@ def register_socket_handlers(socketio):
         클라이언트로부터 메시지를 받아서:
         1. 해당 채팅방의 모든 클라이언트에게 브로드캐스트
         2. DB에 저장
+        보낸 사람은 payload의 sender가 아니라 connect에서 검증한 JWT의 이메일이며,
+        join_room과 같은 규칙으로 참여할 수 있는 채팅방에만 보낼 수 있습니다.
         """
         print(f'Received message: {data}')  # 디버깅용
 
+        if not isinstance(data, dict):
+            return
         room_id_raw = data.get('room_id')
         message = data.get('message')
-        sender = data.get('sender')
 
-        if not all([room_id_raw, message, sender]):
+        if not all([room_id_raw, message]):
             logger.error('Missing required fields in send_message')
             print('Missing required fields in send_message')
             return
 
-        decoded_room_id = unquote(room_id_raw)
+        authorized = _authorized_room(room_id_raw)
+        if authorized is None:
+            logger.info(f'Rejected send_message: {room_id_raw}')
+            return
+        decoded_room_id, user = authorized
+        sender = user["email"]
+        data = dict(data, sender=sender)
 
         # 채팅방의 모든 사용자에게 메시지 전송
         emit('receive_message', data, room=decoded_room_id)
+        metrics.record_socketio_message()
         print(f'Message emitted to room: {decoded_room_id}')
 
         # DB에 메시지 저장
@@ -65,8 +128,11 @@ def register_socket_handlers(socketio):
             conn = get_db()
             cursor = conn.cursor()
 
-            sql = "INSERT INTO messages (room_id, sender, message) VALUES (%s, %s, %s)"
-            cursor.execute(sql, (decoded_room_id, sender, message))
+            if save_chat_message(cursor, decoded_room_id, sender, message) is None:
+                conn.rollback()
+                logger.error(f'Failed to save message: unknown sender {sender}')
+                print(f'Failed to save message: unknown sender {sender}')
+                return
             conn.commit()
 
             logger.info(f'Message saved: room={decoded_room_id}, sender={sender}')
@@ -1,4 +1,6 @@
 from datetime import datetime
+import base64
+import json
 
 def format_records(records):
     """
@@ -9,7 +11,8 @@ def format_records(records):
     if records is None:
         return None
 
-    is_list = isinstance(records, list)
+    # psycopg2 DictRow는 list의 하위 클래스이므로 keys() 유무로 단일 레코드를 구분
+    is_list = isinstance(records, list) and not hasattr(records, 'keys')
     if not is_list:
         records = [records]
 
@@ -28,3 +31,21 @@ def format_records(records):
         formatted_records.append(formatted_record)
 
     return formatted_records if is_list else formatted_records[0]
+
+
+
+def encode_cursor(values):
+    """키셋 페이지네이션 위치(정렬 값 목록)를 URL에 넣을 수 있는 불투명한 문자열로 변환합니다."""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, size):
+    """encode_cursor로 만든 문자열을 값 목록으로 되돌립니다. 형식이 맞지 않으면 ValueError를 발생시킵니다."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError("invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("invalid cursor")
+    return values
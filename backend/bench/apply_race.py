@@ -0,0 +1,185 @@
+"""
+지원하기(POST /applications) 동시성 검사
+같은 학생이 같은 프로젝트에 동시에 여러 번 지원(더블 클릭, 재시도)해도 지원서가 정확히 하나만 생기는지 확인합니다.
+
+1) 키 없음: 학생마다 --repeat개 요청을 동시에 보내 201 한 번과 409(duplicate)만 나와야 함
+2) Idempotency-Key: 같은 키로 동시에 보내 201 한 번과 저장된 응답 재사용(Idempotent-Replayed)만 나와야 함
+끝난 뒤 DB에서 (프로젝트, 학생)별 지원서와 사장님 알림이 정확히 하나인지 확인하고, 어긋나면 종료 코드 1을 반환합니다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql://localhost/ieum_bench python -m bench.apply_race --students 50 --repeat 5
+    BENCH_DATABASE_URL=... python -m bench.apply_race --seed-db --scale tiny
+
+검사용으로 만든 프로젝트(딸린 지원서/알림 포함)는 끝난 뒤 삭제합니다.
+"""
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+import psycopg2
+from dotenv import load_dotenv
+
+from . import datagen
+from . import seed as bench_seed
+
+load_dotenv()
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_phase(app, students, project_id, repeat, parallel, use_key):
+    """학생 parallel명씩 묶어 학생마다 repeat개 요청을 동시에 보내고 [(학생 id, 상태 코드, 재사용 여부, 지연 ms)] 반환"""
+    results = []
+    lock = threading.Lock()
+
+    for offset in range(0, len(students), parallel):
+        wave = students[offset:offset + parallel]
+        barrier = threading.Barrier(len(wave) * repeat)
+
+        def submit(student_id, headers):
+            client = app.test_client()
+            if use_key:
+                headers = dict(headers, **{"Idempotency-Key": f"apply-{project_id}-{student_id}"})
+            body = {"project_id": project_id, "cover_letter": "동시 지원 검사"}
+            barrier.wait()
+            started = time.perf_counter()
+            response = client.post("/applications", json=body, headers=headers)
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                results.append((student_id, response.status_code,
+                                response.headers.get("Idempotent-Replayed") == "true", elapsed))
+
+        threads = [threading.Thread(target=submit, args=(student_id, headers))
+                   for student_id, headers in wave for _ in range(repeat)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return results
+
+
+def check_phase(name, results, repeat, use_key):
+    """학생별 응답 분포가 기대와 같은지 확인하고 문제 목록을 반환"""
+    problems = []
+    by_student = {}
+    for student_id, status, replayed, _ in results:
+        by_student.setdefault(student_id, []).append((status, replayed))
+
+    for student_id, responses in by_student.items():
+        created = sum(1 for status, replayed in responses if status == 201 and not replayed)
+        if use_key:
+            others_ok = all(status == 201 and replayed for status, replayed in responses if not (status == 201 and not replayed))
+        else:
+            others_ok = all(status == 409 for status, _ in responses if status != 201)
+        if created != 1 or not others_ok or len(responses) != repeat:
+            problems.append(f"{name}: 학생 {student_id} 응답 {sorted(responses)}")
+
+    latencies = sorted(elapsed for *_, elapsed in results)
+    statuses = Counter(f"{status}{' (replayed)' if replayed else ''}" for _, status, replayed, _ in results)
+    print(f"{name:<20} 요청 {len(results):>5}  p50 {statistics.median(latencies):>7.2f}ms  "
+          f"max {latencies[-1]:>7.2f}ms  응답 {dict(statuses)}")
+    return problems
+
+
+def check_database(cursor, project_id, student_ids):
+    problems = []
+    cursor.execute("""
+        SELECT student_id, COUNT(*) FROM applications WHERE project_id = %s GROUP BY student_id
+    """, (project_id,))
+    counts = dict(cursor.fetchall())
+    for student_id in student_ids:
+        if counts.get(student_id) != 1:
+            problems.append(f"프로젝트 {project_id}: 학생 {student_id}의 지원서 {counts.get(student_id, 0)}개")
+    cursor.execute("""
+        SELECT COUNT(*) FROM notifications
+        WHERE type = 'APPLICATION_CREATED' AND (payload->>'project_id')::int = %s
+    """, (project_id,))
+    notified = cursor.fetchone()[0]
+    if notified != len(student_ids):
+        problems.append(f"프로젝트 {project_id}: 새 지원자 알림 {notified}개 (기대 {len(student_ids)}개)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지원하기 동시성 검사")
+    bench_seed.add_scale_arguments(parser)
+    parser.add_argument("--seed-db", action="store_true", help="실행 전에 스키마를 만들고 데이터를 다시 시딩")
+    parser.add_argument("--students", type=int, default=50, help="검사할 학생 수")
+    parser.add_argument("--repeat", type=int, default=5, help="학생마다 동시에 보낼 요청 수")
+    parser.add_argument("--parallel", type=int, default=4, help="동시에 검사할 학생 수 (DB 연결 수 = parallel x repeat)")
+    args = parser.parse_args()
+
+    database_url = bench_seed.get_bench_database_url()
+    # 앱이 벤치마크 DB를 사용하도록 import 전에 설정
+    os.environ["DATABASE_URL"] = database_url
+    if args.seed_db:
+        scale = bench_seed.parse_scale(args)
+        print(f"--- 시딩: {scale} ---")
+        bench_seed.prepare_schema(database_url)
+        datagen.generate(database_url, seed=args.seed, workers=args.workers, **scale)
+
+    sys.path.insert(0, os.path.dirname(BENCH_DIR))
+    from app import create_app
+    from app.auth import SECRET_KEY
+    import jwt
+
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+    cursor.execute("SELECT u.id FROM users u JOIN businesses b ON b.user_id = u.id ORDER BY u.id LIMIT 1")
+    business = cursor.fetchone()
+    cursor.execute("""
+        SELECT u.id, u.email, s.name FROM users u JOIN students s ON s.user_id = u.id ORDER BY u.id LIMIT %s
+    """, (args.students,))
+    students = cursor.fetchall()
+    if not business or not students:
+        sys.exit("❌ 벤치마크 DB가 비어 있습니다. --seed-db 옵션으로 먼저 시딩하세요.")
+
+    run_id = uuid.uuid4().hex[:8]
+    cursor.execute("""
+        INSERT INTO projects (business_id, title, description, status)
+        SELECT %s, 'apply race ' || %s || ' ' || g, 'apply race', 'OPEN' FROM generate_series(1, 2) g
+        RETURNING id
+    """, (business[0], run_id))
+    project_ids = [row[0] for row in cursor.fetchall()]
+    conn.commit()
+
+    def headers(student_id, email, name):
+        payload = {"id": student_id, "email": email, "role": "STUDENT", "name": name,
+                   "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1)}
+        return {"Authorization": f"Bearer {jwt.encode(payload, SECRET_KEY, algorithm='HS256')}"}
+
+    student_headers = [(s[0], headers(*s)) for s in students]
+    student_ids = [s[0] for s in students]
+    app = create_app()
+
+    problems = []
+    try:
+        for project_id, name, use_key in ((project_ids[0], "키 없음", False), (project_ids[1], "Idempotency-Key", True)):
+            results = run_phase(app, student_headers, project_id, args.repeat, args.parallel, use_key)
+            problems += check_phase(name, results, args.repeat, use_key)
+            problems += check_database(cursor, project_id, student_ids)
+    finally:
+        cursor.execute("""
+            DELETE FROM notifications WHERE type = 'APPLICATION_CREATED' AND (payload->>'project_id')::int = ANY(%s)
+        """, (project_ids,))
+        cursor.execute("DELETE FROM idempotency_keys WHERE key LIKE ANY(%s)", ([f"apply-{pid}-%" for pid in project_ids],))
+        cursor.execute("DELETE FROM projects WHERE id = ANY(%s)", (project_ids,))
+        conn.commit()
+        conn.close()
+
+    if problems:
+        print("\n❌ 동시성 검사 실패:")
+        for problem in problems[:50]:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print(f"\n✅ 학생 {len(students)}명 x 동시 {args.repeat}회: 지원서 유실/중복 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+프로젝트 일괄 등록/내보내기 처리량 측정
+시딩된 벤치마크 DB(BENCH_DATABASE_URL)에서 첫 번째 사업자로 다음을 측정하고 초당 행 수를 출력합니다.
+- POST /projects 를 한 건씩 반복 (기존 방식)
+- POST /projects/bulk (CSV, JSON Lines) 를 PROJECTS_BULK_MAX_ROWS 단위로 나눠 요청
+- GET /projects/export (COPY 스트리밍)
+
+사용법:
+    BENCH_DATABASE_URL=postgresql://localhost/ieum_bench python -m bench.bulk_projects --rows 20000
+    BENCH_DATABASE_URL=... python -m bench.bulk_projects --seed-db --scale tiny --single 500
+
+측정으로 만든 프로젝트는 끝난 뒤 삭제합니다.
+"""
+import argparse
+import csv
+import datetime
+import io
+import json
+import os
+import sys
+import time
+import psycopg2
+from dotenv import load_dotenv
+
+from . import datagen
+from . import seed as bench_seed
+
+load_dotenv()
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FIELDS = ["title", "description", "location", "salary", "duration", "required_skills", "status"]
+
+
+def make_rows(n, run_id):
+    return [{
+        "title": f"bulk {run_id} {i}",
+        "description": f"일괄 등록 벤치마크 프로젝트 {i}, 줄바꿈과 \"따옴표\"가\n포함된 설명",
+        "location": "서울 강남구",
+        "salary": "시급 12,000원",
+        "duration": "3개월",
+        "required_skills": "Python, SQL",
+        "status": "OPEN"
+    } for i in range(n)]
+
+
+def to_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def to_jsonl(rows):
+    return "\n".join(json.dumps(row, ensure_ascii=False) for row in rows).encode("utf-8")
+
+
+def report(name, rows, elapsed):
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"{name:<28} {rows:>8,}행 {elapsed:>8.2f}s {rate:>12,.0f} rows/s")
+    return rate
+
+
+def measure_bulk(client, headers, rows, batch_size, content_type, encode):
+    started = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        response = client.post("/projects/bulk", data=encode(rows[offset:offset + batch_size]),
+                               headers=headers, content_type=content_type)
+        if response.status_code != 201:
+            sys.exit(f"❌ POST /projects/bulk 실패: {response.status_code} {response.get_data(as_text=True)[:300]}")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트 일괄 등록/내보내기 처리량 측정")
+    bench_seed.add_scale_arguments(parser)
+    parser.add_argument("--seed-db", action="store_true", help="실행 전에 스키마를 만들고 데이터를 다시 시딩")
+    parser.add_argument("--rows", type=int, default=10_000, help="형식별 일괄 등록 행 수")
+    parser.add_argument("--single", type=int, default=200, help="POST /projects 를 한 건씩 보낼 횟수")
+    args = parser.parse_args()
+
+    database_url = bench_seed.get_bench_database_url()
+    # 앱이 벤치마크 DB를 사용하도록 import 전에 설정
+    os.environ["DATABASE_URL"] = database_url
+    if args.seed_db:
+        scale = bench_seed.parse_scale(args)
+        print(f"--- 시딩: {scale} ---")
+        bench_seed.prepare_schema(database_url)
+        datagen.generate(database_url, seed=args.seed, workers=args.workers, **scale)
+
+    sys.path.insert(0, os.path.dirname(BENCH_DIR))
+    from app import create_app
+    from app.auth import SECRET_KEY
+    from app.projects import PROJECTS_BULK_MAX_ROWS
+    import jwt
+
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT u.id, u.email, b.business_name FROM users u JOIN businesses b ON b.user_id = u.id ORDER BY u.id LIMIT 1
+    """)
+    business = cursor.fetchone()
+    if not business:
+        sys.exit("❌ 벤치마크 DB가 비어 있습니다. --seed-db 옵션으로 먼저 시딩하세요.")
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM projects")
+    first_new_id = cursor.fetchone()[0]
+    conn.commit()
+
+    payload = {"id": business[0], "email": business[1], "role": "BUSINESS", "business_name": business[2],
+               "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1)}
+    headers = {"Authorization": f"Bearer {jwt.encode(payload, SECRET_KEY, algorithm='HS256')}"}
+    client = create_app().test_client()
+    run_id = f"{time.time():.0f}"
+
+    print(f"{'case':<28} {'rows':>9} {'time':>9} {'throughput':>17}")
+    try:
+        rows = make_rows(args.single, run_id)
+        started = time.perf_counter()
+        for row in rows:
+            response = client.post("/projects", json=row, headers=headers)
+            if response.status_code != 201:
+                sys.exit(f"❌ POST /projects 실패: {response.status_code}")
+        single_rate = report("POST /projects (1건씩)", len(rows), time.perf_counter() - started)
+
+        rows = make_rows(args.rows, run_id)
+        csv_rate = report("POST /projects/bulk (CSV)", len(rows),
+                          measure_bulk(client, headers, rows, PROJECTS_BULK_MAX_ROWS, "text/csv", to_csv))
+        report("POST /projects/bulk (JSONL)", len(rows),
+               measure_bulk(client, headers, rows, PROJECTS_BULK_MAX_ROWS, "application/x-ndjson", to_jsonl))
+
+        started = time.perf_counter()
+        response = client.get("/projects/export", headers=headers)
+        body = response.get_data()
+        if response.status_code != 200:
+            sys.exit(f"❌ GET /projects/export 실패: {response.status_code}")
+        exported = sum(1 for _ in csv.reader(io.StringIO(body.decode("utf-8")))) - 1
+        report("GET /projects/export", exported, time.perf_counter() - started)
+
+        if single_rate > 0:
+            print(f"\n일괄 등록(CSV)은 한 건씩 등록보다 {csv_rate / single_rate:,.1f}배 빠릅니다.")
+    finally:
+        # 측정으로 만든 프로젝트 정리
+        cursor.execute("DELETE FROM projects WHERE id > %s AND business_id = %s AND title LIKE %s",
+                       (first_new_id, business[0], f"bulk {run_id} %"))
+        conn.commit()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
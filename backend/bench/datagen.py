@@ -0,0 +1,444 @@
+"""
+실제 서비스 데이터와 비슷한 형태의 대용량 합성 데이터 생성기
+- 프로젝트 인기도는 Zipf 분포 (소수 공고에 지원이 몰림)
+- 한국어 이름/자기소개/공고/채팅 문구, 쉼표로 구분된 기술 스택 (표기 흔들림 포함)
+- 채팅방 room_key는 프론트엔드와 같이 두 이메일을 정렬해 '_'로 연결 (학생-사업자 쌍마다 하나)
+- 채팅은 짧은 간격으로 몰아서 오가는 세션과 긴 공백이 반복되는 bursty 패턴
+같은 --seed 이면 워커 수와 관계없이 항상 같은 데이터가 생성되며,
+테이블별 청크를 여러 프로세스가 병렬로 COPY 하여 수천만 행도 수 분 안에 적재합니다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql://localhost/ieum_bench python -m bench.datagen --scale large --workers 8
+"""
+import argparse
+import bisect
+import datetime
+import io
+import multiprocessing
+import os
+import random
+import time
+import psycopg2
+from dotenv import load_dotenv
+
+from . import seed as bench_seed
+from app import message_archive
+from app import geo
+
+load_dotenv()
+
+# 워커 하나가 한 번에 생성/적재하는 단위
+CHUNK_SIZES = {"users": 20_000, "projects": 20_000, "applications": 5_000, "messages": 2_000}
+
+# 데이터 시간 범위: 기준 시각으로부터 과거 DATA_DAYS일
+BASE_TIME = datetime.datetime(2025, 1, 1)
+DATA_DAYS = 365
+
+# 프로젝트 인기도 Zipf 지수 (클수록 상위 공고 쏠림이 심함)
+PROJECT_ZIPF_S = 1.1
+# 채팅방당 평균 메시지 수 (로그정규분포)
+AVG_ROOM_MESSAGES = 20
+
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권"]
+GIVEN_SYLLABLES = ["민", "서", "지", "현", "우", "준", "하", "윤", "도", "예", "수", "연", "은", "진", "영", "호", "린", "아"]
+
+# 같은 기술의 여러 표기 (첫 번째가 대표 표기)
+SKILL_VARIANTS = [
+    ["React", "react", "React.js", "리액트"],
+    ["Python", "python", "파이썬"],
+    ["Java", "java", "JAVA"],
+    ["JavaScript", "javascript", "JS", "자바스크립트"],
+    ["TypeScript", "typescript", "TS"],
+    ["Node.js", "node", "NodeJS"],
+    ["Spring", "spring", "Spring Boot"],
+    ["Figma", "figma", "피그마"],
+    ["Photoshop", "포토샵"],
+    ["SQL", "MySQL", "PostgreSQL"],
+    ["Excel", "엑셀"],
+    ["영상편집", "Premiere", "프리미어"],
+    ["마케팅", "SNS 마케팅", "콘텐츠 마케팅"],
+    ["Flutter", "flutter"],
+    ["Swift", "iOS"],
+    ["Kotlin", "Android", "안드로이드"],
+    ["Illustrator", "일러스트레이터"],
+    ["C++", "c++"],
+]
+# 기술별 인기 가중치 (앞쪽일수록 흔함)
+SKILL_WEIGHTS = [1.0 / (rank + 1) ** 0.8 for rank in range(len(SKILL_VARIANTS))]
+
+DISTRICTS = [
+    ("서울", ["강남구", "서초구", "마포구", "관악구", "성동구", "송파구", "영등포구", "종로구", "중구", "용산구"]),
+    ("경기", ["성남시 분당구", "수원시 영통구", "고양시 일산동구", "용인시 수지구", "안양시 동안구"]),
+    ("부산", ["해운대구", "부산진구", "남구"]),
+    ("대구", ["중구", "수성구"]),
+    ("인천", ["연수구", "남동구"]),
+    ("대전", ["유성구", "서구"]),
+    ("광주", ["북구", "서구"]),
+]
+# 지역 가중치 (서울 쏠림)
+REGION_WEIGHTS = [10, 5, 2, 1, 1.5, 1, 0.8]
+
+BUSINESS_KINDS = ["카페", "베이커리", "스타트업", "디자인 스튜디오", "학원", "쇼핑몰", "스튜디오", "식당", "출판사", "에이전시"]
+PROJECT_ROLES = ["웹 프론트엔드 개발", "백엔드 API 개발", "앱 개발", "로고 디자인", "SNS 콘텐츠 제작", "홍보 영상 편집", "데이터 정리", "랜딩페이지 제작", "상세페이지 디자인", "블로그 마케팅"]
+DURATIONS = ["1주", "2주", "1개월", "2개월", "3개월", "6개월", "협의"]
+SALARIES = ["협의", "건당 30만원", "건당 50만원", "월 100만원", "시급 12,000원", "시급 15,000원", "총 200만원"]
+INTRO_TEMPLATES = [
+    "{skill}을(를) 주로 사용하는 {grade}학년 학생입니다. {goal}",
+    "안녕하세요! {skill} 프로젝트 경험이 있는 {name}입니다. {goal}",
+    "{skill}, {skill2} 공부 중인 대학생입니다. {goal}",
+    "{grade}학년 {major} 전공생으로 {skill} 실무 경험을 쌓고 싶습니다.",
+]
+GOALS = ["성실하게 참여하겠습니다.", "빠르게 배우고 적용합니다.", "팀워크를 중요하게 생각합니다.", "포트폴리오를 함께 만들어가고 싶어요.", ""]
+MAJORS = ["컴퓨터공학", "시각디자인", "경영학", "미디어커뮤니케이션", "산업공학", "전자공학"]
+CHAT_LINES = [
+    "안녕하세요!", "지원서 잘 봤습니다.", "혹시 이번 주에 미팅 가능하실까요?", "네 가능합니다!", "포트폴리오 링크 보내드릴게요.",
+    "감사합니다 :)", "일정 조율 부탁드려요.", "내일 오후 2시 어떠세요?", "좋습니다.", "자료 확인했습니다.",
+    "수정본 전달드립니다.", "확인 부탁드려요!", "ㅎㅎ 네네", "혹시 급여는 어떻게 되나요?", "계약서 보내드리겠습니다.",
+]
+COVER_LETTERS = [
+    "관련 경험이 있어 지원합니다. 성실하게 임하겠습니다.",
+    "공고를 보고 꼭 참여하고 싶어 지원했습니다.",
+    "포트폴리오 첨부합니다. 잘 부탁드립니다!",
+    "",
+]
+
+
+def _chunk_rng(base_seed, table, chunk_index):
+    """청크마다 독립된 난수 생성기 (워커 수와 무관하게 같은 결과)"""
+    return random.Random(f"{base_seed}:{table}:{chunk_index}")
+
+
+def _weighted_picker(weights):
+    cumulative = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+
+    def pick(rng):
+        return bisect.bisect_left(cumulative, rng.random() * total)
+    return pick
+
+
+_pick_skill = _weighted_picker(SKILL_WEIGHTS)
+_pick_region = _weighted_picker(REGION_WEIGHTS)
+
+
+def korean_name(rng):
+    return rng.choice(SURNAMES) + "".join(rng.choice(GIVEN_SYLLABLES) for _ in range(2))
+
+
+def skills_text(rng, count):
+    """쉼표로 구분된 기술 스택 문자열. 대표 표기 외 변형 표기와 공백 흔들림을 섞습니다."""
+    chosen = []
+    for _ in range(count * 2):
+        variants = SKILL_VARIANTS[_pick_skill(rng)]
+        skill = variants[0] if rng.random() < 0.7 else rng.choice(variants)
+        if skill not in chosen:
+            chosen.append(skill)
+        if len(chosen) >= count:
+            break
+    separator = ", " if rng.random() < 0.5 else ","
+    return separator.join(chosen)
+
+
+def location_text(rng):
+    region, districts = DISTRICTS[_pick_region(rng)]
+    return f"{region} {rng.choice(districts)}"
+
+
+def coordinates(rng, location):
+    """지명 사전 좌표에서 1~2km 정도 흩뜨린 (위도, 경도). 같은 구 안의 가게/공고가 한 점에 몰리지 않게 함"""
+    lat, lng = geo.geocode(location)
+    return round(lat + rng.gauss(0, 0.012), 6), round(lng + rng.gauss(0, 0.015), 6)
+
+
+def random_time(rng):
+    return BASE_TIME - datetime.timedelta(seconds=rng.randrange(DATA_DAYS * 86400))
+
+
+class Plan:
+    """생성 규모와 id 배치. 학생 1..S, 사업자 S+1..S+B, 프로젝트 1..P"""
+
+    def __init__(self, users, projects, applications, messages, seed):
+        self.students = max(1, int(users * bench_seed.STUDENT_RATIO))
+        self.businesses = max(1, users - self.students)
+        self.projects = projects
+        self.applications = applications
+        self.messages = messages
+        self.seed = seed
+        # 학생-사업자 쌍마다 채팅방은 하나뿐
+        self.room_count = min(max(1, messages // AVG_ROOM_MESSAGES), self.students * self.businesses)
+
+
+# ============================
+#   테이블별 청크 생성기 (각 함수는 COPY용 (table, columns, rows) 리스트 반환)
+# ============================
+def gen_users(plan, chunk_index, start, end, password_hash):
+    rng = _chunk_rng(plan.seed, "users", chunk_index)
+    users, students, businesses = [], [], []
+    for user_id in range(start + 1, end + 1):
+        created = random_time(rng)
+        if user_id <= plan.students:
+            index = user_id - 1
+            name = korean_name(rng)
+            users.append((user_id, bench_seed.student_email(index), password_hash, "STUDENT", created))
+            has_intro = rng.random() < 0.75
+            intro = rng.choice(INTRO_TEMPLATES).format(
+                skill=SKILL_VARIANTS[_pick_skill(rng)][0], skill2=SKILL_VARIANTS[_pick_skill(rng)][0],
+                grade=rng.randint(1, 4), major=rng.choice(MAJORS), name=name, goal=rng.choice(GOALS)
+            ) if has_intro else None
+            students.append((user_id, name, intro, skills_text(rng, rng.randint(1, 5)) if has_intro else None,
+                             f"https://github.com/{bench_seed.student_email(index).split('@')[0]}" if rng.random() < 0.4 else None,
+                             rng.random() < 0.8, created))
+        else:
+            index = user_id - plan.students - 1
+            users.append((user_id, bench_seed.business_email(index), password_hash, "BUSINESS", created))
+            address = location_text(rng) + f" {rng.randint(1, 300)}"
+            businesses.append((user_id, f"{rng.choice(SURNAMES)}{rng.choice(GIVEN_SYLLABLES)} {rng.choice(BUSINESS_KINDS)}",
+                               address, *coordinates(rng, address), created))
+    return [
+        ("users", ["id", "email", "password", "role", "created_at"], users),
+        ("students", ["user_id", "name", "introduction", "skills", "github_url", "is_profile_public", "created_at"], students),
+        ("businesses", ["user_id", "business_name", "address", "latitude", "longitude", "created_at"], businesses),
+    ]
+
+
+def gen_projects(plan, chunk_index, start, end):
+    rng = _chunk_rng(plan.seed, "projects", chunk_index)
+    rows = []
+    for project_id in range(start + 1, end + 1):
+        # 사업자도 활동량이 Zipf 분포 (일부 사업자가 공고를 많이 올림)
+        business_index = min(plan.businesses - 1, int(plan.businesses * rng.random() ** 2))
+        location = location_text(rng)
+        role = rng.choice(PROJECT_ROLES)
+        created = random_time(rng)
+        status = "OPEN" if created > BASE_TIME - datetime.timedelta(days=60) or rng.random() < 0.2 else rng.choice(["CLOSED", "COMPLETED", "IN_PROGRESS"])
+        rows.append((project_id, plan.students + business_index + 1, f"[{location.split()[1]}] {role} 구합니다",
+                     f"{role} 업무를 함께할 학생을 찾습니다. {rng.choice(GOALS)}", location,
+                     rng.choice(SALARIES), rng.choice(DURATIONS), skills_text(rng, rng.randint(1, 4)), status,
+                     *coordinates(rng, location), created))
+    return [("projects", ["id", "business_id", "title", "description", "location", "salary", "duration", "required_skills", "status",
+                          "latitude", "longitude", "created_at"], rows)]
+
+
+def _project_picker(plan):
+    """Zipf 가중치로 프로젝트를 고릅니다. 인기 순위는 시드로 섞어 id 순서와 무관하게 만듭니다."""
+    weights = [1.0 / (rank + 1) ** PROJECT_ZIPF_S for rank in range(plan.projects)]
+    order = list(range(1, plan.projects + 1))
+    random.Random(f"{plan.seed}:project-rank").shuffle(order)
+    pick = _weighted_picker(weights)
+    return lambda rng: order[pick(rng)]
+
+
+def gen_applications(plan, chunk_index, start, end, pick_project):
+    """학생 start..end 구간의 지원서. 학생별 지원 수는 평균이 목표에 맞는 기하분포"""
+    rng = _chunk_rng(plan.seed, "applications", chunk_index)
+    mean = plan.applications / plan.students
+    rows = []
+    for student_id in range(start + 1, end + 1):
+        count = int(rng.expovariate(1.0 / mean) + 0.5) if mean > 0 else 0
+        count = min(count, plan.projects)
+        chosen = set()
+        attempts = 0
+        while len(chosen) < count and attempts < count * 5:
+            chosen.add(pick_project(rng))
+            attempts += 1
+        for project_id in chosen:
+            rows.append((project_id, student_id, rng.choice(COVER_LETTERS),
+                         rng.choices(["PENDING", "ACCEPTED", "REJECTED"], weights=[6, 1, 3])[0], random_time(rng)))
+    return [("applications", ["project_id", "student_id", "cover_letter", "status", "created_at"], rows)]
+
+
+def _room_sizes(plan):
+    """
+    채팅방별 메시지 수 (로그정규분포). 방마다 최소 1개를 준 뒤 나머지를 비례 배분하고,
+    버림으로 남은 개수는 소수 부분이 큰 방부터 1개씩 더해 합계를 목표 메시지 수와 정확히 맞춥니다.
+    (목표 메시지 수가 방 수보다 적으면 방마다 1개)
+    """
+    rng = random.Random(f"{plan.seed}:room-sizes")
+    raw = [rng.lognormvariate(0, 1.2) for _ in range(plan.room_count)]
+    extra = max(0, plan.messages - plan.room_count)
+    scale = extra / sum(raw)
+    shares = [value * scale for value in raw]
+    sizes = [1 + int(share) for share in shares]
+    remainder = plan.room_count + extra - sum(sizes)
+    for i in sorted(range(plan.room_count), key=lambda i: shares[i] - int(shares[i]), reverse=True)[:remainder]:
+        sizes[i] += 1
+    return sizes
+
+
+def room_participants(plan, room_index):
+    """
+    채팅방 번호 -> (학생 번호, 사업자 번호). 같은 두 사람이 두 번 배정되지 않도록
+    학생은 room_index % students, 사업자는 학생별로 섞인 오프셋에서 차례로 배정합니다.
+    """
+    student_index = room_index % plan.students
+    offset = random.Random(f"{plan.seed}:room-offset:{student_index}").randrange(plan.businesses)
+    business_index = (room_index // plan.students + offset) % plan.businesses
+    return student_index, business_index
+
+
+def gen_messages(plan, chunk_index, start, end, sizes):
+    """채팅방 start..end 구간. chat_rooms.id는 room_index + 1"""
+    rng = _chunk_rng(plan.seed, "messages", chunk_index)
+    rooms, rows = [], []
+    for room_index in range(start, end):
+        room_rng = random.Random(f"{plan.seed}:room:{room_index}")
+        student_index, business_index = room_participants(plan, room_index)
+        participants = [(bench_seed.student_email(student_index), student_index + 1),
+                        (bench_seed.business_email(business_index), plan.students + business_index + 1)]
+        participants.sort()
+        room_id = room_index + 1
+
+        # bursty: 세션 안에서는 수 초~수 분 간격, 세션 사이에는 수 시간~수 일 공백
+        current = random_time(room_rng)
+        rooms.append((room_id, f"{participants[0][0]}_{participants[1][0]}", participants[0][1], participants[1][1], current))
+        speaker = room_rng.randrange(2)
+        for _ in range(sizes[room_index]):
+            if rng.random() < 0.1:
+                current += datetime.timedelta(seconds=rng.expovariate(1 / 86400))
+            else:
+                current += datetime.timedelta(seconds=rng.expovariate(1 / 40))
+            if rng.random() < 0.4:
+                speaker = 1 - speaker
+            rows.append((room_id, participants[speaker][1], rng.choice(CHAT_LINES), rng.random() < 0.9, current))
+    return [
+        ("chat_rooms", ["id", "room_key", "user_a_id", "user_b_id", "created_at"], rooms),
+        ("messages", ["room_id", "sender_id", "message", "is_read", "created_at"], rows),
+    ]
+
+
+# ============================
+#   병렬 적재
+# ============================
+_worker_conn = None
+
+
+def _init_worker(database_url):
+    global _worker_conn
+    _worker_conn = psycopg2.connect(database_url)
+    cursor = _worker_conn.cursor()
+    cursor.execute("SET synchronous_commit = off")
+    cursor.close()
+
+
+def _copy_rows(cursor, table, columns, rows):
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(
+            "\\N" if value is None else
+            ("t" if value else "f") if isinstance(value, bool) else
+            str(value).replace("\\", "\\\\").replace("\t", " ").replace("\n", "\\n")
+            for value in row
+        ))
+        buffer.write("\n")
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+
+# 워커 프로세스에서 재사용하는 생성 상태 (fork 이전에 부모에서 준비)
+_state = {}
+
+
+def _run_task(task):
+    kind, chunk_index, start, end = task
+    plan = _state["plan"]
+    if kind == "users":
+        batches = gen_users(plan, chunk_index, start, end, _state["password_hash"])
+    elif kind == "projects":
+        batches = gen_projects(plan, chunk_index, start, end)
+    elif kind == "applications":
+        batches = gen_applications(plan, chunk_index, start, end, _state["pick_project"])
+    else:
+        batches = gen_messages(plan, chunk_index, start, end, _state["room_sizes"])
+
+    cursor = _worker_conn.cursor()
+    counts = []
+    for table, columns, rows in batches:
+        _copy_rows(cursor, table, columns, rows)
+        counts.append((table, len(rows)))
+    _worker_conn.commit()
+    cursor.close()
+    return counts
+
+
+def _tasks(kind, total):
+    size = CHUNK_SIZES[kind]
+    return [(kind, index, start, min(start + size, total)) for index, start in enumerate(range(0, total, size))]
+
+
+def generate(database_url, users, projects, applications, messages, seed=42, workers=None):
+    """
+    스키마가 준비된 빈 DB에 데이터를 생성/적재합니다.
+    사용자 → 프로젝트 → (지원서, 메시지) 순서로 단계별로 병렬 실행합니다.
+    """
+    from werkzeug.security import generate_password_hash
+
+    plan = Plan(users, projects, applications, messages, seed)
+    _state.update({
+        "plan": plan,
+        "password_hash": generate_password_hash(bench_seed.BENCH_PASSWORD),
+        "pick_project": _project_picker(plan),
+        "room_sizes": _room_sizes(plan),
+    })
+    workers = workers or os.cpu_count() or 1
+
+    # 생성 데이터 기간(BASE_TIME 이전 DATA_DAYS일)의 messages 월별 파티션을 미리 생성
+    conn = psycopg2.connect(database_url)
+    message_archive.ensure_partitions(conn, start=BASE_TIME - datetime.timedelta(days=DATA_DAYS))
+    conn.close()
+
+    phases = [
+        ("users", _tasks("users", plan.students + plan.businesses)),
+        ("projects", _tasks("projects", plan.projects)),
+        ("applications+messages", _tasks("applications", plan.students) + _tasks("messages", plan.room_count)),
+    ]
+
+    counts = {}
+    timings = {}
+    context = multiprocessing.get_context("fork")
+    with context.Pool(workers, initializer=_init_worker, initargs=(database_url,)) as pool:
+        for phase, tasks in phases:
+            started = time.perf_counter()
+            for task_counts in pool.imap_unordered(_run_task, tasks):
+                for table, count in task_counts:
+                    counts[table] = counts.get(table, 0) + count
+            timings[phase] = time.perf_counter() - started
+
+    # 명시적으로 넣은 id에 맞춰 시퀀스 조정 후 통계 갱신
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+    for table in ["users", "projects", "chat_rooms"]:
+        cursor.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 1))")
+    conn.commit()
+    conn.autocommit = True
+    cursor.execute("ANALYZE")
+    cursor.close()
+    conn.close()
+
+    return {"students": plan.students, "businesses": plan.businesses, "rows": counts, "timings": timings}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 데이터 생성기")
+    bench_seed.add_scale_arguments(parser)
+    args = parser.parse_args()
+    scale = bench_seed.parse_scale(args)
+    database_url = bench_seed.get_bench_database_url()
+
+    print("--- 스키마 준비 ---")
+    bench_seed.prepare_schema(database_url)
+
+    print(f"--- 생성 시작: {scale}, workers={args.workers}, seed={args.seed} ---")
+    started = time.perf_counter()
+    result = generate(database_url, seed=args.seed, workers=args.workers, **scale)
+    for table, count in result["rows"].items():
+        print(f"  - {table}: {count:,} rows")
+    for phase, seconds in result["timings"].items():
+        print(f"  - {phase}: {seconds:.1f}s")
+    print(f"✅ 생성 완료! ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
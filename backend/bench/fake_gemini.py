@@ -0,0 +1,285 @@
+"""
+오프라인 테스트/벤치마크용 로컬 Gemini 대체 서버
+Gemini REST API의 generateContent / streamGenerateContent(alt=sse)를 흉내 냅니다.
+- 지연시간 분포: fixed / uniform / lognormal (+ 스트리밍 청크 간격)
+- 고정 응답: 프롬프트 스타일(simple/detailed/professional)에 맞는 "버전1/2/3" 텍스트
+- 장애 주입: 429/500/503 에러, 응답 없음(타임아웃), 안전 필터 차단, 버전 형식이 깨진 응답
+- 실행 중 설정 변경: POST /__config (JSON), 누적 통계: GET /__stats
+
+사용법:
+    python -m bench.fake_gemini --port 8089 --latency lognormal --latency-ms 800 --error-rate 0.05
+    GEMINI_API_KEY=fake GEMINI_API_ENDPOINT=http://127.0.0.1:8089 python main.py
+    curl -X POST localhost:8089/__config -d '{"error_rate": 0.5, "error_status": 503}'
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GENERATE_PATH_RE = re.compile(r"^/v1beta/models/(?P<model>[^/:]+):(?P<method>generateContent|streamGenerateContent)$")
+
+ERROR_STATUS_NAMES = {429: "RESOURCE_EXHAUSTED", 500: "INTERNAL", 503: "UNAVAILABLE"}
+
+# ai.py 프롬프트의 요구사항 문구로 스타일을 구분
+STYLE_MARKERS = [("2-3문단", "professional"), ("1-2문단", "detailed"), ("2-3줄", "simple")]
+
+CANNED_VERSIONS = {
+    "simple": [
+        "맡은 일을 끝까지 책임지는 자세로 프로젝트에 기여하겠습니다. 관련 경험을 바탕으로 빠르게 적응하겠습니다.",
+        "안녕하세요! 새로운 것을 배우는 걸 좋아하고, 팀과 함께 성장하는 과정을 즐깁니다. 함께 좋은 결과를 만들고 싶어요.",
+        "성실함과 꼼꼼함이 강점입니다. 주어진 역할을 정확히 해내겠습니다.",
+    ],
+    "detailed": [
+        "저는 수업과 동아리 프로젝트에서 웹 서비스를 기획부터 배포까지 경험했습니다. 일정과 역할을 명확히 나누고 매주 진행 상황을 공유하며 마감 기한을 지켰습니다.\n이번 프로젝트에서도 책임감 있게 맡은 부분을 완성하고, 팀의 목표 달성에 기여하겠습니다.",
+        "처음 프로젝트를 시작했을 때는 모르는 것이 많았지만, 매일 조금씩 공부하며 결과물을 만들어 냈습니다. 그 과정에서 질문하고 공유하는 습관이 팀 전체의 속도를 높인다는 것을 배웠습니다.\n함께 일하고 싶은 동료가 되도록 열심히 하겠습니다.",
+        "빠른 학습과 꼼꼼한 마무리가 강점입니다. 요구사항을 정확히 이해하고, 약속한 일정 안에 결과물을 전달하겠습니다.\n작은 일도 끝까지 책임지는 팀원이 되겠습니다.",
+    ],
+    "professional": [
+        "지난 1년간 세 개의 팀 프로젝트에서 프론트엔드 개발을 맡아 페이지 로딩 시간을 40% 줄이고, 사용자 설문 만족도를 4.2점에서 4.6점으로 높였습니다.\n\n문제를 수치로 정의하고 개선 결과를 검증하는 방식으로 일해 왔으며, 이번 프로젝트에서도 같은 방식으로 기여하겠습니다.\n\n명확한 커뮤니케이션과 문서화로 팀의 협업 비용을 줄이겠습니다.",
+        "처음 코드를 작성하던 날, 화면에 버튼 하나를 띄우는 데 하루가 걸렸습니다. 그날의 뿌듯함이 지금까지 개발을 이어 오게 한 원동력입니다.\n\n이후 동아리에서 팀원들과 함께 서비스를 운영하며 사용자의 목소리를 듣는 법을 배웠습니다.\n\n이제 그 경험을 실제 현장에서 더 큰 가치로 만들고 싶습니다.",
+        "저의 목표는 작은 가게도 쉽게 쓸 수 있는 디지털 도구를 만드는 것입니다.\n\n이번 프로젝트에서 사장님의 문제를 가장 가까이에서 이해하고, 실제로 쓰이는 결과물을 만들겠습니다.\n\n프로젝트가 끝난 뒤에도 계속 성장하는 서비스를 함께 만들고 싶습니다.",
+    ],
+}
+
+DEFAULT_CONFIG = {
+    "latency": "fixed",        # fixed | uniform | lognormal
+    "latency_ms": 0.0,         # fixed 값, uniform 최댓값, lognormal 중앙값
+    "latency_sigma": 0.5,      # lognormal 분산 정도
+    "chunk_size": 40,          # 스트리밍 청크 하나의 글자 수
+    "chunk_interval_ms": 30.0, # 스트리밍 청크 간격
+    "error_rate": 0.0,         # HTTP 에러 응답 비율
+    "error_status": 503,       # 429 | 500 | 503
+    "hang_rate": 0.0,          # 응답하지 않는 비율 (클라이언트 타임아웃 재현)
+    "hang_seconds": 120.0,
+    "blocked_rate": 0.0,       # 안전 필터 차단(후보 없음) 비율 -> response.text 예외
+    "malformed_rate": 0.0,     # "버전N:" 형식이 없는 응답 비율 -> 파싱 실패 경로
+    "seed": None,
+}
+
+
+def detect_style(prompt):
+    for marker, style in STYLE_MARKERS:
+        if marker in prompt:
+            return style
+    return "simple"
+
+
+def canned_text(style):
+    return "\n\n".join(f"버전{i}: {text}" for i, text in enumerate(CANNED_VERSIONS[style], start=1))
+
+
+def candidate(text, finish_reason="STOP"):
+    return {"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": finish_reason, "index": 0}
+
+
+def generate_response(text, model, prompt_tokens=0):
+    return {
+        "candidates": [candidate(text)],
+        "usageMetadata": {"promptTokenCount": prompt_tokens, "candidatesTokenCount": len(text), "totalTokenCount": prompt_tokens + len(text)},
+        "modelVersion": model
+    }
+
+
+def blocked_response(model):
+    return {"promptFeedback": {"blockReason": "SAFETY"}, "modelVersion": model}
+
+
+class FakeGeminiState:
+    """설정과 통계. 요청 스레드들이 공유하므로 lock으로 보호합니다."""
+
+    def __init__(self, **overrides):
+        self.lock = threading.Lock()
+        self.config = dict(DEFAULT_CONFIG)
+        self.update(overrides)
+        self.stats = {"requests": 0, "streamed": 0, "errors": 0, "hangs": 0, "blocked": 0, "malformed": 0}
+
+    def update(self, values):
+        with self.lock:
+            for key, value in values.items():
+                if key not in DEFAULT_CONFIG:
+                    raise KeyError(key)
+                self.config[key] = value
+            self.rng = random.Random(self.config["seed"])
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def roll(self):
+        """요청 하나의 (결과 종류, 지연 초)"""
+        with self.lock:
+            config = self.config
+            rng = self.rng
+            draw = rng.random()
+            outcome = "ok"
+            for kind, rate_key in [("hang", "hang_rate"), ("error", "error_rate"), ("blocked", "blocked_rate"), ("malformed", "malformed_rate")]:
+                if draw < config[rate_key]:
+                    outcome = kind
+                    break
+                draw -= config[rate_key]
+
+            base = config["latency_ms"] / 1000
+            if config["latency"] == "uniform":
+                delay = rng.uniform(0, base)
+            elif config["latency"] == "lognormal":
+                delay = rng.lognormvariate(0, config["latency_sigma"]) * base
+            else:
+                delay = base
+        return outcome, delay
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    server_version = "FakeGemini/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status, message):
+        self._send_json(status, {"error": {"code": status, "message": message, "status": ERROR_STATUS_NAMES.get(status, "UNKNOWN")}})
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw or b"{}")
+
+    def do_GET(self):
+        state = self.server.state
+        if self.path == "/__stats":
+            with state.lock:
+                self._send_json(200, {"config": state.config, "stats": state.stats})
+        else:
+            self._send_error(404, f"unknown path {self.path}")
+
+    def do_POST(self):
+        state = self.server.state
+        path, _, query = self.path.partition("?")
+        try:
+            body = self._read_json()
+        except ValueError:
+            self._send_error(400, "invalid JSON body")
+            return
+
+        if path == "/__config":
+            try:
+                state.update(body)
+            except KeyError as e:
+                self._send_error(400, f"unknown config key {e}")
+                return
+            self._send_json(200, {"config": state.config})
+            return
+
+        match = GENERATE_PATH_RE.match(path)
+        if not match:
+            self._send_error(404, f"unknown path {path}")
+            return
+
+        state.count("requests")
+        model = match.group("model")
+        prompt = "".join(part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", []))
+        outcome, delay = state.roll()
+
+        if outcome == "hang":
+            state.count("hangs")
+            time.sleep(state.config["hang_seconds"])
+            return
+        time.sleep(delay)
+        if outcome == "error":
+            state.count("errors")
+            self._send_error(state.config["error_status"], "injected error from fake Gemini server")
+            return
+        if outcome == "blocked":
+            state.count("blocked")
+            self._send_json(200, blocked_response(model))
+            return
+
+        if outcome == "malformed":
+            state.count("malformed")
+            text = " ".join(CANNED_VERSIONS["simple"])
+        else:
+            text = canned_text(detect_style(prompt))
+
+        if match.group("method") == "streamGenerateContent":
+            state.count("streamed")
+            self._stream(text, model, sse="alt=sse" in query)
+        else:
+            self._send_json(200, generate_response(text, model, len(prompt)))
+
+    def _stream(self, text, model, sse):
+        """chunk_size 글자씩 나눠 chunk_interval_ms 간격으로 전송. alt=sse 이면 SSE, 아니면 JSON 배열"""
+        size = max(1, int(self.server.state.config["chunk_size"]))
+        interval = self.server.state.config["chunk_interval_ms"] / 1000
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def write(data):
+            encoded = data.encode("utf-8")
+            self.wfile.write(f"{len(encoded):x}\r\n".encode() + encoded + b"\r\n")
+            self.wfile.flush()
+
+        for index, chunk in enumerate(chunks):
+            if index:
+                time.sleep(interval)
+            piece = {"candidates": [candidate(chunk, "STOP" if index == len(chunks) - 1 else None)], "modelVersion": model}
+            if sse:
+                write(f"data: {json.dumps(piece, ensure_ascii=False)}\r\n\r\n")
+            else:
+                write(("[" if index == 0 else ",") + json.dumps(piece, ensure_ascii=False))
+        if not sse:
+            write("]")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def make_server(host, port, **config):
+    server = ThreadingHTTPServer((host, port), FakeGeminiHandler)
+    server.daemon_threads = True
+    server.state = FakeGeminiState(**config)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Gemini 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="fixed", help="지연시간 분포")
+    parser.add_argument("--latency-ms", type=float, default=0, help="fixed 값 / uniform 최댓값 / lognormal 중앙값 (ms)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="lognormal 분포의 sigma")
+    parser.add_argument("--chunk-size", type=int, default=40, help="스트리밍 청크 글자 수")
+    parser.add_argument("--chunk-interval-ms", type=float, default=30, help="스트리밍 청크 간격 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0, help="에러 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, choices=sorted(ERROR_STATUS_NAMES), default=503, help="주입할 에러 상태 코드")
+    parser.add_argument("--hang-rate", type=float, default=0, help="응답하지 않는 요청 비율 (0~1)")
+    parser.add_argument("--hang-seconds", type=float, default=120, help="응답하지 않을 때 대기 시간")
+    parser.add_argument("--blocked-rate", type=float, default=0, help="안전 필터 차단 응답 비율 (0~1)")
+    parser.add_argument("--malformed-rate", type=float, default=0, help="버전 형식이 없는 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, help="난수 시드 (재현 가능한 장애 패턴)")
+    args = parser.parse_args()
+
+    config = {key: value for key, value in vars(args).items() if key in DEFAULT_CONFIG}
+    server = make_server(args.host, args.port, **config)
+    print(f"🤖 Fake Gemini 서버 실행 중: http://{args.host}:{args.port} ({server.state.config})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
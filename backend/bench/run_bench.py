@@ -0,0 +1,345 @@
+"""
+API 엔드포인트 벤치마크
+시딩된 로컬 PostgreSQL(BENCH_DATABASE_URL)에 대해 Flask 앱을 프로세스 안에서 실행하고,
+블루프린트별 모든 라우트의 지연시간 백분위수(p50/p90/p99)와 처리량을 측정합니다.
+결과는 bench/results/<시각>.json 으로 저장되며, bench/baseline.json 과 비교하여 회귀를 표시합니다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql://localhost/ieum_bench python -m bench.run_bench --scale small --seed-db
+    BENCH_DATABASE_URL=... python -m bench.run_bench --iterations 200 --concurrency 4 --only projects
+    BENCH_DATABASE_URL=... python -m bench.run_bench --save-baseline
+
+주의: 네트워크를 거치지 않는 test client로 측정하므로 값은 서버 내부 처리 시간입니다.
+같은 머신에서의 상대 비교(회귀 탐지)에 사용하세요.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import datetime
+import psycopg2
+from dotenv import load_dotenv
+
+from . import datagen
+from . import seed as bench_seed
+
+load_dotenv()
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# p90이 기준선 대비 이 비율 이상 느려지고, 절대 차이가 MIN_REGRESSION_MS 이상이면 회귀로 판단
+DEFAULT_TOLERANCE = 0.2
+MIN_REGRESSION_MS = 1.0
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class BenchContext:
+    """시딩된 DB에서 샘플 사용자/프로젝트/채팅방을 골라 라우트 호출에 사용합니다."""
+
+    def __init__(self, conn):
+        from app.auth import SECRET_KEY
+        import jwt
+
+        self.conn = conn
+        self.run_id = uuid.uuid4().hex[:8]
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT u.id, u.email, s.name FROM users u JOIN students s ON s.user_id = u.id ORDER BY u.id LIMIT 500")
+        self.students = cursor.fetchall()
+        cursor.execute("""
+            SELECT u.id, u.email, b.business_name
+            FROM users u JOIN businesses b ON b.user_id = u.id
+            WHERE EXISTS (SELECT 1 FROM projects p WHERE p.business_id = u.id)
+            ORDER BY u.id LIMIT 50
+        """)
+        self.businesses = cursor.fetchall()
+        if not self.students or not self.businesses:
+            sys.exit("❌ 벤치마크 DB가 비어 있습니다. --seed-db 옵션으로 먼저 시딩하세요.")
+
+        cursor.execute("SELECT user_id FROM students WHERE is_profile_public IS TRUE ORDER BY user_id LIMIT 500")
+        self.public_profiles = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT id FROM projects WHERE status = 'OPEN' ORDER BY id LIMIT 500")
+        self.projects = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT room_key FROM chat_rooms WHERE user_a_id = %s OR user_b_id = %s LIMIT 1", (self.students[0][0], self.students[0][0]))
+        row = cursor.fetchone()
+        self.student_room = row[0] if row else bench_seed.room_id_for(0, 0)
+        cursor.execute("SELECT room_key FROM chat_rooms ORDER BY id LIMIT 200")
+        self.rooms = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+
+        def token(user_id, email, role, name_key, name):
+            payload = {"id": user_id, "email": email, "role": role, name_key: name,
+                       "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=12)}
+            return {"Authorization": f"Bearer {jwt.encode(payload, SECRET_KEY, algorithm='HS256')}"}
+
+        self.student_headers = [token(s[0], s[1], "STUDENT", "name", s[2]) for s in self.students]
+        self.business_headers = [token(b[0], b[1], "BUSINESS", "business_name", b[2]) for b in self.businesses]
+
+    def student(self, i):
+        return self.student_headers[i % len(self.student_headers)]
+
+    def business(self, i):
+        return self.business_headers[i % len(self.business_headers)]
+
+    def owner(self):
+        """business_project()/create_*()로 만든 데이터의 소유자 (첫 번째 사업자)"""
+        return self.business_headers[0]
+
+    def business_project(self, i):
+        """첫 번째 사업자가 소유한 프로젝트 id"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id FROM projects WHERE business_id = %s ORDER BY id LIMIT 1", (self.businesses[0][0],))
+        project_id = cursor.fetchone()[0]
+        cursor.close()
+        return project_id
+
+    def create_projects(self, n):
+        """삭제/지원 벤치마크에 쓸 프로젝트를 미리 만듭니다."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO projects (business_id, title, description, location, status)
+            SELECT %s, 'bench ' || g, 'bench', '서울 강남구', 'OPEN' FROM generate_series(1, %s) g
+            RETURNING id
+        """, (self.businesses[0][0], n))
+        ids = [row[0] for row in cursor.fetchall()]
+        self.conn.commit()
+        cursor.close()
+        return ids
+
+    def create_applications(self, n):
+        project_id = self.create_projects(1)[0]
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO applications (project_id, student_id, cover_letter)
+            SELECT %s, u.id, 'bench' FROM users u WHERE u.role = 'STUDENT' ORDER BY u.id LIMIT %s
+            RETURNING id
+        """, (project_id, n))
+        ids = [row[0] for row in cursor.fetchall()]
+        self.conn.commit()
+        cursor.close()
+        return ids
+
+    def create_rooms(self, n):
+        cursor = self.conn.cursor()
+        email = self.students[0][1]
+        rooms = [f"{email}_zz{self.run_id}{k}@bench.local" for k in range(n)]
+        cursor.execute("""
+            WITH new_rooms AS (
+                INSERT INTO chat_rooms (room_key, user_a_id) SELECT unnest(%s::text[]), %s RETURNING id
+            )
+            INSERT INTO messages (room_id, sender_id, message) SELECT id, %s, 'bench' FROM new_rooms
+        """, (rooms, self.students[0][0], self.students[0][0]))
+        self.conn.commit()
+        cursor.close()
+        return rooms
+
+
+# ============================
+#   벤치마크 대상 라우트
+# ============================
+# 각 항목: (이름, 블루프린트, 준비 함수(ctx, n) -> 반복별 인자 리스트 또는 None, 요청 함수(ctx, i, arg) -> (method, path, json, headers))
+ROUTES = [
+    ("POST /auth/signup", "auth", None,
+     lambda ctx, i, _: ("POST", "/auth/signup", {"email": f"new{ctx.run_id}{i}@bench.local", "password": "bench1234", "role": "STUDENT", "name": "신규"}, {})),
+    ("POST /auth/login", "auth", None,
+     lambda ctx, i, _: ("POST", "/auth/login", {"email": ctx.students[i % len(ctx.students)][1], "password": bench_seed.BENCH_PASSWORD}, {})),
+    ("POST /auth/change-password", "auth", None,
+     lambda ctx, i, _: ("POST", "/auth/change-password", {"current_password": bench_seed.BENCH_PASSWORD, "new_password": bench_seed.BENCH_PASSWORD}, ctx.student(i))),
+
+    ("GET /projects", "projects", None, lambda ctx, i, _: ("GET", "/projects?status=OPEN", None, {})),
+    ("GET /projects?location", "projects", None, lambda ctx, i, _: ("GET", "/projects?location=강남", None, {})),
+    ("GET /projects/<id>", "projects", None, lambda ctx, i, _: ("GET", f"/projects/{ctx.projects[i % len(ctx.projects)]}", None, {})),
+    ("GET /projects/my", "projects", None, lambda ctx, i, _: ("GET", "/projects/my", None, ctx.business(i))),
+    ("POST /projects", "projects", None,
+     lambda ctx, i, _: ("POST", "/projects", {"title": "bench", "description": "bench", "location": "서울 강남구", "required_skills": "Python,React"}, ctx.business(i))),
+    ("PUT /projects/<id>", "projects", lambda ctx, n: [ctx.business_project(0)] * n,
+     lambda ctx, i, project_id: ("PUT", f"/projects/{project_id}", {"salary": f"{i}원"}, ctx.owner())),
+    ("DELETE /projects/<id>", "projects", lambda ctx, n: ctx.create_projects(n),
+     lambda ctx, i, project_id: ("DELETE", f"/projects/{project_id}", None, ctx.owner())),
+
+    ("POST /applications", "applications", lambda ctx, n: [ctx.create_projects(1)[0]] * n,
+     lambda ctx, i, project_id: ("POST", "/applications", {"project_id": project_id, "cover_letter": "bench"}, ctx.student(i))),
+    ("GET /applications/project/<id>", "applications", lambda ctx, n: [ctx.business_project(0)] * n,
+     lambda ctx, i, project_id: ("GET", f"/applications/project/{project_id}", None, ctx.owner())),
+    ("GET /applications/my", "applications", None, lambda ctx, i, _: ("GET", "/applications/my", None, ctx.student(i))),
+    ("PUT /applications/<id>", "applications", lambda ctx, n: ctx.create_applications(n),
+     lambda ctx, i, application_id: ("PUT", f"/applications/{application_id}", {"status": "ACCEPTED"}, ctx.owner())),
+
+    ("GET /profiles/my", "profiles", None, lambda ctx, i, _: ("GET", "/profiles/my", None, ctx.student(i))),
+    ("PUT /profiles/my", "profiles", None, lambda ctx, i, _: ("PUT", "/profiles/my", {"introduction": f"벤치마크 자기소개 {i}"}, ctx.student(i))),
+    ("GET /profiles", "profiles", None, lambda ctx, i, _: ("GET", "/profiles", None, {})),
+    ("GET /profiles?skill", "profiles", None, lambda ctx, i, _: ("GET", "/profiles?skill=React", None, {})),
+    ("GET /profiles/<id>", "profiles", None, lambda ctx, i, _: ("GET", f"/profiles/{ctx.public_profiles[i % len(ctx.public_profiles)]}", None, {})),
+
+    ("GET /messages/<room_id>", "messages", None, lambda ctx, i, _: ("GET", f"/messages/{ctx.rooms[i % len(ctx.rooms)]}", None, {})),
+    ("POST /messages", "messages", None,
+     lambda ctx, i, _: ("POST", "/messages", {"room_id": ctx.student_room, "sender": ctx.students[0][1], "message": f"bench {i}"}, {})),
+    ("GET /messages/rooms/my", "messages", None, lambda ctx, i, _: ("GET", "/messages/rooms/my", None, ctx.student(i))),
+    ("DELETE /messages/rooms/<room_id>", "messages", lambda ctx, n: ctx.create_rooms(n),
+     lambda ctx, i, room: ("DELETE", f"/messages/rooms/{room}", None, ctx.student_headers[0])),
+
+    ("GET /dashboard (student)", "dashboard", None, lambda ctx, i, _: ("GET", "/dashboard", None, ctx.student(i))),
+    ("GET /dashboard (business)", "dashboard", None, lambda ctx, i, _: ("GET", "/dashboard", None, ctx.business(i))),
+    ("POST /batch", "batch", None,
+     lambda ctx, i, _: ("POST", "/batch", {"requests": [{"path": "/profiles/my"}, {"path": "/applications/my"}, {"path": "/messages/rooms/my"}]}, ctx.student(i))),
+]
+
+
+def run_route(app, ctx, route, iterations, concurrency, warmup):
+    name, _, prepare, build = route
+    total = iterations + warmup
+    args = prepare(ctx, total) if prepare else [None] * total
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker(indices):
+        client = app.test_client()
+        for i in indices:
+            method, path, body, headers = build(ctx, i, args[i])
+            started = time.perf_counter()
+            response = client.open(path, method=method, json=body, headers=headers)
+            elapsed = time.perf_counter() - started
+            if i < warmup:
+                continue
+            with lock:
+                latencies.append(elapsed * 1000)
+                if response.status_code >= 400:
+                    errors.append(response.status_code)
+
+    # 워밍업은 단일 스레드로 먼저 실행
+    worker(range(warmup))
+    chunks = [range(warmup + k, total, concurrency) for k in range(concurrency)]
+    threads = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "count": len(latencies),
+        "errors": len(errors),
+        "error_statuses": sorted(set(errors)),
+        "mean_ms": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p90_ms": round(percentile(latencies, 0.90), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+        "throughput_rps": round(len(latencies) / wall, 1) if wall > 0 else 0.0
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """기준선 대비 p90 회귀 목록"""
+    regressions = []
+    for name, current in results["routes"].items():
+        base = baseline.get("routes", {}).get(name)
+        if not base:
+            continue
+        if current["p90_ms"] > base["p90_ms"] * (1 + tolerance) and current["p90_ms"] - base["p90_ms"] >= MIN_REGRESSION_MS:
+            regressions.append((name, base["p90_ms"], current["p90_ms"]))
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, text=True).strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 엔드포인트 벤치마크")
+    bench_seed.add_scale_arguments(parser)
+    parser.add_argument("--seed-db", action="store_true", help="실행 전에 스키마를 만들고 데이터를 다시 시딩")
+    parser.add_argument("--iterations", type=int, default=100, help="라우트별 측정 횟수")
+    parser.add_argument("--warmup", type=int, default=5, help="라우트별 워밍업 횟수 (측정 제외)")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 실행 스레드 수")
+    parser.add_argument("--only", help="쉼표로 구분한 블루프린트 이름만 측정 (예: projects,messages)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="회귀 판단 허용 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 bench/baseline.json 으로 저장")
+    args = parser.parse_args()
+
+    database_url = bench_seed.get_bench_database_url()
+    # 앱이 벤치마크 DB를 사용하도록 import 전에 설정
+    os.environ["DATABASE_URL"] = database_url
+
+    conn = psycopg2.connect(database_url)
+    scale = bench_seed.parse_scale(args)
+    if args.seed_db:
+        print(f"--- 시딩: {scale} ---")
+        bench_seed.prepare_schema(database_url)
+        datagen.generate(database_url, seed=args.seed, workers=args.workers, **scale)
+
+    sys.path.insert(0, os.path.dirname(BENCH_DIR))
+    from app import create_app
+    app = create_app()
+    ctx = BenchContext(conn)
+
+    only = set(args.only.split(",")) if args.only else None
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "scale": scale if args.seed_db else None,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency
+        },
+        "routes": {}
+    }
+
+    print(f"{'route':<36} {'p50':>8} {'p90':>8} {'p99':>8} {'rps':>8} {'err':>5}")
+    for route in ROUTES:
+        if only and route[1] not in only:
+            continue
+        stats = run_route(app, ctx, route, args.iterations, args.concurrency, args.warmup)
+        results["routes"][route[0]] = stats
+        print(f"{route[0]:<36} {stats['p50_ms']:>8.2f} {stats['p90_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['throughput_rps']:>8.1f} {stats['errors']:>5}")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    result_path = os.path.join(RESULTS_DIR, f"{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n📊 결과 저장: {result_path}")
+
+    exit_code = 0
+    if os.path.exists(BASELINE_PATH) and not args.save_baseline:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ 기준선 대비 p90 회귀:")
+            for name, before, after in regressions:
+                print(f"  - {name}: {before:.2f}ms -> {after:.2f}ms")
+            exit_code = 1
+        else:
+            print("\n✅ 기준선 대비 회귀 없음")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"✅ 기준선 저장: {BASELINE_PATH}")
+
+    conn.close()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+사용자 여정(journey) 기반 HTTP 부하 테스트
+실행 중인 서버에 가중치를 둔 시나리오를 열린 모델(도착률 기반)로 실행합니다.
+- 신규 학생: 회원가입 → 로그인 → 프로필 수정 → AI 자기소개 → 프로젝트 탐색/검색 → 지원 → 채팅
+- 기존 학생: 로그인 → 대시보드 → 탐색 → 지원 → 채팅방 확인
+- 사업자: 로그인 → 공고 등록 → 내 공고 → 지원자 확인 → 수락 → 채팅방 확인
+도착률은 --start-rate 에서 --end-rate 까지 --ramp 초 동안 선형으로 증가한 뒤 --hold 초 유지되며,
+단계별 지연시간 백분위수와 에러, 구간별 추이를 bench/results/scenarios-<시각>.json 으로 저장합니다.
+
+서버는 bench.seed 로 시딩된 DB를 사용해야 하며, AI 호출은 로컬 대체 서버로 보냅니다:
+    python -m bench.fake_gemini --port 8089 &
+    GEMINI_API_KEY=fake GEMINI_API_ENDPOINT=http://127.0.0.1:8089 DATABASE_URL=$BENCH_DATABASE_URL \\
+        gunicorn --worker-class eventlet -w 1 --bind 127.0.0.1:5000 main:app &
+    python -m bench.scenarios --scale small --start-rate 1 --end-rate 20 --ramp 60 --hold 60
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+import aiohttp
+
+from . import seed as bench_seed
+from .run_bench import RESULTS_DIR, percentile
+
+# 추이 집계 구간(초)
+WINDOW_SECONDS = 10
+
+LOCATION_QUERIES = ["서울", "강남구", "마포구", "부산", "경기"]
+INTRO_INPUTS = ["파이썬 좋아하는 학생", "React로 웹사이트 만들어 본 경험이 있는 3학년입니다", "디자인 툴 능숙"]
+
+
+class Recorder:
+    def __init__(self, started):
+        self.started = started
+        self.steps = {}  # (journey, step) -> [지연시간 ms]
+        self.errors = {}  # (journey, step) -> {status: count}
+        self.journeys = {}  # journey -> {"started", "completed", "failed"}
+        self.windows = {}  # 구간 번호 -> {"arrivals", "latencies", "errors"}
+
+    def window(self, at=None):
+        index = int(((at or time.perf_counter()) - self.started) // WINDOW_SECONDS)
+        return self.windows.setdefault(index, {"arrivals": 0, "latencies": [], "errors": 0})
+
+    def record(self, journey, step, elapsed_ms, status, ok):
+        self.steps.setdefault((journey, step), []).append(elapsed_ms)
+        window = self.window()
+        window["latencies"].append(elapsed_ms)
+        if not ok:
+            counts = self.errors.setdefault((journey, step), {})
+            counts[status] = counts.get(status, 0) + 1
+            window["errors"] += 1
+
+
+class StepFailed(Exception):
+    pass
+
+
+class Session:
+    """여정 하나를 실행하는 가상 사용자. 단계마다 지연시간과 결과를 기록합니다."""
+
+    def __init__(self, http, base_url, recorder, journey, rng, think_ms):
+        self.http = http
+        self.base_url = base_url
+        self.recorder = recorder
+        self.journey = journey
+        self.rng = rng
+        self.think_ms = think_ms
+        self.token = None
+        self.email = None
+
+    async def think(self):
+        if self.think_ms > 0:
+            await asyncio.sleep(self.rng.expovariate(1000 / self.think_ms))
+
+    async def step(self, name, method, path, body=None, expect=(200, 201)):
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        started = time.perf_counter()
+        try:
+            async with self.http.request(method, self.base_url + path, json=body, headers=headers) as response:
+                status = response.status
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    data = None
+        except aiohttp.ClientError:
+            status, data = "connection_error", None
+        elapsed = (time.perf_counter() - started) * 1000
+
+        ok = status in expect
+        self.recorder.record(self.journey, name, elapsed, status, ok)
+        if not ok:
+            raise StepFailed(f"{name}: {status}")
+        await self.think()
+        return data or {}
+
+    async def login(self, email):
+        self.email = email
+        data = await self.step("login", "POST", "/auth/login", {"email": email, "password": bench_seed.BENCH_PASSWORD})
+        self.token = data.get("token")
+
+    async def browse(self):
+        """목록 → 지역 검색 → 상세. 상세를 본 프로젝트 id를 반환합니다."""
+        data = await self.step("browse", "GET", "/projects")
+        await self.step("search", "GET", f"/projects?location={self.rng.choice(LOCATION_QUERIES)}")
+        projects = data.get("projects") or []
+        if not projects:
+            return None
+        project = self.rng.choice(projects[:20])
+        await self.step("project_detail", "GET", f"/projects/{project['id']}")
+        return project["id"]
+
+    async def chat(self, other_email):
+        room_id = "_".join(sorted([self.email, other_email]))
+        await self.step("send_message", "POST", "/messages", {"room_id": room_id, "message": "안녕하세요! 문의드립니다.", "sender": self.email})
+        await self.step("read_messages", "GET", f"/messages/{room_id}")
+
+
+# ============================
+#   여정 정의
+# ============================
+async def new_student(session, ctx):
+    email = f"load-{ctx['run_id']}-{uuid.uuid4().hex[:8]}@bench.local"
+    await session.step("signup", "POST", "/auth/signup", {
+        "email": email, "password": bench_seed.BENCH_PASSWORD, "role": "STUDENT", "name": "부하테스트"
+    })
+    await session.login(email)
+    await session.step("update_profile", "PUT", "/profiles/my", {"introduction": "부하 테스트용 자기소개입니다.", "skills": "Python, React"})
+    if session.rng.random() < ctx["ai_ratio"]:
+        await session.step("generate_intro", "POST", "/ai/generate-intro", {"input": session.rng.choice(INTRO_INPUTS)})
+    project_id = await session.browse()
+    if project_id:
+        await session.step("apply", "POST", "/applications", {"project_id": project_id, "cover_letter": "열심히 하겠습니다."})
+        await session.step("my_applications", "GET", "/applications/my")
+    await session.chat(bench_seed.business_email(session.rng.randrange(ctx["businesses"])))
+
+
+async def returning_student(session, ctx):
+    await session.login(bench_seed.student_email(session.rng.randrange(ctx["students"])))
+    await session.step("dashboard", "GET", "/dashboard")
+    project_id = await session.browse()
+    if project_id:
+        # 이미 지원한 프로젝트면 409
+        await session.step("apply", "POST", "/applications", {"project_id": project_id, "cover_letter": "다시 지원합니다."}, expect=(201, 409))
+    await session.step("my_rooms", "GET", "/messages/rooms/my")
+    await session.chat(bench_seed.business_email(session.rng.randrange(ctx["businesses"])))
+
+
+async def business(session, ctx):
+    # 공고가 많은 사업자일수록 자주 접속 (datagen과 같은 쏠림)
+    await session.login(bench_seed.business_email(min(ctx["businesses"] - 1, int(ctx["businesses"] * session.rng.random() ** 2))))
+    await session.step("create_project", "POST", "/projects", {
+        "title": "[부하테스트] 웹 개발 구합니다", "description": "부하 테스트용 공고입니다.", "location": "서울 강남구",
+        "salary": "협의", "duration": "1개월", "required_skills": "React, Python"
+    })
+    data = await session.step("my_projects", "GET", "/projects/my")
+    projects = data.get("projects") or []
+    if projects:
+        project = session.rng.choice(projects[:10])
+        data = await session.step("applicants", "GET", f"/applications/project/{project['id']}")
+        pending = [a for a in data.get("applications") or [] if a.get("status") == "PENDING"]
+        if pending:
+            await session.step("accept", "PUT", f"/applications/{session.rng.choice(pending)['id']}", {"status": "ACCEPTED"})
+    await session.step("my_rooms", "GET", "/messages/rooms/my")
+
+
+JOURNEYS = {
+    "new_student": new_student,
+    "returning_student": returning_student,
+    "business": business,
+}
+DEFAULT_WEIGHTS = "new_student=2,returning_student=5,business=3"
+
+
+def parse_weights(text):
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in JOURNEYS:
+            raise SystemExit(f"❌ 알 수 없는 시나리오: {name}")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def arrival_rate(elapsed, args):
+    if elapsed < args.ramp:
+        return args.start_rate + (args.end_rate - args.start_rate) * elapsed / args.ramp
+    return args.end_rate
+
+
+async def run(args):
+    ctx = {
+        "run_id": uuid.uuid4().hex[:6],
+        "students": int(bench_seed.SCALES[args.scale]["users"] * bench_seed.STUDENT_RATIO),
+        "ai_ratio": args.ai_ratio
+    }
+    ctx["businesses"] = bench_seed.SCALES[args.scale]["users"] - ctx["students"]
+    weights = parse_weights(args.weights)
+    names = list(weights)
+    rng = random.Random(args.seed)
+
+    started = time.perf_counter()
+    recorder = Recorder(started)
+    active = set()
+    semaphore = asyncio.Semaphore(args.max_active)
+    dropped = 0
+
+    async def run_journey(name, journey_rng):
+        stats = recorder.journeys.setdefault(name, {"started": 0, "completed": 0, "failed": 0})
+        stats["started"] += 1
+        session = Session(http, args.url, recorder, name, journey_rng, args.think_ms)
+        try:
+            await JOURNEYS[name](session, ctx)
+            stats["completed"] += 1
+        except StepFailed:
+            stats["failed"] += 1
+        finally:
+            semaphore.release()
+
+    connector = aiohttp.TCPConnector(limit=args.max_active)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+        total = args.ramp + args.hold
+        while True:
+            elapsed = time.perf_counter() - started
+            if elapsed >= total:
+                break
+            await asyncio.sleep(rng.expovariate(max(arrival_rate(elapsed, args), 0.001)))
+            recorder.window()["arrivals"] += 1
+            # 동시 진행 여정이 상한에 도달하면 도착을 버리고 기록 (서버 포화 지표)
+            if semaphore.locked():
+                dropped += 1
+                continue
+            await semaphore.acquire()
+            name = rng.choices(names, weights=[weights[n] for n in names])[0]
+            task = asyncio.create_task(run_journey(name, random.Random(rng.random())))
+            active.add(task)
+            task.add_done_callback(active.discard)
+
+        if active:
+            await asyncio.wait(active)
+
+    steps = {}
+    for (journey, step), values in sorted(recorder.steps.items()):
+        values.sort()
+        steps[f"{journey}.{step}"] = {
+            "count": len(values),
+            "errors": sum(recorder.errors.get((journey, step), {}).values()),
+            "error_statuses": {str(k): v for k, v in recorder.errors.get((journey, step), {}).items()},
+            "mean_ms": round(statistics.fmean(values), 3),
+            "p50_ms": round(percentile(values, 0.50), 3),
+            "p90_ms": round(percentile(values, 0.90), 3),
+            "p99_ms": round(percentile(values, 0.99), 3),
+            "max_ms": round(values[-1], 3)
+        }
+
+    timeline = []
+    for index, window in sorted(recorder.windows.items()):
+        latencies = sorted(window["latencies"])
+        timeline.append({
+            "start_s": index * WINDOW_SECONDS,
+            "arrival_rate": round(window["arrivals"] / WINDOW_SECONDS, 2),
+            "requests": len(latencies),
+            "errors": window["errors"],
+            "p90_ms": round(percentile(latencies, 0.90), 3)
+        })
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "url": args.url,
+            "scale": args.scale,
+            "weights": weights,
+            "start_rate": args.start_rate,
+            "end_rate": args.end_rate,
+            "ramp": args.ramp,
+            "hold": args.hold,
+            "dropped_arrivals": dropped
+        },
+        "journeys": recorder.journeys,
+        "steps": steps,
+        "timeline": timeline
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 여정 기반 HTTP 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="서버 주소")
+    parser.add_argument("--scale", choices=bench_seed.SCALES.keys(), default="small", help="서버 DB를 시딩한 규모 (로그인할 사용자 범위)")
+    parser.add_argument("--weights", default=DEFAULT_WEIGHTS, help="시나리오 가중치 (예: new_student=1,business=1)")
+    parser.add_argument("--start-rate", type=float, default=1.0, help="시작 도착률 (여정/초)")
+    parser.add_argument("--end-rate", type=float, default=10.0, help="최종 도착률 (여정/초)")
+    parser.add_argument("--ramp", type=float, default=60.0, help="도착률 증가 시간(초)")
+    parser.add_argument("--hold", type=float, default=60.0, help="최종 도착률 유지 시간(초)")
+    parser.add_argument("--think-ms", type=float, default=500.0, help="단계 사이 평균 대기 시간 (ms)")
+    parser.add_argument("--ai-ratio", type=float, default=0.3, help="신규 학생 중 AI 자기소개를 호출하는 비율")
+    parser.add_argument("--max-active", type=int, default=500, help="동시에 진행 중인 여정 상한")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    print(f"\n{'step':<40} {'count':>7} {'err':>5} {'p50(ms)':>9} {'p90(ms)':>9} {'p99(ms)':>9}")
+    for name, step in report["steps"].items():
+        print(f"{name:<40} {step['count']:>7} {step['errors']:>5} {step['p50_ms']:>9.2f} {step['p90_ms']:>9.2f} {step['p99_ms']:>9.2f}")
+    print()
+    for name, stats in report["journeys"].items():
+        print(f"{name}: 시작 {stats['started']}, 완료 {stats['completed']}, 실패 {stats['failed']}")
+    if report["meta"]["dropped_arrivals"]:
+        print(f"⚠️  동시 여정 상한으로 버려진 도착: {report['meta']['dropped_arrivals']}")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"scenarios-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n📊 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
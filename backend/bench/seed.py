@@ -0,0 +1,93 @@
+"""
+벤치마크용 PostgreSQL 데이터 시딩 스크립트
+BENCH_DATABASE_URL이 가리키는 전용 DB에 마이그레이션으로 스키마를 만들고 지정한 규모의 데이터를 적재합니다.
+데이터 생성과 병렬 COPY 적재는 bench.datagen 에서 수행하며, 이 모듈은 규모 설정과 스키마 준비를 담당합니다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql://localhost/ieum_bench python -m bench.seed --scale small
+    BENCH_DATABASE_URL=... python -m bench.seed --users 100000 --projects 50000 --applications 1000000 --messages 10000000
+"""
+import os
+import sys
+import psycopg2
+from dotenv import load_dotenv
+
+import migrate
+
+load_dotenv()
+
+# 모든 시딩 사용자의 비밀번호 (해시는 한 번만 계산)
+BENCH_PASSWORD = "bench1234"
+
+# 전체 사용자 중 학생 비율
+STUDENT_RATIO = 0.8
+
+SCALES = {
+    "tiny": {"users": 200, "projects": 100, "applications": 1_000, "messages": 5_000},
+    "small": {"users": 2_000, "projects": 1_000, "applications": 20_000, "messages": 200_000},
+    "medium": {"users": 20_000, "projects": 10_000, "applications": 200_000, "messages": 2_000_000},
+    "large": {"users": 100_000, "projects": 50_000, "applications": 1_000_000, "messages": 10_000_000},
+}
+
+
+def get_bench_database_url():
+    """벤치마크 DB URL. 실수로 운영 DB를 덮어쓰지 않도록 DATABASE_URL과 같으면 거부합니다."""
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        sys.exit("❌ BENCH_DATABASE_URL 환경 변수가 설정되지 않았습니다.")
+    if url == os.getenv("DATABASE_URL"):
+        sys.exit("❌ BENCH_DATABASE_URL은 DATABASE_URL과 다른 전용 DB여야 합니다.")
+    return url
+
+
+def student_email(index):
+    return f"student{index}@bench.local"
+
+
+def business_email(index):
+    return f"biz{index}@bench.local"
+
+
+def room_id_for(student_index, business_index):
+    """프론트엔드와 같은 방식(두 이메일 정렬 후 '_'로 연결)으로 room_id 생성"""
+    return "_".join(sorted([student_email(student_index), business_email(business_index)]))
+
+
+def prepare_schema(database_url):
+    """public 스키마를 비우고 migrations/를 처음부터 적용합니다. (운영 DB와 같은 테이블/인덱스)"""
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+    cursor.execute("DROP SCHEMA public CASCADE; CREATE SCHEMA public")
+    conn.commit()
+    cursor.close()
+    conn.close()
+    migrate.migrate(database_url)
+
+
+def parse_scale(args):
+    scale = dict(SCALES[args.scale])
+    for key in scale:
+        value = getattr(args, key)
+        if value is not None:
+            scale[key] = value
+    return scale
+
+
+def add_scale_arguments(parser):
+    parser.add_argument("--scale", choices=SCALES.keys(), default="small", help="기본 데이터 규모")
+    parser.add_argument("--users", type=int, help="사용자 수 (학생 80%%, 사업자 20%%)")
+    parser.add_argument("--projects", type=int, help="프로젝트 수")
+    parser.add_argument("--applications", type=int, help="지원서 수")
+    parser.add_argument("--messages", type=int, help="채팅 메시지 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="병렬 적재 워커 프로세스 수")
+
+
+def main():
+    # 실제 생성은 bench.datagen 이 담당합니다.
+    from . import datagen
+    datagen.main()
+
+
+if __name__ == "__main__":
+    main()
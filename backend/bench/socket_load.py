@@ -0,0 +1,341 @@
+"""
+Socket.IO 채팅 부하 테스트
+실행 중인 서버(main.py / gunicorn eventlet 워커)에 수천 개의 가상 클라이언트를 접속시켜
+join_room 후 설정한 속도로 send_message를 보내고 다음을 측정합니다.
+- 브로드캐스트 지연시간: 보낸 시각부터 같은 방의 각 클라이언트가 receive_message를 받기까지 (p50/p90/p99)
+- 유실 메시지: 방 인원 수만큼 받아야 하는 수신 중 도착하지 않은 수
+- DB 쓰기 지연: 보낸 시각부터 messages 테이블에서 조회되기까지 (BENCH_DATABASE_URL 설정 시)
+- 서버 CPU/메모리: --server-pid 프로세스의 /proc 통계 (Linux)
+
+서버는 connect 때 JWT를 보낸 소켓만 본인 이메일이 들어 있는 방에 참여시키므로,
+시딩된 사용자를 BENCH_DATABASE_URL에서 찾아 사용자별 토큰(SECRET_KEY, HS256)을 만들어 접속합니다.
+join_room_error를 받은 클라이언트는 참여 실패로 집계합니다.
+
+사용법:
+    gunicorn --worker-class eventlet -w 1 --bind 127.0.0.1:5000 main:app &
+    BENCH_DATABASE_URL=... python -m bench.socket_load --clients 2000 --room-size 2 --rate 0.5 --duration 60 --server-pid <PID>
+
+클라이언트는 bench/requirements.txt 의 aiohttp가 필요합니다 (websocket 전송).
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+import psycopg2
+import socketio
+from dotenv import load_dotenv
+
+from . import seed as bench_seed
+from .run_bench import RESULTS_DIR, percentile
+
+load_dotenv()
+
+# 부하 메시지 식별용 접두어 (DB 조회 및 정리에 사용)
+MESSAGE_PREFIX = "load"
+
+# 측정 종료 후 늦게 도착하는 메시지를 기다리는 시간
+DRAIN_SECONDS = 5.0
+
+# DB 폴링 간격 (DB 쓰기 지연 측정 해상도)
+DB_POLL_INTERVAL = 0.2
+
+# /proc 샘플링 간격
+PROC_SAMPLE_INTERVAL = 1.0
+
+
+class LoadStats:
+    def __init__(self):
+        self.sent = {}  # message -> (보낸 시각, 기대 수신 수)
+        self.received = {}  # message -> 수신 수
+        self.latencies = []
+        self.db_lags = []
+        self.db_seen = set()
+        self.connect_failures = 0
+        self.join_failures = 0
+        self.send_errors = 0
+        self.disconnects = 0
+
+
+class ChatClient:
+    def __init__(self, index, email, room_id, stats, run_id):
+        self.index = index
+        self.email = email
+        self.token = None
+        self.room_id = room_id
+        self.stats = stats
+        self.run_id = run_id
+        self.seq = 0
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.sio.on("receive_message", self.on_message)
+        self.sio.on("join_room_error", self.on_join_error)
+        self.sio.on("disconnect", self.on_disconnect)
+
+    async def on_message(self, data):
+        message = data.get("message", "") if isinstance(data, dict) else ""
+        sent = self.stats.sent.get(message)
+        if sent is None:
+            return
+        self.stats.latencies.append((time.perf_counter() - sent[0]) * 1000)
+        self.stats.received[message] = self.stats.received.get(message, 0) + 1
+
+    async def on_join_error(self, *args):
+        self.stats.join_failures += 1
+
+    async def on_disconnect(self, *args):
+        self.stats.disconnects += 1
+
+    async def connect(self, url):
+        try:
+            await self.sio.connect(url, auth={"token": self.token}, transports=["websocket"], wait_timeout=30)
+            await self.sio.emit("join_room", self.room_id)
+            return True
+        except Exception:
+            self.stats.connect_failures += 1
+            return False
+
+    async def send(self, room_size):
+        self.seq += 1
+        message = f"{MESSAGE_PREFIX}:{self.run_id}:{self.index}:{self.seq}"
+        self.stats.sent[message] = (time.perf_counter(), room_size)
+        try:
+            await self.sio.emit("send_message", {"room_id": self.room_id, "message": message, "sender": self.email})
+        except Exception:
+            self.stats.send_errors += 1
+
+    async def run(self, rate, room_size, deadline, rng):
+        # 포아송 도착: 평균 rate(초당)로 메시지 전송
+        while True:
+            await asyncio.sleep(rng.expovariate(rate))
+            if time.perf_counter() >= deadline or not self.sio.connected:
+                return
+            await self.send(room_size)
+
+
+async def poll_db(database_url, run_id, stats, stop):
+    """부하 메시지가 messages 테이블에 보이는 시각을 기록합니다."""
+    loop = asyncio.get_running_loop()
+    conn = await loop.run_in_executor(None, psycopg2.connect, database_url)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    last_id = 0
+    pattern = f"{MESSAGE_PREFIX}:{run_id}:%"
+
+    def fetch():
+        cursor.execute("SELECT id, message FROM messages WHERE id > %s AND message LIKE %s ORDER BY id", (last_id, pattern))
+        return cursor.fetchall()
+
+    stopped_at = None
+    try:
+        while True:
+            rows = await loop.run_in_executor(None, fetch)
+            now = time.perf_counter()
+            for row_id, message in rows:
+                last_id = max(last_id, row_id)
+                sent = stats.sent.get(message)
+                if sent and message not in stats.db_seen:
+                    stats.db_seen.add(message)
+                    stats.db_lags.append((now - sent[0]) * 1000)
+            # 종료 후에는 모든 메시지가 보이거나 DRAIN_SECONDS가 지날 때까지 계속 조회
+            if stop.is_set():
+                stopped_at = stopped_at or now
+                if len(stats.db_seen) >= len(stats.sent) or now - stopped_at > DRAIN_SECONDS:
+                    return
+            await asyncio.sleep(DB_POLL_INTERVAL)
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def read_proc(pid):
+    """(user+system CPU 초, RSS 바이트)"""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    cpu = (int(fields[11]) + int(fields[12])) / ticks
+    with open(f"/proc/{pid}/statm") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return cpu, rss
+
+
+async def sample_process(pid, samples, stop):
+    previous = read_proc(pid)
+    previous_time = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(PROC_SAMPLE_INTERVAL)
+        try:
+            cpu, rss = read_proc(pid)
+        except (FileNotFoundError, ProcessLookupError):
+            return
+        now = time.perf_counter()
+        samples.append({"cpu_percent": (cpu - previous[0]) / (now - previous_time) * 100, "rss_mb": rss / 1024 / 1024})
+        previous, previous_time = (cpu, rss), now
+
+
+def build_clients(args, stats, run_id):
+    """room_size명씩 같은 방에 배정. 방 하나는 학생 1명 + 사업자(room_size-1)명이며, room_id는 프론트엔드처럼 이메일을 정렬해 연결합니다."""
+    clients = []
+    room_count = max(1, args.clients // args.room_size)
+    for room in range(room_count):
+        emails = [bench_seed.student_email(room)] + [bench_seed.business_email(room * args.room_size + k) for k in range(args.room_size - 1)]
+        room_id = "_".join(sorted(emails))
+        for email in emails:
+            clients.append(ChatClient(len(clients), email, room_id, stats, run_id))
+    return clients
+
+
+def issue_tokens(clients, database_url):
+    """시딩된 사용자(id, email, role)로 클라이언트별 JWT를 만듭니다. (서버와 같은 SECRET_KEY 필요)"""
+    from app.auth import SECRET_KEY
+    import jwt
+
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, email, role FROM users WHERE email = ANY(%s)", (list({c.email for c in clients}),))
+    users = {email: (user_id, role) for user_id, email, role in cursor.fetchall()}
+    cursor.close()
+    conn.close()
+
+    missing = [c.email for c in clients if c.email not in users]
+    if missing:
+        sys.exit(f"❌ 시딩되지 않은 사용자 {len(missing)}명 (예: {missing[0]}). --clients/--room-size를 줄이거나 더 큰 규모로 시딩하세요.")
+    expires = datetime.datetime.utcnow() + datetime.timedelta(hours=12)
+    for client in clients:
+        user_id, role = users[client.email]
+        payload = {"id": user_id, "email": client.email, "role": role, "exp": expires}
+        client.token = jwt.encode(payload, SECRET_KEY, algorithm="HS256")
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean_ms": round(statistics.fmean(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 0.50), 3),
+        "p90_ms": round(percentile(values, 0.90), 3),
+        "p99_ms": round(percentile(values, 0.99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0
+    }
+
+
+async def run(args):
+    run_id = uuid.uuid4().hex[:8]
+    stats = LoadStats()
+    clients = build_clients(args, stats, run_id)
+    rng = random.Random(args.seed)
+    database_url = os.getenv("BENCH_DATABASE_URL")
+    if not database_url:
+        sys.exit("❌ BENCH_DATABASE_URL 환경 변수가 설정되지 않았습니다. (접속 토큰을 만들 시딩 사용자 조회에 필요)")
+    issue_tokens(clients, database_url)
+
+    # 접속: ramp 초 동안 고르게 나눠 접속 (동시 접속 시도는 connect_concurrency로 제한)
+    print(f"--- {len(clients)}명 접속 중 (방 {len(clients) // args.room_size}개, ramp {args.ramp}s) ---")
+    semaphore = asyncio.Semaphore(args.connect_concurrency)
+    started = time.perf_counter()
+
+    async def connect(client, delay):
+        await asyncio.sleep(delay)
+        async with semaphore:
+            return await client.connect(args.url)
+
+    results = await asyncio.gather(*(connect(c, args.ramp * i / len(clients)) for i, c in enumerate(clients)))
+    connected = [c for c, ok in zip(clients, results) if ok]
+    connect_seconds = time.perf_counter() - started
+    print(f"  - 접속 완료: {len(connected)}/{len(clients)} ({connect_seconds:.1f}s)")
+
+    stop = asyncio.Event()
+    background = []
+    proc_samples = []
+    if args.server_pid:
+        background.append(asyncio.create_task(sample_process(args.server_pid, proc_samples, stop)))
+    if not args.no_db:
+        background.append(asyncio.create_task(poll_db(database_url, run_id, stats, stop)))
+
+    print(f"--- {args.duration}s 동안 클라이언트당 초당 {args.rate}개 전송 ---")
+    deadline = time.perf_counter() + args.duration
+    await asyncio.gather(*(c.run(args.rate, args.room_size, deadline, random.Random(rng.random())) for c in connected))
+
+    await asyncio.sleep(DRAIN_SECONDS)
+    stop.set()
+    await asyncio.gather(*background)
+    await asyncio.gather(*(c.sio.disconnect() for c in connected), return_exceptions=True)
+
+    expected = sum(room_size for _, room_size in stats.sent.values())
+    received = sum(stats.received.values())
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "url": args.url,
+            "clients": len(clients),
+            "connected": len(connected),
+            "room_size": args.room_size,
+            "rate_per_client": args.rate,
+            "duration": args.duration,
+            "connect_seconds": round(connect_seconds, 2)
+        },
+        "messages": {
+            "sent": len(stats.sent),
+            "send_rate": round(len(stats.sent) / args.duration, 1),
+            "expected_deliveries": expected,
+            "delivered": received,
+            "dropped": expected - received,
+            "send_errors": stats.send_errors,
+            "connect_failures": stats.connect_failures,
+            "join_failures": stats.join_failures,
+            "disconnects": stats.disconnects
+        },
+        "broadcast_latency": summarize(stats.latencies),
+        "db_write_lag": summarize(stats.db_lags) if not args.no_db else None,
+        "db_missing": len(stats.sent) - len(stats.db_seen) if not args.no_db else None,
+        "server": {
+            "cpu_percent_mean": round(statistics.fmean(s["cpu_percent"] for s in proc_samples), 1),
+            "cpu_percent_max": round(max(s["cpu_percent"] for s in proc_samples), 1),
+            "rss_mb_max": round(max(s["rss_mb"] for s in proc_samples), 1)
+        } if proc_samples else None
+    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Socket.IO 채팅 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="서버 주소")
+    parser.add_argument("--clients", type=int, default=1000, help="가상 클라이언트 수")
+    parser.add_argument("--room-size", type=int, default=2, help="채팅방당 인원")
+    parser.add_argument("--rate", type=float, default=0.2, help="클라이언트당 초당 메시지 수")
+    parser.add_argument("--duration", type=int, default=30, help="전송 시간(초)")
+    parser.add_argument("--ramp", type=float, default=10.0, help="전체 클라이언트 접속에 걸리는 시간(초)")
+    parser.add_argument("--connect-concurrency", type=int, default=200, help="동시 접속 시도 수")
+    parser.add_argument("--server-pid", type=int, help="CPU/메모리를 측정할 서버 프로세스 PID")
+    parser.add_argument("--no-db", action="store_true", help="DB 쓰기 지연 측정 생략")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    messages = report["messages"]
+    latency = report["broadcast_latency"]
+    print(f"\n보냄 {messages['sent']} ({messages['send_rate']}/s), 전달 {messages['delivered']}/{messages['expected_deliveries']}, 유실 {messages['dropped']}")
+    if messages["join_failures"]:
+        print(f"⚠️ join_room 거부 {messages['join_failures']}건 (토큰의 SECRET_KEY가 서버와 같은지 확인)")
+    print(f"브로드캐스트 지연 p50 {latency['p50_ms']}ms / p90 {latency['p90_ms']}ms / p99 {latency['p99_ms']}ms / max {latency['max_ms']}ms")
+    if report["db_write_lag"]:
+        lag = report["db_write_lag"]
+        print(f"DB 쓰기 지연 p50 {lag['p50_ms']}ms / p99 {lag['p99_ms']}ms, 미저장 {report['db_missing']}")
+    if report["server"]:
+        server = report["server"]
+        print(f"서버 CPU 평균 {server['cpu_percent_mean']}% / 최대 {server['cpu_percent_max']}%, RSS 최대 {server['rss_mb_max']}MB")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"socket-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n📊 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
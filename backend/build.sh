@@ -10,7 +10,7 @@ pip install --upgrade pip
 echo "--- Installing packages from requirements.txt ---"
 pip install --no-cache-dir -r requirements.txt
 
-echo "--- Initializing database ---"
-python init_db.py
+echo "--- Applying database migrations ---"
+python migrate.py
 
 echo "--- Build script finished successfully ---"
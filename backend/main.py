@@ -4,6 +4,13 @@ eventlet.monkey_patch()
 
 from app import create_app, socketio
 from app.socket_events import register_socket_handlers
+from app import message_archive
+from app import purge
+from app import notifications
+from app import idempotency
+from app import semantic
+from app import autocomplete
+from app import popularity
 
 # Flask 앱 생성 (CORS는 __init__.py에서 설정됨)
 app = create_app()
@@ -12,6 +19,27 @@ app = create_app()
 register_socket_handlers(socketio)
 print("Socket.IO event handlers registered")  # 디버깅용
 
+# messages 월별 파티션 생성과 보존 기간이 지난 파티션 아카이브를 주기적으로 실행
+message_archive.start_maintenance(socketio)
+
+# 채팅방/프로젝트 삭제 요청(purge_jobs)을 배치로 처리하는 작업자
+purge.start_worker(socketio)
+
+# 알림 outbox(notifications)에 쌓인 알림을 사용자별 Socket.IO 방으로 푸시
+notifications.start_dispatcher(socketio)
+
+# 만료된 Idempotency-Key 정리
+idempotency.start_cleanup(socketio)
+
+# 의미 검색 인덱스를 미리 올리고, 다른 프로세스의 변경 반영/디스크 저장을 주기적으로 실행
+semantic.start_sync(socketio)
+
+# 기술/지역 자동완성 인덱스를 미리 올리고 주기적으로 DB에서 다시 만듦
+autocomplete.start_refresh(socketio)
+
+# 워커 메모리에 모은 프로젝트 조회수/지원 수를 주기적으로 한 번에 반영 (인기순 정렬)
+popularity.start_flusher(socketio)
+
 if __name__ == '__main__':
     # SocketIO로 앱 실행 (개발 모드)
     socketio.run(app, debug=True, port=5000)
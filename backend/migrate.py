@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+DB 스키마 마이그레이션 실행기
+migrations/ 디렉터리의 번호순 파일(NNNN_설명.sql 또는 NNNN_설명.py)을 아직 적용되지 않은 것만 차례로 적용하고
+schema_migrations 테이블에 기록합니다.
+- .sql: 파일 전체를 하나의 트랜잭션으로 실행
+        첫 줄들에 "-- migrate: no-transaction"이 있으면 문장을 하나씩 autocommit으로 실행 (CREATE INDEX CONCURRENTLY 등)
+- .py: upgrade(conn) 함수를 실행 (배치 백필처럼 트랜잭션을 직접 나눠야 하는 경우)
+       모듈에 TRANSACTION = False가 있으면 autocommit 연결로 실행
+
+모든 세션에 lock_timeout(MIGRATION_LOCK_TIMEOUT)을 걸어, 잠금을 오래 기다리며 뒤에 오는 요청까지 막는 일을 피합니다.
+잠금을 얻지 못하면 MIGRATION_LOCK_RETRIES번까지 다시 시도합니다.
+
+사용법:
+    python migrate.py              # 대기 중인 마이그레이션 적용
+    python migrate.py --status     # 적용 여부 목록
+    python migrate.py --dry-run    # 적용하지 않고 문장별 예상 잠금/재작성 영향만 출력
+"""
+import argparse
+import importlib.util
+import os
+import re
+import sys
+import time
+import psycopg2
+from psycopg2 import errors
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+MIGRATION_FILE_RE = re.compile(r"^(?P<version>\d{4})_(?P<name>[a-z0-9_]+)\.(?P<kind>sql|py)$")
+NO_TRANSACTION_RE = re.compile(r"^\s*--\s*migrate:\s*no-transaction\s*$", re.IGNORECASE | re.MULTILINE)
+
+# 잠금 대기 한도와 재시도 횟수
+MIGRATION_LOCK_TIMEOUT = os.getenv("MIGRATION_LOCK_TIMEOUT", "5s")
+MIGRATION_LOCK_RETRIES = int(os.getenv("MIGRATION_LOCK_RETRIES", "3"))
+# batched_update 기본 배치 크기와 배치 사이 대기 시간(초)
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "5000"))
+MIGRATION_BATCH_PAUSE = float(os.getenv("MIGRATION_BATCH_PAUSE", "0.05"))
+
+VERSION_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(4) PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+def discover_migrations():
+    """(version, name, kind, path) 목록을 버전순으로 반환"""
+    migrations = []
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        match = MIGRATION_FILE_RE.match(filename)
+        if match:
+            migrations.append((match.group("version"), match.group("name"), match.group("kind"), os.path.join(MIGRATIONS_DIR, filename)))
+
+    versions = [m[0] for m in migrations]
+    if len(versions) != len(set(versions)):
+        sys.exit("❌ 같은 버전 번호를 가진 마이그레이션 파일이 있습니다.")
+    return migrations
+
+
+def applied_versions(conn, create=True):
+    """{version: applied_at}. create=False면 버전 테이블이 없을 때 만들지 않고 빈 결과를 반환합니다."""
+    cursor = conn.cursor()
+    if create:
+        cursor.execute(VERSION_TABLE_SQL)
+    else:
+        cursor.execute("SELECT to_regclass('schema_migrations')")
+        if cursor.fetchone()[0] is None:
+            cursor.close()
+            return {}
+    cursor.execute("SELECT version, applied_at FROM schema_migrations")
+    versions = dict(cursor.fetchall())
+    conn.commit()
+    cursor.close()
+    return versions
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location(f"migration_{os.path.basename(path)[:-3]}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_sql(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def split_statements(sql):
+    """SQL 문자열을 문장 단위로 분리. 따옴표/식별자/달러 인용($$, $tag$)과 주석 안의 ';'는 무시합니다."""
+    statements = []
+    current = []
+    i = 0
+    length = len(sql)
+    while i < length:
+        ch = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            end = length if end == -1 else end
+            current.append(sql[i:end])
+            i = end
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            current.append(sql[i:end])
+            i = end
+        elif ch in ("'", '"'):
+            end = i + 1
+            while end < length:
+                if sql[end] == ch:
+                    # '' 또는 "" 는 이스케이프된 따옴표
+                    if end + 1 < length and sql[end + 1] == ch:
+                        end += 2
+                        continue
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+        elif ch == "$" and re.match(r"\$[A-Za-z_]*\$", sql[i:]):
+            tag = re.match(r"\$[A-Za-z_]*\$", sql[i:]).group(0)
+            end = sql.find(tag, i + len(tag))
+            end = length if end == -1 else end + len(tag)
+            current.append(sql[i:end])
+            i = end
+        elif ch == ";":
+            statements.append("".join(current))
+            current = []
+            i += 1
+        else:
+            current.append(ch)
+            i += 1
+    statements.append("".join(current))
+    return [s.strip() for s in statements if strip_comments(s).strip()]
+
+
+def strip_comments(statement):
+    statement = re.sub(r"/\*.*?\*/", " ", statement, flags=re.DOTALL)
+    return re.sub(r"--[^\n]*", " ", statement)
+
+
+def set_lock_timeout(conn):
+    cursor = conn.cursor()
+    cursor.execute("SET lock_timeout = %s", (MIGRATION_LOCK_TIMEOUT,))
+    cursor.close()
+    if not conn.autocommit:
+        conn.commit()
+
+
+def with_lock_retry(func, *args):
+    """잠금 대기 시간 초과(LockNotAvailable) 시 점점 길게 쉬었다가 다시 실행"""
+    for attempt in range(1, MIGRATION_LOCK_RETRIES + 2):
+        try:
+            return func(*args)
+        except errors.LockNotAvailable:
+            if attempt > MIGRATION_LOCK_RETRIES:
+                raise
+            wait = 2 ** attempt
+            print(f"  ⚠️ 잠금을 얻지 못했습니다 (lock_timeout={MIGRATION_LOCK_TIMEOUT}). {wait}초 후 다시 시도 ({attempt}/{MIGRATION_LOCK_RETRIES})")
+            time.sleep(wait)
+
+
+# ==================================================
+#   온라인 변경 도우미 (.py 마이그레이션에서 사용)
+# ==================================================
+def batched_update(conn, table, set_sql, where_sql="TRUE", params=(), key="id", batch_size=None, pause=None):
+    """
+    큰 테이블을 key(정수 기본키) 구간별로 나눠 UPDATE하고 배치마다 커밋합니다.
+    한 번에 잠그는 행이 batch_size개로 제한되어 운영 중인 쓰기를 오래 막지 않습니다.
+        batched_update(conn, "students", "is_profile_public = %s", "is_profile_public IS NULL", (True,))
+    params는 set_sql, where_sql 순서대로 들어가는 %s 값입니다. 반환값: 변경된 행 수
+    """
+    batch_size = batch_size or MIGRATION_BATCH_SIZE
+    pause = MIGRATION_BATCH_PAUSE if pause is None else pause
+
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT MIN({key}), MAX({key}) FROM {table}")
+    low, high = cursor.fetchone()
+    conn.commit()
+    if low is None:
+        cursor.close()
+        return 0
+
+    updated = 0
+    start = low
+    while start <= high:
+        cursor.execute(
+            f"UPDATE {table} SET {set_sql} WHERE ({where_sql}) AND {key} >= %s AND {key} < %s",
+            tuple(params) + (start, start + batch_size)
+        )
+        updated += cursor.rowcount
+        conn.commit()
+        start += batch_size
+        if pause:
+            time.sleep(pause)
+    cursor.close()
+    print(f"  - {table}: {updated:,}행 변경")
+    return updated
+
+
+def invalid_indexes(conn, names=None):
+    """CREATE INDEX CONCURRENTLY가 실패하면 남는 INVALID 인덱스 이름 목록"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT c.relname
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE NOT i.indisvalid AND n.nspname = current_schema()
+    """)
+    found = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    if not conn.autocommit:
+        conn.commit()
+    if names is not None:
+        found = [name for name in found if name in names]
+    return found
+
+
+CONCURRENT_INDEX_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w\"]+)",
+    re.IGNORECASE
+)
+
+
+def _concurrent_index_names(statements):
+    names = set()
+    for statement in statements:
+        match = CONCURRENT_INDEX_RE.search(strip_comments(statement))
+        if match:
+            names.add(match.group("name").strip('"'))
+    return names
+
+
+# ==================================================
+#   적용
+# ==================================================
+def _apply_transactional_sql(conn, path):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(read_sql(path))
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _apply_no_transaction_sql(conn, path):
+    statements = split_statements(read_sql(path))
+    index_names = _concurrent_index_names(statements)
+
+    # 이전 실행이 중간에 실패해 INVALID 인덱스가 남아 있으면 IF NOT EXISTS에 걸려 그대로 남으므로 먼저 삭제
+    cursor = conn.cursor()
+    for name in invalid_indexes(conn, index_names):
+        print(f"  - 이전에 실패한 INVALID 인덱스 {name} 삭제")
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+    for statement in statements:
+        print(f"  > {' '.join(strip_comments(statement).split())[:100]}")
+        with_lock_retry(cursor.execute, statement)
+    cursor.close()
+
+    invalid = invalid_indexes(conn, index_names)
+    if invalid:
+        raise RuntimeError(f"INVALID 상태로 남은 인덱스가 있습니다: {', '.join(invalid)} (다시 실행하면 삭제 후 재생성합니다)")
+
+
+def apply_migration(conn, version, name, kind, path):
+    if kind == "sql":
+        no_transaction = bool(NO_TRANSACTION_RE.search(read_sql(path)))
+    else:
+        module = load_module(path)
+        no_transaction = getattr(module, "TRANSACTION", True) is False
+
+    conn.autocommit = no_transaction
+    set_lock_timeout(conn)
+    try:
+        if kind == "sql" and no_transaction:
+            _apply_no_transaction_sql(conn, path)
+        elif kind == "sql":
+            with_lock_retry(_apply_transactional_sql, conn, path)
+        else:
+            module.upgrade(conn)
+
+        # 트랜잭션 모드에서는 버전 기록도 같은 트랜잭션으로 커밋
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+        cursor.close()
+        if not conn.autocommit:
+            conn.commit()
+    except Exception:
+        if not conn.autocommit:
+            conn.rollback()
+        raise
+    finally:
+        conn.autocommit = False
+
+
+def migrate(database_url):
+    conn = psycopg2.connect(database_url)
+    try:
+        done = applied_versions(conn)
+        pending = [m for m in discover_migrations() if m[0] not in done]
+        if not pending:
+            print("✅ 적용할 마이그레이션이 없습니다.")
+            return
+
+        for version, name, kind, path in pending:
+            print(f"--- {version}_{name} 적용 중 ---")
+            started = time.perf_counter()
+            apply_migration(conn, version, name, kind, path)
+            print(f"  ✅ 완료 ({time.perf_counter() - started:.1f}s)")
+    finally:
+        conn.close()
+
+
+def status(database_url):
+    conn = psycopg2.connect(database_url)
+    try:
+        done = applied_versions(conn, create=False)
+    finally:
+        conn.close()
+
+    for version, name, kind, path in discover_migrations():
+        applied_at = done.get(version)
+        state = f"적용됨 {applied_at:%Y-%m-%d %H:%M:%S}" if applied_at else "대기"
+        print(f"{f'{version}_{name}.{kind}':<40} {state}")
+
+
+# ==================================================
+#   dry-run: 문장별 예상 잠금/재작성 영향
+# ==================================================
+# 잠금 수준별로 막히는 작업
+LOCK_EFFECTS = {
+    "ACCESS EXCLUSIVE": "읽기/쓰기 모두 차단",
+    "EXCLUSIVE": "쓰기 차단, 읽기 허용",
+    "SHARE ROW EXCLUSIVE": "쓰기 차단, 읽기 허용",
+    "SHARE": "쓰기 차단, 읽기 허용",
+    "SHARE UPDATE EXCLUSIVE": "읽기/쓰기 허용, 다른 DDL/VACUUM만 대기",
+    "ROW EXCLUSIVE": "대상 행만 잠금, 다른 행의 읽기/쓰기 허용",
+}
+
+# 매 행마다 값이 달라지는 기본값 → ADD COLUMN 시 테이블 재작성
+VOLATILE_DEFAULT_RE = re.compile(r"\b(random|clock_timestamp|gen_random_uuid|uuid_generate_v4|nextval)\s*\(|\b(BIG)?SERIAL\b", re.IGNORECASE)
+TABLE_NAME = r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(?:ONLY\s+)?(?P<table>[\w.\"]+)"
+
+# (패턴, 잠금 수준, 영향) - 위에서부터 처음 맞는 규칙을 사용
+STATEMENT_RULES = [
+    (rf"^CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\b.*?\bON\s+{TABLE_NAME}", "SHARE UPDATE EXCLUSIVE", "테이블 전체 2회 스캔, 쓰기 허용"),
+    (rf"^CREATE\s+(?:UNIQUE\s+)?INDEX\b.*?\bON\s+{TABLE_NAME}", "SHARE", "테이블 전체 스캔 동안 쓰기 차단 → CONCURRENTLY 권장"),
+    (rf"^CREATE\s+TABLE\s+{TABLE_NAME}", None, "새 테이블 (기존 테이블 영향 없음, FK 대상 테이블은 SHARE ROW EXCLUSIVE)"),
+    (rf"^DROP\s+INDEX\s+CONCURRENTLY\b", "SHARE UPDATE EXCLUSIVE", "재작성 없음"),
+    (rf"^DROP\s+INDEX\b", "ACCESS EXCLUSIVE", "짧은 잠금, 재작성 없음 → CONCURRENTLY 권장"),
+    (rf"^DROP\s+TABLE\s+{TABLE_NAME}", "ACCESS EXCLUSIVE", "짧은 잠금, 데이터 삭제"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bADD\s+(?:COLUMN\s+)?(?!CONSTRAINT\b).*", "ACCESS EXCLUSIVE", None),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bALTER\s+(?:COLUMN\s+)?[\w\"]+\s+(?:SET\s+DATA\s+)?TYPE\b", "ACCESS EXCLUSIVE", "테이블 재작성 + 인덱스 재생성 (호환 타입 제외)"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bSET\s+NOT\s+NULL\b", "ACCESS EXCLUSIVE", "테이블 전체 스캔 동안 읽기/쓰기 차단 → CHECK (...) NOT VALID + VALIDATE 권장"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bADD\s+CONSTRAINT\b.*\bNOT\s+VALID\b", "SHARE ROW EXCLUSIVE", "짧은 잠금, 기존 행 검사 생략 (이후 VALIDATE CONSTRAINT)"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bADD\s+CONSTRAINT\b.*\bFOREIGN\s+KEY\b", "SHARE ROW EXCLUSIVE", "기존 행 전체 검사 동안 쓰기 차단 (양쪽 테이블) → NOT VALID 권장"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bADD\s+CONSTRAINT\b.*\b(?:UNIQUE|PRIMARY\s+KEY)\b(?!.*\bUSING\s+INDEX\b)", "ACCESS EXCLUSIVE", "인덱스 생성 동안 읽기/쓰기 차단 → CREATE UNIQUE INDEX CONCURRENTLY 후 USING INDEX 권장"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bADD\s+CONSTRAINT\b", "ACCESS EXCLUSIVE", "기존 행 전체 검사 동안 읽기/쓰기 차단 → NOT VALID 권장"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bVALIDATE\s+CONSTRAINT\b", "SHARE UPDATE EXCLUSIVE", "테이블 전체 스캔, 쓰기 허용"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bATTACH\s+PARTITION\b", "SHARE UPDATE EXCLUSIVE", "파티션 범위 검사 (일치하는 CHECK 제약이 있으면 생략)"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}.*\bDETACH\s+PARTITION\b.*\bCONCURRENTLY\b", "SHARE UPDATE EXCLUSIVE", "재작성 없음 (트랜잭션 밖에서만 가능)"),
+    (rf"^ALTER\s+TABLE\s+{TABLE_NAME}", "ACCESS EXCLUSIVE", "짧은 잠금, 재작성 없음 (이름 변경/삭제/기본값 변경 등)"),
+    (rf"^ALTER\s+(?:INDEX|SEQUENCE)\s+{TABLE_NAME}", "ACCESS EXCLUSIVE", "짧은 잠금, 재작성 없음"),
+    (rf"^LOCK\s+(?:TABLE\s+)?{TABLE_NAME}\s+IN\s+(?P<mode>[\w ]+?)\s+MODE", None, "명시적 잠금 (트랜잭션 끝까지 유지)"),
+    (rf"^(?:UPDATE|DELETE\s+FROM)\s+{TABLE_NAME}", "ROW EXCLUSIVE", None),
+    (rf"^INSERT\s+INTO\s+{TABLE_NAME}", "ROW EXCLUSIVE", "새 행 추가"),
+    (rf"^(?:VACUUM\s+FULL|CLUSTER)\s+{TABLE_NAME}", "ACCESS EXCLUSIVE", "테이블 재작성 동안 읽기/쓰기 차단"),
+    (rf"^REINDEX\s+(?:TABLE|INDEX)\s+CONCURRENTLY\s+{TABLE_NAME}", "SHARE UPDATE EXCLUSIVE", "인덱스 재생성, 쓰기 허용"),
+    (rf"^REINDEX\s+(?:TABLE|INDEX)\s+{TABLE_NAME}", "ACCESS EXCLUSIVE", "인덱스 재생성 동안 해당 인덱스 사용 차단 → CONCURRENTLY 권장"),
+    (rf"^TRUNCATE\s+(?:TABLE\s+)?{TABLE_NAME}", "ACCESS EXCLUSIVE", "짧은 잠금, 데이터 삭제"),
+]
+STATEMENT_RULES = [(re.compile(pattern, re.IGNORECASE | re.DOTALL), lock, impact) for pattern, lock, impact in STATEMENT_RULES]
+
+
+def analyze_statement(statement):
+    """(잠금 수준, 대상 테이블, 영향 설명)을 반환. 규칙에 없는 문장은 잠금 수준이 '알 수 없음'입니다."""
+    text = " ".join(strip_comments(statement).split())
+    for pattern, lock, impact in STATEMENT_RULES:
+        match = pattern.search(text)
+        if not match:
+            continue
+        table = match.groupdict().get("table")
+        table = table.strip('"') if table else None
+
+        if match.groupdict().get("mode"):
+            lock = match.group("mode").upper()
+        if impact is None and text.upper().startswith("ALTER TABLE"):
+            # ADD COLUMN: PG11부터 상수 기본값은 재작성하지 않음
+            if VOLATILE_DEFAULT_RE.search(text):
+                impact = "휘발성 기본값 → 테이블 전체 재작성 동안 읽기/쓰기 차단"
+            else:
+                impact = "짧은 잠금, 재작성 없음 (상수 기본값)"
+        elif impact is None:
+            impact = "WHERE 조건에 맞는 행 잠금" if re.search(r"\bWHERE\b", text, re.IGNORECASE) else "WHERE 없음 → 전체 행 잠금, 큰 테이블은 batched_update 권장"
+        return lock, table, impact
+    return "알 수 없음", None, "규칙에 없는 문장"
+
+
+def relation_size(cursor, table):
+    """pg_class 통계 기준 (예상 행 수, 전체 크기 바이트). 없는 테이블이면 None"""
+    if not table:
+        return None
+    cursor.execute("""
+        SELECT GREATEST(c.reltuples, 0)::bigint, pg_total_relation_size(c.oid)
+        FROM pg_class c WHERE c.oid = to_regclass(%s)
+    """, (table,))
+    return cursor.fetchone()
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}"
+        size /= 1024
+    return f"{size:.1f}TB"
+
+
+def dry_run(database_url):
+    conn = psycopg2.connect(database_url)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    try:
+        done = applied_versions(conn, create=False)
+        pending = [m for m in discover_migrations() if m[0] not in done]
+        if not pending:
+            print("✅ 적용할 마이그레이션이 없습니다.")
+            return
+
+        print(f"lock_timeout={MIGRATION_LOCK_TIMEOUT}, 재시도 {MIGRATION_LOCK_RETRIES}회\n")
+        for version, name, kind, path in pending:
+            if kind == "py":
+                module = load_module(path)
+                mode = "autocommit" if getattr(module, "TRANSACTION", True) is False else "직접 커밋"
+                print(f"=== {version}_{name}.py ({mode}) ===")
+                # Python 마이그레이션은 실행 전에 문장을 알 수 없으므로 docstring의 설명을 그대로 보여줍니다.
+                for line in (module.__doc__ or "설명 없음").strip().splitlines():
+                    print(f"    {line}")
+                print()
+                continue
+
+            sql = read_sql(path)
+            mode = "문장별 autocommit" if NO_TRANSACTION_RE.search(sql) else "단일 트랜잭션, 모든 잠금이 커밋까지 유지"
+            print(f"=== {version}_{name}.sql ({mode}) ===")
+            for statement in split_statements(sql):
+                lock, table, impact = analyze_statement(statement)
+                print(f"  > {' '.join(strip_comments(statement).split())[:100]}")
+                line = f"    잠금: {lock or '-'}"
+                if lock in LOCK_EFFECTS:
+                    line += f" ({LOCK_EFFECTS[lock]})"
+                print(line)
+                size = relation_size(cursor, table)
+                if size:
+                    print(f"    대상: {table} (예상 {size[0]:,}행, {format_bytes(size[1])})")
+                elif table:
+                    print(f"    대상: {table} (아직 없음)")
+                print(f"    영향: {impact}")
+            print()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--status", action="store_true", help="마이그레이션별 적용 여부 출력")
+    group.add_argument("--dry-run", action="store_true", help="적용하지 않고 예상 잠금/재작성 영향만 출력")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        sys.exit("❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.")
+
+    if args.status:
+        status(database_url)
+    elif args.dry_run:
+        dry_run(database_url)
+    else:
+        migrate(database_url)
+
+
+if __name__ == "__main__":
+    main()
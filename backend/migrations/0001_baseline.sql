@@ -1,7 +1,7 @@
--- 이음 (Team HSW) 데이터베이스 스키마
--- PostgreSQL
+-- 0001 기준 스키마
+-- 마이그레이션 도입 시점에 운영 DB에 실제로 존재하는 스키마입니다. (이미 있는 DB에서는 아무것도 바꾸지 않습니다)
+-- messages는 코드가 사용해 온 room_id(문자열)/sender(이메일) 형태이며, 0002에서 정규 스키마로 전환합니다.
 
--- 1. users 테이블 (사용자 계정)
 CREATE TABLE IF NOT EXISTS users (
     id SERIAL PRIMARY KEY,
     email VARCHAR(255) UNIQUE NOT NULL,
@@ -10,7 +10,6 @@ CREATE TABLE IF NOT EXISTS users (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- 2. students 테이블 (학생 프로필)
 CREATE TABLE IF NOT EXISTS students (
     id SERIAL PRIMARY KEY,
     user_id INTEGER UNIQUE NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -23,8 +22,8 @@ CREATE TABLE IF NOT EXISTS students (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+ALTER TABLE students ADD COLUMN IF NOT EXISTS is_profile_public BOOLEAN DEFAULT TRUE;
 
--- 3. businesses 테이블 (사업자 프로필)
 CREATE TABLE IF NOT EXISTS businesses (
     id SERIAL PRIMARY KEY,
     user_id INTEGER UNIQUE NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -34,7 +33,6 @@ CREATE TABLE IF NOT EXISTS businesses (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- 4. projects 테이블 (프로젝트 공고)
 CREATE TABLE IF NOT EXISTS projects (
     id SERIAL PRIMARY KEY,
     business_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -49,7 +47,6 @@ CREATE TABLE IF NOT EXISTS projects (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- 5. applications 테이블 (지원서)
 CREATE TABLE IF NOT EXISTS applications (
     id SERIAL PRIMARY KEY,
     project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
@@ -60,17 +57,14 @@ CREATE TABLE IF NOT EXISTS applications (
     UNIQUE(project_id, student_id)
 );
 
--- 6. messages 테이블 (채팅 메시지)
 CREATE TABLE IF NOT EXISTS messages (
     id SERIAL PRIMARY KEY,
-    sender_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    receiver_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    room_id VARCHAR(255) NOT NULL,
+    sender VARCHAR(255) NOT NULL,
     message TEXT NOT NULL,
-    is_read BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- 인덱스 생성
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_students_user_id ON students(user_id);
 CREATE INDEX IF NOT EXISTS idx_businesses_user_id ON businesses(user_id);
@@ -78,5 +72,3 @@ CREATE INDEX IF NOT EXISTS idx_projects_business_id ON projects(business_id);
 CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status);
 CREATE INDEX IF NOT EXISTS idx_applications_project_id ON applications(project_id);
 CREATE INDEX IF NOT EXISTS idx_applications_student_id ON applications(student_id);
-CREATE INDEX IF NOT EXISTS idx_messages_sender_id ON messages(sender_id);
-CREATE INDEX IF NOT EXISTS idx_messages_receiver_id ON messages(receiver_id);
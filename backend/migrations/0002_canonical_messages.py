@@ -0,0 +1,193 @@
+"""
+0002 채팅 메시지 정규 스키마 전환
+- chat_rooms: 프론트엔드가 쓰는 room_id 문자열("이메일A_이메일B")을 room_key로 보관하고 두 참여자 id를 연결
+- messages: room_id(chat_rooms FK), sender_id(users FK), is_read, (room_id, id) 인덱스
+
+기존 messages 테이블은 운영 중에도 계속 쓰일 수 있으므로,
+1) 새 테이블(messages_canonical)을 만들고
+2) 기존 행을 id 순으로 BATCH_SIZE개씩 옮기며 배치마다 커밋 (기존 테이블에는 잠금을 걸지 않음)
+3) 마지막에 기존 테이블 쓰기만 잠시 막고(EXCLUSIVE) 남은 행을 옮긴 뒤 이름을 바꿔 전환합니다.
+기존 테이블은 messages_legacy로 남기며, 확인 후 직접 삭제합니다.
+
+room_id/sender(이메일) 형태와 이전 schema.sql의 sender_id/receiver_id 형태를 모두 지원합니다.
+보낸 사람을 users에서 찾을 수 없는 메시지는 옮기지 않고 개수만 출력합니다.
+"""
+import time
+from psycopg2.extras import execute_values
+
+BATCH_SIZE = 5000
+# 배치 사이 대기 시간(초). 운영 DB 부하를 줄이기 위함
+BATCH_PAUSE = 0.05
+
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS chat_rooms (
+    id SERIAL PRIMARY KEY,
+    room_key VARCHAR(255) UNIQUE NOT NULL,
+    user_a_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    user_b_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_chat_rooms_user_a_id ON chat_rooms(user_a_id);
+CREATE INDEX IF NOT EXISTS idx_chat_rooms_user_b_id ON chat_rooms(user_b_id);
+
+CREATE TABLE IF NOT EXISTS messages_canonical (
+    id BIGSERIAL CONSTRAINT messages_canonical_pkey PRIMARY KEY,
+    room_id INTEGER NOT NULL REFERENCES chat_rooms(id) ON DELETE CASCADE,
+    sender_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    message TEXT NOT NULL,
+    is_read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    legacy_id INTEGER
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_canonical_legacy_id ON messages_canonical(legacy_id);
+CREATE INDEX IF NOT EXISTS idx_messages_room_id_id ON messages_canonical(room_id, id);
+CREATE INDEX IF NOT EXISTS idx_messages_canonical_sender_id ON messages_canonical(sender_id);
+"""
+
+
+def _columns(cursor, table):
+    cursor.execute("SELECT column_name FROM information_schema.columns WHERE table_name = %s AND table_schema = current_schema()", (table,))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def _fetch_batch(cursor, shape, after_id, limit):
+    """(legacy_id, room_key, sender_email, message, is_read, created_at, participants) 목록"""
+    if shape == "room":
+        cursor.execute("""
+            SELECT id, room_id, sender, message, FALSE, created_at
+            FROM messages WHERE id > %s ORDER BY id LIMIT %s
+        """, (after_id, limit))
+        return [row + (None,) for row in cursor.fetchall()]
+
+    cursor.execute("""
+        SELECT m.id, su.email, ru.email, m.message, m.is_read, m.created_at, m.sender_id, m.receiver_id
+        FROM messages m
+        LEFT JOIN users su ON su.id = m.sender_id
+        LEFT JOIN users ru ON ru.id = m.receiver_id
+        WHERE m.id > %s ORDER BY m.id LIMIT %s
+    """, (after_id, limit))
+    rows = []
+    for legacy_id, sender_email, receiver_email, message, is_read, created_at, sender_id, receiver_id in cursor.fetchall():
+        if not sender_email or not receiver_email:
+            rows.append((legacy_id, None, None, message, is_read, created_at, None))
+            continue
+        pair = sorted([(sender_email, sender_id), (receiver_email, receiver_id)])
+        rows.append((legacy_id, f"{pair[0][0]}_{pair[1][0]}", sender_email, message, is_read, created_at, (pair[0][1], pair[1][1])))
+    return rows
+
+
+def _resolve_participants(cursor, room_keys):
+    """room_key를 두 사용자 id로 변환. 이메일에 '_'가 있을 수 있어 가능한 모든 분할 위치를 확인합니다."""
+    splits = {key: [(key[:i], key[i + 1:]) for i, ch in enumerate(key) if ch == "_"] for key in room_keys}
+    emails = list({email for pairs in splits.values() for pair in pairs for email in pair})
+    cursor.execute("SELECT email, id FROM users WHERE email = ANY(%s)", (emails,))
+    ids = dict(cursor.fetchall())
+
+    participants = {}
+    for key, pairs in splits.items():
+        participants[key] = (None, None)
+        for a, b in pairs:
+            if a in ids and b in ids:
+                participants[key] = (ids[a], ids[b])
+                break
+            if a in ids or b in ids:
+                participants[key] = (ids.get(a), ids.get(b))
+    return participants
+
+
+def _copy_batch(cursor, shape, after_id):
+    """기존 messages에서 after_id 다음 배치를 옮기고 (읽은 행 수, 건너뛴 행 수, 마지막 id) 반환"""
+    rows = _fetch_batch(cursor, shape, after_id, BATCH_SIZE)
+    if not rows:
+        return 0, 0, after_id
+
+    room_keys = {row[1] for row in rows if row[1]}
+    cursor.execute("SELECT room_key, id FROM chat_rooms WHERE room_key = ANY(%s)", (list(room_keys),))
+    room_ids = dict(cursor.fetchall())
+
+    missing = room_keys - room_ids.keys()
+    if missing:
+        participants = {row[1]: row[6] for row in rows if row[1] in missing and row[6]}
+        unresolved = missing - participants.keys()
+        if unresolved:
+            participants.update(_resolve_participants(cursor, unresolved))
+        execute_values(cursor, """
+            INSERT INTO chat_rooms (room_key, user_a_id, user_b_id, created_at) VALUES %s
+            ON CONFLICT (room_key) DO NOTHING
+        """, [(key, participants[key][0], participants[key][1], min(r[5] for r in rows if r[1] == key)) for key in missing])
+        cursor.execute("SELECT room_key, id FROM chat_rooms WHERE room_key = ANY(%s)", (list(missing),))
+        room_ids.update(cursor.fetchall())
+
+    senders = list({row[2] for row in rows if row[2]})
+    cursor.execute("SELECT email, id FROM users WHERE email = ANY(%s)", (senders,))
+    sender_ids = dict(cursor.fetchall())
+
+    values = [
+        (row[0], room_ids[row[1]], sender_ids[row[2]], row[3], row[4], row[5])
+        for row in rows if row[1] in room_ids and row[2] in sender_ids
+    ]
+    execute_values(cursor, """
+        INSERT INTO messages_canonical (legacy_id, room_id, sender_id, message, is_read, created_at) VALUES %s
+        ON CONFLICT (legacy_id) DO NOTHING
+    """, values)
+    return len(rows), len(rows) - len(values), rows[-1][0]
+
+
+def upgrade(conn):
+    cursor = conn.cursor()
+    columns = _columns(cursor, "messages")
+    if "room_id" in columns and "sender" in columns:
+        shape = "room"
+    elif "sender_id" in columns and "receiver_id" in columns:
+        shape = "pair"
+    else:
+        raise RuntimeError(f"알 수 없는 messages 스키마: {sorted(columns)}")
+
+    cursor.execute(CREATE_SQL)
+    conn.commit()
+
+    # 중단 후 다시 실행하면 이어서 진행
+    cursor.execute("SELECT COALESCE(MAX(legacy_id), 0) FROM messages_canonical")
+    last_id = cursor.fetchone()[0]
+    copied = skipped = 0
+
+    # 1) 온라인 백필: 배치마다 커밋하며 기존 테이블에는 잠금을 걸지 않음
+    while True:
+        count, skip, last_id = _copy_batch(cursor, shape, last_id)
+        conn.commit()
+        if not count:
+            break
+        copied += count
+        skipped += skip
+        print(f"  - {copied:,}행 처리 (마지막 id {last_id})")
+        time.sleep(BATCH_PAUSE)
+
+    # 2) 전환: 읽기는 허용하고 쓰기만 막은 상태에서 남은 행을 옮기고 테이블 교체
+    cursor.execute("SET LOCAL lock_timeout = '10s'")
+    cursor.execute("LOCK TABLE messages IN EXCLUSIVE MODE")
+    while True:
+        count, skip, last_id = _copy_batch(cursor, shape, last_id)
+        if not count:
+            break
+        copied += count
+        skipped += skip
+
+    # sender_id/receiver_id 형태의 기존 인덱스는 새 테이블 인덱스 이름과 겹치므로 삭제
+    cursor.execute("""
+        DROP INDEX IF EXISTS idx_messages_sender_id;
+        DROP INDEX IF EXISTS idx_messages_receiver_id;
+        ALTER TABLE messages RENAME TO messages_legacy;
+        ALTER INDEX messages_pkey RENAME TO messages_legacy_pkey;
+        ALTER SEQUENCE messages_id_seq RENAME TO messages_legacy_id_seq;
+        ALTER TABLE messages_canonical RENAME TO messages;
+        ALTER INDEX messages_canonical_pkey RENAME TO messages_pkey;
+        ALTER INDEX idx_messages_canonical_sender_id RENAME TO idx_messages_sender_id;
+        ALTER TABLE messages RENAME CONSTRAINT messages_canonical_room_id_fkey TO messages_room_id_fkey;
+        ALTER TABLE messages RENAME CONSTRAINT messages_canonical_sender_id_fkey TO messages_sender_id_fkey;
+        ALTER SEQUENCE messages_canonical_id_seq RENAME TO messages_id_seq;
+        DROP INDEX idx_messages_canonical_legacy_id;
+        ALTER TABLE messages DROP COLUMN legacy_id;
+    """)
+    cursor.close()
+
+    print(f"  - 총 {copied:,}행 이전, 보낸 사람/채팅방을 찾을 수 없어 제외 {skipped:,}행")
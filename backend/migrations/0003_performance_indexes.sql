@@ -0,0 +1,22 @@
+-- migrate: no-transaction
+-- 0003 목록 조회용 복합 인덱스
+-- 필터 + created_at DESC 정렬을 인덱스 순서 그대로 읽어 정렬 단계를 없앱니다.
+-- CONCURRENTLY로 만들기 때문에 생성 중에도 쓰기가 막히지 않습니다. (트랜잭션 밖에서만 실행 가능)
+
+-- GET /projects?status=... ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_status_created_at ON projects(status, created_at DESC);
+
+-- GET /projects/my, 대시보드: WHERE business_id = ? ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_business_id_created_at ON projects(business_id, created_at DESC);
+
+-- GET /applications/my: WHERE student_id = ? ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_applications_student_id_created_at ON applications(student_id, created_at DESC);
+
+-- GET /applications/project/<id>: WHERE project_id = ? ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_applications_project_id_created_at ON applications(project_id, created_at DESC);
+
+-- 위 복합 인덱스의 앞 컬럼과 같은 단일 컬럼 인덱스는 쓰기 비용만 늘리므로 삭제
+DROP INDEX CONCURRENTLY IF EXISTS idx_projects_status;
+DROP INDEX CONCURRENTLY IF EXISTS idx_projects_business_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_applications_student_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_applications_project_id;
@@ -0,0 +1,142 @@
+"""
+0004 messages를 created_at 기준 월별 RANGE 파티션 테이블로 전환
+- 기본키는 파티션 키를 포함해야 하므로 (id, created_at)
+- 기존 데이터가 있는 달부터 MONTHS_AHEAD개월 뒤까지 파티션(messages_YYYY_MM)을 만들고,
+  범위 밖의 행은 messages_default 파티션에 들어갑니다. 이후 파티션은 app.message_archive가 미리 만듭니다.
+- message_archives: 보존 기간이 지나 파일로 내보낸 (채팅방, 월) 목록
+
+0002와 같은 방식으로 온라인 전환합니다.
+1) 새 파티션 테이블(messages_partitioned)을 만들고 기존 행을 id 구간별로 옮기며 배치마다 커밋
+2) 기존 테이블 쓰기만 잠시 막고(EXCLUSIVE) 남은 행을 옮긴 뒤 이름을 바꿔 전환
+기존 테이블은 messages_unpartitioned로 남기며, 확인 후 직접 삭제합니다. id 시퀀스는 새 테이블이 이어서 사용합니다.
+"""
+import datetime
+import time
+
+BATCH_SIZE = 20000
+# 배치 사이 대기 시간(초). 운영 DB 부하를 줄이기 위함
+BATCH_PAUSE = 0.05
+# 현재 달 이후로 미리 만들어 둘 파티션 수
+MONTHS_AHEAD = 3
+
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS messages_partitioned (
+    id BIGINT NOT NULL DEFAULT nextval('messages_id_seq'),
+    room_id INTEGER NOT NULL REFERENCES chat_rooms(id) ON DELETE CASCADE,
+    sender_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    message TEXT NOT NULL,
+    is_read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT messages_partitioned_pkey PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+CREATE INDEX IF NOT EXISTS idx_messages_partitioned_room_id_id ON messages_partitioned(room_id, id);
+CREATE INDEX IF NOT EXISTS idx_messages_partitioned_sender_id ON messages_partitioned(sender_id);
+CREATE TABLE IF NOT EXISTS messages_partitioned_default PARTITION OF messages_partitioned DEFAULT;
+
+CREATE TABLE IF NOT EXISTS message_archives (
+    room_id INTEGER NOT NULL REFERENCES chat_rooms(id) ON DELETE CASCADE,
+    month DATE NOT NULL,
+    path VARCHAR(500) NOT NULL,
+    message_count INTEGER NOT NULL,
+    min_id BIGINT NOT NULL,
+    max_id BIGINT NOT NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (room_id, month)
+);
+"""
+
+COPY_SQL = """
+INSERT INTO messages_partitioned (id, room_id, sender_id, message, is_read, created_at)
+SELECT id, room_id, sender_id, message, is_read, COALESCE(created_at, CURRENT_TIMESTAMP)
+FROM messages WHERE id > %s AND id <= %s
+ON CONFLICT DO NOTHING
+"""
+
+
+def _month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def _next_month(month):
+    return datetime.date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_partitions(cursor):
+    cursor.execute("SELECT MIN(created_at) FROM messages")
+    oldest = cursor.fetchone()[0] or datetime.datetime.now()
+    month = _month_start(oldest)
+    last = _month_start(datetime.date.today())
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+
+    while month <= last:
+        upper = _next_month(month)
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS messages_{month:%Y_%m} PARTITION OF messages_partitioned
+            FOR VALUES FROM ('{month}') TO ('{upper}')
+        """)
+        month = upper
+
+
+def _copy_batch(cursor, after_id, until_id):
+    """기존 messages의 (after_id, until_id] 구간 중 BATCH_SIZE개 id 범위를 옮기고 (복사한 행 수, 마지막 id) 반환"""
+    upper = min(after_id + BATCH_SIZE, until_id)
+    cursor.execute(COPY_SQL, (after_id, upper))
+    return cursor.rowcount, upper
+
+
+def upgrade(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('messages')")
+    if cursor.fetchone()[0] == "p":
+        print("  - messages가 이미 파티션 테이블입니다.")
+        return
+
+    cursor.execute(CREATE_SQL)
+    _create_partitions(cursor)
+    conn.commit()
+
+    # 중단 후 다시 실행하면 이어서 진행
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM messages_partitioned")
+    last_id = cursor.fetchone()[0]
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM messages")
+    target_id = cursor.fetchone()[0]
+    conn.commit()
+
+    # 1) 온라인 백필: 배치마다 커밋하며 기존 테이블에는 잠금을 걸지 않음
+    copied = 0
+    while last_id < target_id:
+        count, last_id = _copy_batch(cursor, last_id, target_id)
+        conn.commit()
+        copied += count
+        print(f"  - {copied:,}행 복사 (마지막 id {last_id})")
+        time.sleep(BATCH_PAUSE)
+
+    # 2) 전환: 읽기는 허용하고 쓰기만 막은 상태에서 남은 행을 옮기고 테이블 교체
+    cursor.execute("SET LOCAL lock_timeout = '10s'")
+    cursor.execute("LOCK TABLE messages IN EXCLUSIVE MODE")
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM messages")
+    target_id = cursor.fetchone()[0]
+    while last_id < target_id:
+        count, last_id = _copy_batch(cursor, last_id, target_id)
+        copied += count
+
+    cursor.execute("""
+        ALTER TABLE messages RENAME TO messages_unpartitioned;
+        ALTER INDEX messages_pkey RENAME TO messages_unpartitioned_pkey;
+        ALTER INDEX idx_messages_room_id_id RENAME TO idx_messages_unpartitioned_room_id_id;
+        ALTER INDEX idx_messages_sender_id RENAME TO idx_messages_unpartitioned_sender_id;
+        ALTER TABLE messages_unpartitioned ALTER COLUMN id DROP DEFAULT;
+
+        ALTER TABLE messages_partitioned RENAME TO messages;
+        ALTER TABLE messages_partitioned_default RENAME TO messages_default;
+        ALTER INDEX messages_partitioned_pkey RENAME TO messages_pkey;
+        ALTER INDEX idx_messages_partitioned_room_id_id RENAME TO idx_messages_room_id_id;
+        ALTER INDEX idx_messages_partitioned_sender_id RENAME TO idx_messages_sender_id;
+        ALTER TABLE messages RENAME CONSTRAINT messages_partitioned_room_id_fkey TO messages_room_id_fkey;
+        ALTER TABLE messages RENAME CONSTRAINT messages_partitioned_sender_id_fkey TO messages_sender_id_fkey;
+        ALTER SEQUENCE messages_id_seq OWNED BY messages.id;
+    """)
+    cursor.close()
+
+    print(f"  - 총 {copied:,}행을 옮겨 파티션 테이블로 전환했습니다. 기존 테이블은 messages_unpartitioned로 남아 있습니다.")
@@ -0,0 +1,30 @@
+-- migrate: no-transaction
+-- 0005 채팅방/프로젝트 소프트 삭제와 비동기 삭제 작업
+-- 삭제 요청 시 deleted_at만 기록해 즉시 숨기고, 실제 행 삭제는 purge_jobs를 처리하는 백그라운드 작업(app/purge.py)이 나눠서 수행합니다.
+
+-- 기본값 없는 NULL 컬럼 추가는 테이블을 재작성하지 않습니다.
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP;
+ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP;
+
+CREATE TABLE IF NOT EXISTS purge_jobs (
+    id SERIAL PRIMARY KEY,
+    target_type VARCHAR(20) NOT NULL CHECK (target_type IN ('PROJECT', 'CHAT_ROOM')),
+    target_id INTEGER NOT NULL,
+    requested_by INTEGER REFERENCES users(id) ON DELETE SET NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'PENDING' CHECK (status IN ('PENDING', 'RUNNING', 'DONE', 'FAILED')),
+    total_rows INTEGER,
+    deleted_rows INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (target_type, target_id)
+);
+-- 작업자가 처리할 작업만 담는 작은 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_purge_jobs_active ON purge_jobs(id) WHERE status IN ('PENDING', 'RUNNING');
+
+-- 삭제된 채팅방의 room_key는 같은 두 사람이 다시 대화할 때 새 채팅방으로 쓸 수 있어야 하므로
+-- room_key UNIQUE 제약을 삭제되지 않은 채팅방에만 적용되는 부분 UNIQUE 인덱스로 바꿉니다.
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_rooms_room_key_active ON chat_rooms(room_key) WHERE deleted_at IS NULL;
+ALTER TABLE chat_rooms DROP CONSTRAINT IF EXISTS chat_rooms_room_key_key;
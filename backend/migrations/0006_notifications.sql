@@ -0,0 +1,23 @@
+-- 0006 알림 (outbox)
+-- 지원/상태 변경과 같은 트랜잭션에서 notifications에 행을 넣고, 백그라운드 디스패처(app/notifications.py)가
+-- dispatched_at이 비어 있는 행을 사용자별 Socket.IO 방으로 푸시합니다. 커밋된 알림은 서버가 재시작되어도 사라지지 않습니다.
+-- 새 테이블이므로 인덱스는 트랜잭션 안에서 바로 만듭니다.
+
+CREATE TABLE IF NOT EXISTS notifications (
+    id BIGSERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    is_read BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dispatched_at TIMESTAMP
+);
+
+-- GET /notifications: WHERE user_id = ? ORDER BY id DESC
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id_id ON notifications(user_id, id DESC);
+
+-- 읽지 않은 알림 수: 읽은 알림은 인덱스에 없으므로 COUNT가 읽지 않은 행만 훑음
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id_unread ON notifications(user_id) WHERE is_read = FALSE;
+
+-- 디스패처가 가져갈 아직 보내지 않은 알림만 담는 작은 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_notifications_undispatched ON notifications(id) WHERE dispatched_at IS NULL;
@@ -0,0 +1,11 @@
+-- migrate: no-transaction
+-- 0007 지원자 목록 키셋 페이지네이션용 인덱스
+-- GET /applications/project/<id>?status=... 는 (created_at, id) 순서로 페이지를 읽으므로
+-- 상태 필터가 있을 때와 없을 때 모두 인덱스 순서 그대로 LIMIT만큼만 읽습니다.
+
+-- WHERE project_id = ? AND status = ? ORDER BY created_at DESC, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_applications_project_id_status_created_at ON applications(project_id, status, created_at DESC, id DESC);
+
+-- WHERE project_id = ? ORDER BY created_at DESC, id DESC (0003 인덱스에 동률 구분용 id 추가)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_applications_project_id_created_at_id ON applications(project_id, created_at DESC, id DESC);
+DROP INDEX CONCURRENTLY IF EXISTS idx_applications_project_id_created_at;
@@ -0,0 +1,16 @@
+-- 0008 Idempotency-Key 헤더로 재시도된 요청의 처음 응답을 재사용 (app/idempotency.py)
+-- 새 테이블이므로 인덱스는 트랜잭션 안에서 바로 만듭니다.
+
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    key VARCHAR(255) NOT NULL,
+    endpoint VARCHAR(100) NOT NULL,
+    request_hash CHAR(64) NOT NULL,
+    response_status SMALLINT,
+    response_body JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, key)
+);
+
+-- 만료된 키 정리: WHERE created_at < ?
+CREATE INDEX IF NOT EXISTS idx_idempotency_keys_created_at ON idempotency_keys(created_at);
@@ -0,0 +1,24 @@
+-- migrate: no-transaction
+-- 0009 인재 검색(GET /profiles/search)용 함수와 인덱스
+-- students.skills는 쉼표로 구분된 자유 입력 문자열이므로, 소문자/공백 제거한 배열로 바꾸는 함수를 만들고
+-- 그 결과에 GIN 인덱스를 걸어 여러 기술 AND(@>)/OR(&&) 조건을 인덱스로 찾습니다.
+-- 모든 인덱스는 공개 프로필 조건(is_profile_public IS TRUE AND introduction IS NOT NULL)을 가진 부분 인덱스입니다.
+
+CREATE OR REPLACE FUNCTION skill_tags(skills TEXT) RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT COALESCE(array_agg(DISTINCT tag ORDER BY tag), '{}')
+    FROM (SELECT lower(trim(x)) AS tag FROM unnest(string_to_array(skills, ',')) AS x) tags
+    WHERE tag <> ''
+$$;
+
+-- skills=... : skill_tags(skills) @> / && ARRAY[...]
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_students_public_skill_tags ON students USING gin (skill_tags(skills))
+    WHERE is_profile_public IS TRUE AND introduction IS NOT NULL;
+
+-- q=... : 자기소개 전문 검색 (한국어 조사를 고려해 접두어 검색으로 사용)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_students_public_introduction_fts ON students USING gin (to_tsvector('simple', introduction))
+    WHERE is_profile_public IS TRUE AND introduction IS NOT NULL;
+
+-- 조건 없는 검색과 동점 정렬: ORDER BY user_id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_students_public_user_id ON students(user_id DESC)
+    WHERE is_profile_public IS TRUE AND introduction IS NOT NULL;
@@ -0,0 +1,244 @@
+"""
+0010 프로젝트/사업자 좌표 (반경 검색 GET /projects?near=)
+- projects, businesses에 latitude, longitude 컬럼 추가 (NULL 허용이라 테이블 재작성 없음)
+- geo_distance_km(): 두 좌표 사이 하버사인 거리(km). 인덱스로 사각형 후보를 줄인 뒤 정확한 거리 계산에 사용
+- 기존 행을 지명 사전(app.geo의 0010 시점 사본)으로 지오코딩해 배치마다 커밋하며 채움
+  프로젝트 위치를 찾지 못하면 사장님 주소 좌표를 사용합니다.
+GiST 인덱스는 0011에서 CONCURRENTLY로 만듭니다.
+"""
+import re
+import time
+from psycopg2.extras import execute_values
+
+BATCH_SIZE = 5000
+# 배치 사이 대기 시간(초). 운영 DB 부하를 줄이기 위함
+BATCH_PAUSE = 0.05
+
+CREATE_SQL = """
+ALTER TABLE businesses ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE businesses ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+
+CREATE OR REPLACE FUNCTION geo_distance_km(lat1 DOUBLE PRECISION, lng1 DOUBLE PRECISION,
+                                           lat2 DOUBLE PRECISION, lng2 DOUBLE PRECISION)
+RETURNS DOUBLE PRECISION LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT 2 * 6371.0088 * asin(sqrt(
+        sin(radians(lat2 - lat1) / 2) ^ 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(radians(lng2 - lng1) / 2) ^ 2
+    ))
+$$;
+"""
+
+
+# ==================================================
+#   0010 작성 시점 app/geo.py의 지명 사전과 geocode() 사본
+#   (app.geo가 바뀌어도 이 마이그레이션의 결과는 그대로이도록 고정. 수정하지 말 것)
+#   지명 사전: 시/도 -> (대표 좌표, {시/군/구: 좌표})
+#   일반구가 있는 시는 시와 구를 모두 등록 (같은 시/도 안에서 이름이 겹치지 않음)
+# ==================================================
+GAZETTEER = {
+    "서울": ((37.5665, 126.9780), {
+        "종로구": (37.5735, 126.9790), "중구": (37.5641, 126.9979), "용산구": (37.5324, 126.9900),
+        "성동구": (37.5634, 127.0369), "광진구": (37.5385, 127.0823), "동대문구": (37.5744, 127.0400),
+        "중랑구": (37.6066, 127.0927), "성북구": (37.5894, 127.0167), "강북구": (37.6397, 127.0256),
+        "도봉구": (37.6688, 127.0471), "노원구": (37.6542, 127.0568), "은평구": (37.6027, 126.9291),
+        "서대문구": (37.5791, 126.9368), "마포구": (37.5663, 126.9016), "양천구": (37.5170, 126.8665),
+        "강서구": (37.5509, 126.8495), "구로구": (37.4954, 126.8874), "금천구": (37.4569, 126.8955),
+        "영등포구": (37.5264, 126.8962), "동작구": (37.5124, 126.9393), "관악구": (37.4784, 126.9516),
+        "서초구": (37.4837, 127.0324), "강남구": (37.5172, 127.0473), "송파구": (37.5145, 127.1059),
+        "강동구": (37.5301, 127.1238),
+    }),
+    "부산": ((35.1796, 129.0756), {
+        "중구": (35.1062, 129.0324), "서구": (35.0979, 129.0243), "동구": (35.1295, 129.0454),
+        "영도구": (35.0911, 129.0679), "부산진구": (35.1630, 129.0532), "동래구": (35.2049, 129.0837),
+        "남구": (35.1365, 129.0843), "북구": (35.1973, 128.9903), "해운대구": (35.1631, 129.1636),
+        "사하구": (35.1045, 128.9749), "금정구": (35.2429, 129.0922), "강서구": (35.2122, 128.9805),
+        "연제구": (35.1762, 129.0799), "수영구": (35.1455, 129.1131), "사상구": (35.1526, 128.9910),
+        "기장군": (35.2445, 129.2222),
+    }),
+    "대구": ((35.8714, 128.6014), {
+        "중구": (35.8693, 128.6062), "동구": (35.8866, 128.6356), "서구": (35.8718, 128.5592),
+        "남구": (35.8460, 128.5975), "북구": (35.8858, 128.5828), "수성구": (35.8582, 128.6306),
+        "달서구": (35.8299, 128.5326), "달성군": (35.7746, 128.4314), "군위군": (36.2428, 128.5728),
+    }),
+    "인천": ((37.4563, 126.7052), {
+        "중구": (37.4738, 126.6216), "동구": (37.4739, 126.6432), "미추홀구": (37.4635, 126.6505),
+        "연수구": (37.4101, 126.6783), "남동구": (37.4470, 126.7315), "부평구": (37.5070, 126.7219),
+        "계양구": (37.5372, 126.7376), "서구": (37.5455, 126.6760), "강화군": (37.7467, 126.4880),
+        "옹진군": (37.4467, 126.6366),
+    }),
+    "광주": ((35.1595, 126.8526), {
+        "동구": (35.1461, 126.9231), "서구": (35.1520, 126.8902), "남구": (35.1330, 126.9025),
+        "북구": (35.1740, 126.9120), "광산구": (35.1396, 126.7937),
+    }),
+    "대전": ((36.3504, 127.3845), {
+        "동구": (36.3120, 127.4548), "중구": (36.3255, 127.4213), "서구": (36.3554, 127.3838),
+        "유성구": (36.3624, 127.3563), "대덕구": (36.3467, 127.4156),
+    }),
+    "울산": ((35.5384, 129.3114), {
+        "중구": (35.5695, 129.3328), "남구": (35.5442, 129.3302), "동구": (35.5048, 129.4167),
+        "북구": (35.5826, 129.3613), "울주군": (35.5622, 129.1427),
+    }),
+    "세종": ((36.4801, 127.2890), {}),
+    "경기": ((37.2752, 127.0095), {
+        "수원시": (37.2636, 127.0286), "장안구": (37.3040, 127.0102), "권선구": (37.2578, 126.9718),
+        "팔달구": (37.2826, 127.0197), "영통구": (37.2596, 127.0465),
+        "성남시": (37.4201, 127.1265), "수정구": (37.4505, 127.1456), "중원구": (37.4305, 127.1372),
+        "분당구": (37.3828, 127.1189),
+        "고양시": (37.6584, 126.8320), "덕양구": (37.6374, 126.8325), "일산동구": (37.6586, 126.7748),
+        "일산서구": (37.6751, 126.7504),
+        "용인시": (37.2411, 127.1776), "처인구": (37.2343, 127.2016), "기흥구": (37.2803, 127.1149),
+        "수지구": (37.3220, 127.0976),
+        "안양시": (37.3943, 126.9568), "만안구": (37.3864, 126.9323), "동안구": (37.3925, 126.9512),
+        "안산시": (37.3219, 126.8309), "상록구": (37.3009, 126.8466), "단원구": (37.3197, 126.8113),
+        "부천시": (37.5035, 126.7660), "화성시": (37.1995, 126.8311), "남양주시": (37.6360, 127.2165),
+        "평택시": (36.9921, 127.1129), "의정부시": (37.7381, 127.0338), "시흥시": (37.3799, 126.8031),
+        "파주시": (37.7600, 126.7800), "김포시": (37.6153, 126.7156), "광명시": (37.4786, 126.8646),
+        "광주시": (37.4295, 127.2550), "군포시": (37.3617, 126.9352), "하남시": (37.5393, 127.2147),
+        "오산시": (37.1499, 127.0773), "이천시": (37.2720, 127.4350), "안성시": (37.0080, 127.2797),
+        "의왕시": (37.3447, 126.9683), "양주시": (37.7853, 127.0458), "구리시": (37.5943, 127.1296),
+        "포천시": (37.8949, 127.2003), "여주시": (37.2983, 127.6371), "동두천시": (37.9036, 127.0606),
+        "과천시": (37.4292, 126.9876), "가평군": (37.8315, 127.5105), "양평군": (37.4917, 127.4875),
+        "연천군": (38.0966, 127.0748),
+    }),
+    "강원": ((37.8854, 127.7298), {
+        "춘천시": (37.8813, 127.7298), "원주시": (37.3422, 127.9202), "강릉시": (37.7519, 128.8761),
+        "동해시": (37.5247, 129.1143), "속초시": (38.2070, 128.5918), "삼척시": (37.4499, 129.1652),
+        "태백시": (37.1641, 128.9856),
+    }),
+    "충북": ((36.6357, 127.4914), {
+        "청주시": (36.6424, 127.4890), "충주시": (36.9910, 127.9259), "제천시": (37.1326, 128.1910),
+    }),
+    "충남": ((36.6588, 126.6728), {
+        "천안시": (36.8151, 127.1139), "동남구": (36.8069, 127.1497), "서북구": (36.8781, 127.1539),
+        "아산시": (36.7898, 127.0019), "공주시": (36.4465, 127.1190), "보령시": (36.3334, 126.6127),
+        "서산시": (36.7849, 126.4503), "논산시": (36.1872, 127.0987), "당진시": (36.8898, 126.6459),
+        "계룡시": (36.2746, 127.2489),
+    }),
+    "전북": ((35.8203, 127.1088), {
+        "전주시": (35.8242, 127.1480), "완산구": (35.8121, 127.1198), "덕진구": (35.8294, 127.1341),
+        "군산시": (35.9676, 126.7370), "익산시": (35.9483, 126.9577), "정읍시": (35.5699, 126.8560),
+        "남원시": (35.4164, 127.3904), "김제시": (35.8036, 126.8809),
+    }),
+    "전남": ((34.8161, 126.4629), {
+        "목포시": (34.8118, 126.3922), "여수시": (34.7604, 127.6622), "순천시": (34.9507, 127.4872),
+        "나주시": (35.0158, 126.7108), "광양시": (34.9407, 127.6959),
+    }),
+    "경북": ((36.5760, 128.5056), {
+        "포항시": (36.0190, 129.3435), "남구": (36.0089, 129.3594), "북구": (36.0418, 129.3658),
+        "경주시": (35.8562, 129.2247), "김천시": (36.1398, 128.1136), "안동시": (36.5684, 128.7294),
+        "구미시": (36.1195, 128.3446), "영주시": (36.8057, 128.6241), "영천시": (35.9733, 128.9386),
+        "상주시": (36.4109, 128.1590), "문경시": (36.5866, 128.1867), "경산시": (35.8251, 128.7415),
+    }),
+    "경남": ((35.2377, 128.6919), {
+        "창원시": (35.2281, 128.6811), "의창구": (35.2540, 128.6406), "성산구": (35.1985, 128.7028),
+        "마산합포구": (35.1969, 128.5678), "마산회원구": (35.2210, 128.5794), "진해구": (35.1330, 128.7103),
+        "진주시": (35.1800, 128.1076), "통영시": (34.8544, 128.4331), "사천시": (35.0036, 128.0642),
+        "김해시": (35.2285, 128.8894), "밀양시": (35.5038, 128.7467), "거제시": (34.8806, 128.6211),
+        "양산시": (35.3350, 129.0373),
+    }),
+    "제주": ((33.4890, 126.4983), {
+        "제주시": (33.4996, 126.5312), "서귀포시": (33.2541, 126.5601),
+    }),
+}
+
+# 시/도 표기 -> GAZETTEER 키 ("광주시"는 경기 광주시와 겹치므로 시/도 별칭에서 제외)
+SIDO_ALIASES = {
+    "서울특별시": "서울", "서울시": "서울", "부산광역시": "부산", "부산시": "부산", "대구광역시": "대구", "대구시": "대구",
+    "인천광역시": "인천", "인천시": "인천", "광주광역시": "광주", "대전광역시": "대전", "대전시": "대전",
+    "울산광역시": "울산", "울산시": "울산", "세종특별자치시": "세종", "세종시": "세종", "경기도": "경기",
+    "강원도": "강원", "강원특별자치도": "강원", "충청북도": "충북", "충청남도": "충남",
+    "전라북도": "전북", "전북특별자치도": "전북", "전라남도": "전남", "경상북도": "경북", "경상남도": "경남",
+    "제주도": "제주", "제주특별자치도": "제주",
+}
+SIDO_ALIASES.update({sido: sido for sido in GAZETTEER})
+
+# 시/도 없이 시/군/구부터 쓴 주소용: 이름이 전국에서 하나뿐인 시/군/구 -> 시/도
+_district_sidos = {}
+for _sido, (_, _districts) in GAZETTEER.items():
+    for _name in _districts:
+        _district_sidos.setdefault(_name, []).append(_sido)
+UNIQUE_DISTRICTS = {name: sidos[0] for name, sidos in _district_sidos.items() if len(sidos) == 1}
+
+# 주소 앞쪽에서 지명으로 볼 최대 단어 수 ("경기 성남시 분당구 정자동 1" -> 앞 4단어)
+MAX_PLACE_TOKENS = 4
+
+
+def _district(districts, token):
+    """'분당구' 또는 접미어를 뺀 '분당' 모두 허용"""
+    for name in (token, token + "구", token + "시", token + "군"):
+        if name in districts:
+            return name
+    return None
+
+
+def geocode(address):
+    """주소 문자열 -> (위도, 경도). 시/도나 시/군/구를 찾지 못하면 None"""
+    tokens = re.sub(r"[(),]", " ", address or "").split()[:MAX_PLACE_TOKENS]
+    if not tokens:
+        return None
+
+    sido = SIDO_ALIASES.get(tokens[0])
+    if sido:
+        tokens = tokens[1:]
+    else:
+        name = _district(UNIQUE_DISTRICTS, tokens[0])
+        if not name:
+            return None
+        sido = UNIQUE_DISTRICTS[name]
+
+    coords, districts = GAZETTEER[sido]
+    # 뒤에 나온 지명일수록 구체적 ("성남시 분당구" -> 분당구)
+    for token in tokens:
+        name = _district(districts, token)
+        if name:
+            coords = districts[name]
+    return coords
+
+
+def _backfill(conn, cursor, table, key, select_sql):
+    """select_sql(key > %s 순서로 BATCH_SIZE행: key, 주소, 대체 위도, 대체 경도)의 행을 지오코딩해 채움"""
+    last_id = 0
+    updated = 0
+    while True:
+        cursor.execute(select_sql, (last_id, BATCH_SIZE))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        values = []
+        for row_id, address, fallback_lat, fallback_lng in rows:
+            coords = geocode(address) or ((fallback_lat, fallback_lng) if fallback_lat is not None else None)
+            if coords:
+                values.append((row_id, coords[0], coords[1]))
+        if values:
+            execute_values(cursor, f"""
+                UPDATE {table} t SET latitude = v.lat, longitude = v.lng
+                FROM (VALUES %s) AS v(id, lat, lng) WHERE t.{key} = v.id
+            """, values, page_size=len(values))
+        conn.commit()
+        updated += len(values)
+        time.sleep(BATCH_PAUSE)
+    print(f"  - {table}: {updated:,}행 좌표 입력")
+
+
+def upgrade(conn):
+    cursor = conn.cursor()
+    cursor.execute(CREATE_SQL)
+    conn.commit()
+
+    # 프로젝트가 사장님 좌표를 대신 쓰므로 사업자부터
+    _backfill(conn, cursor, "businesses", "user_id", """
+        SELECT user_id, address, NULL, NULL FROM businesses
+        WHERE user_id > %s AND latitude IS NULL
+        ORDER BY user_id LIMIT %s
+    """)
+    _backfill(conn, cursor, "projects", "id", """
+        SELECT p.id, p.location, b.latitude, b.longitude FROM projects p
+        LEFT JOIN businesses b ON b.user_id = p.business_id
+        WHERE p.id > %s AND p.latitude IS NULL
+        ORDER BY p.id LIMIT %s
+    """)
+    cursor.close()
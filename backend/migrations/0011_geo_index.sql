@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- 0011 반경 검색(GET /projects?near=lat,lng&radius_km=)용 공간 인덱스
+-- 확장 없이 기본 제공되는 point 타입 GiST 인덱스를 사용합니다.
+-- 검색은 반경을 감싸는 사각형(point(longitude, latitude) <@ box)으로 후보를 찾고 geo_distance_km()로 거른 뒤 거리순 정렬합니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_geo ON projects USING gist (point(longitude, latitude))
+    WHERE deleted_at IS NULL AND latitude IS NOT NULL;
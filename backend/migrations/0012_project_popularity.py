@@ -0,0 +1,46 @@
+"""
+0012 프로젝트 조회수와 인기도 점수 (GET /projects?sort=popular)
+- projects.view_count: app.popularity가 주기적으로 모아 반영하는 누적 조회수 (NOT NULL DEFAULT 0은 테이블 재작성 없음)
+- projects.popularity_score: 조회/지원의 감쇠 합계를 기준 시각으로 환산한 자연로그 값 (활동이 없으면 NULL)
+기존 지원 기록으로 점수를 채워, 배포 직후에도 sort=popular가 최근 지원이 몰린 프로젝트부터 보여 주게 합니다.
+인덱스는 0013에서 CONCURRENTLY로 만듭니다.
+"""
+import datetime
+import math
+from migrate import batched_update
+
+# 0012 작성 시점 app.popularity의 기본값 (app 설정이 바뀌어도 이 마이그레이션의 결과는 그대로이도록 고정)
+# 서버의 POPULARITY_APPLICATION_WEIGHT/POPULARITY_HALF_LIFE_HOURS/POPULARITY_EPOCH가 이와 다르면 점수를 다시 계산해야 함
+APPLICATION_WEIGHT = 10.0
+HALF_LIFE_HOURS = 72.0
+EPOCH = datetime.datetime(2025, 1, 1)
+
+CREATE_SQL = """
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS view_count BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS popularity_score DOUBLE PRECISION;
+"""
+
+# 지원 1건 = ln(가중치) + 기준 시각부터의 감쇠 지수. 프로젝트별로 log-sum-exp (가장 큰 값을 빼서 exp 넘침 방지)
+SCORE_SQL = """
+popularity_score = (
+    SELECT MAX(x) + ln(SUM(exp(x - m))) FROM (
+        SELECT x, MAX(x) OVER () AS m FROM (
+            SELECT %s + ln(2) * EXTRACT(EPOCH FROM a.created_at - %s) / 3600 / %s AS x
+            FROM applications a WHERE a.project_id = projects.id AND a.created_at IS NOT NULL
+        ) xs
+    ) t
+)
+"""
+
+
+def upgrade(conn):
+    cursor = conn.cursor()
+    cursor.execute(CREATE_SQL)
+    conn.commit()
+    cursor.close()
+
+    batched_update(
+        conn, "projects", SCORE_SQL,
+        "popularity_score IS NULL AND EXISTS (SELECT 1 FROM applications a WHERE a.project_id = projects.id)",
+        (math.log(APPLICATION_WEIGHT), EPOCH, HALF_LIFE_HOURS)
+    )
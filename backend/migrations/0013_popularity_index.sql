@@ -0,0 +1,5 @@
+-- migrate: no-transaction
+-- 0013 인기순 정렬(GET /projects?sort=popular)용 인덱스
+-- WHERE status = ? AND deleted_at IS NULL ORDER BY popularity_score DESC NULLS LAST, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_status_popularity ON projects(status, popularity_score DESC NULLS LAST, id DESC)
+    WHERE deleted_at IS NULL;
@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- 0014 의미 검색 인덱스 동기화(app/semantic.py)용 인덱스
+-- 주기적 동기화가 WHERE <변경 시각> >= ? 로 최근에 바뀐 행만 읽으므로 전체 스캔이 되지 않게 함
+-- (projects는 SOURCES의 식과 똑같은 GREATEST(updated_at, deleted_at) 식 인덱스)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_students_updated_at ON students(updated_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_changed_at ON projects((GREATEST(updated_at, deleted_at)));
@@ -28,6 +28,11 @@ export default function ChatPage() {
   const [currentMessage, setCurrentMessage] = useState("");
   const [myUserId, setMyUserId] = useState<string | null>(null);
   const [isLoadingHistory, setIsLoadingHistory] = useState(true);
+  // 대화 기록은 최신 메시지부터 페이지 단위로 받으므로, 더 이전 메시지가 있으면 next_before로 이어서 불러옵니다.
+  const [nextBefore, setNextBefore] = useState<number | null>(null);
+  const [isLoadingOlder, setIsLoadingOlder] = useState(false);
+  // 이전 메시지를 앞에 붙일 때는 맨 아래로 스크롤하지 않습니다.
+  const skipScrollRef = useRef(false);
 
   // 메시지 목록의 맨 아래를 참조하기 위한 Ref입니다. 새 메시지가 오면 이 위치로 스크롤합니다.
   const messagesEndRef = useRef<HTMLDivElement>(null);
@@ -68,7 +73,8 @@ export default function ChatPage() {
     // 3. 웹소켓 서버에 연결합니다.
     // Flask-SocketIO는 같은 서버(API URL)에서 동작합니다
     const socketUrl = process.env.NEXT_PUBLIC_API_URL || "http://localhost:5000";
-    const newSocket = io(socketUrl);
+    // 서버가 JWT로 사용자를 확인한 뒤에만 채팅방 참여를 허용하므로 토큰을 함께 보냅니다.
+    const newSocket = io(socketUrl, { auth: { token } });
     setSocket(newSocket);
 
     // 4. 컴포넌트가 사라질 때(unmount) 소켓 연결을 정리합니다.
@@ -77,6 +83,44 @@ export default function ChatPage() {
     };
   }, [router]); // 이 useEffect는 사용자 정보 설정과 소켓 초기 연결만 담당합니다.
 
+  // 대화 기록 한 페이지를 불러옵니다. before가 있으면 그 메시지보다 이전 메시지들입니다.
+  const fetchHistoryPage = async (before: number | null) => {
+    const apiUrl = process.env.NEXT_PUBLIC_API_URL || "http://localhost:5000";
+    const query = before ? `?before=${before}` : "";
+    const response = await fetch(`${apiUrl}/messages/${roomId}${query}`);
+    const data = await response.json();
+    if (!response.ok) {
+      return null;
+    }
+
+    const messages: Message[] = data.messages.map((msg: { room_id: string; sender: string; message: string; created_at: string; }) => ({
+      room_id: msg.room_id,
+      sender: msg.sender,
+      message: msg.message,
+      created_at: msg.created_at,
+      isMe: msg.sender === myUserId
+    }));
+    return { messages, nextBefore: data.has_more ? (data.next_before as number) : null };
+  };
+
+  // '이전 메시지 더 보기'를 누르면 현재 목록 앞에 이전 페이지를 붙입니다.
+  const loadOlderMessages = async () => {
+    if (!nextBefore || isLoadingOlder) return;
+    setIsLoadingOlder(true);
+    try {
+      const data = await fetchHistoryPage(nextBefore);
+      if (data) {
+        skipScrollRef.current = true;
+        setMessages((prev) => [...data.messages, ...prev]);
+        setNextBefore(data.nextBefore);
+      }
+    } catch (error) {
+      // 오류 발생 시 조용히 처리
+    } finally {
+      setIsLoadingOlder(false);
+    }
+  };
+
   // roomId와 myUserId가 확정된 후에 대화 기록을 불러옵니다.
   useEffect(() => {
     if (!roomId || !myUserId) {
@@ -86,19 +130,10 @@ export default function ChatPage() {
     const fetchHistory = async () => {
       setIsLoadingHistory(true);
       try {
-        const apiUrl = process.env.NEXT_PUBLIC_API_URL || "http://localhost:5000";
-        const response = await fetch(`${apiUrl}/messages/${roomId}`);
-        const data = await response.json();
-
-        if (response.ok) {
-          const historyWithIsMe: Message[] = data.messages.map((msg: { room_id: string; sender: string; message: string; created_at: string; }) => ({
-            room_id: msg.room_id,
-            sender: msg.sender,
-            message: msg.message,
-            created_at: msg.created_at,
-            isMe: msg.sender === myUserId
-          }));
-          setMessages(historyWithIsMe);
+        const data = await fetchHistoryPage(null);
+        if (data) {
+          setMessages(data.messages);
+          setNextBefore(data.nextBefore);
         }
       } catch (error) {
         // 오류 발생 시 조용히 처리
@@ -146,6 +181,10 @@ export default function ChatPage() {
   // messages 배열이 업데이트될 때마다 실행됩니다.
   useEffect(() => {
     // 새 메시지가 추가되면 채팅창 스크롤을 맨 아래로 부드럽게 이동시킵니다.
+    if (skipScrollRef.current) {
+      skipScrollRef.current = false;
+      return;
+    }
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
   }, [messages]);
 
@@ -185,6 +224,18 @@ export default function ChatPage() {
       {/* 메시지 목록 */}
       <main className="flex-1 p-4 overflow-y-auto bg-gray-100">
         {isLoadingHistory && <div className="text-center text-gray-500">대화 기록을 불러오는 중...</div>}
+        {!isLoadingHistory && nextBefore && (
+          <div className="text-center mb-4">
+            <button
+              type="button"
+              onClick={loadOlderMessages}
+              disabled={isLoadingOlder}
+              className="text-sm text-blue-600 hover:underline disabled:text-gray-400"
+            >
+              {isLoadingOlder ? "불러오는 중..." : "이전 메시지 더 보기"}
+            </button>
+          </div>
+        )}
         <div className="space-y-4">
           {messages.map((msg, index) => {
             // 시간 포맷팅 함수
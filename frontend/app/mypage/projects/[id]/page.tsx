@@ -22,6 +22,23 @@ interface Project {
   description: string;
 }
 
+// 상태별 지원자 수 (GET /applications/project/<id> 응답의 facets)
+interface Facets {
+  total: number;
+  PENDING: number;
+  ACCEPTED: number;
+  REJECTED: number;
+}
+
+type StatusFilter = "" | "PENDING" | "ACCEPTED" | "REJECTED";
+
+const STATUS_FILTERS: { value: StatusFilter; label: string; facet: keyof Facets }[] = [
+  { value: "", label: "전체", facet: "total" },
+  { value: "PENDING", label: "대기중", facet: "PENDING" },
+  { value: "ACCEPTED", label: "승인됨", facet: "ACCEPTED" },
+  { value: "REJECTED", label: "거절됨", facet: "REJECTED" },
+];
+
 // 현재 로그인한 사용자 정보 타입 정의
 interface UserInfo {
   role: string;
@@ -45,6 +62,11 @@ export default function ProjectApplicantsPage() {
   const [userInfo, setUserInfo] = useState<UserInfo | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
+  // 지원자 목록은 페이지 단위로 받으므로, 다음 페이지가 있으면 next_cursor로 이어서 불러옵니다.
+  const [facets, setFacets] = useState<Facets | null>(null);
+  const [statusFilter, setStatusFilter] = useState<StatusFilter>("");
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const token = document.cookie
@@ -81,21 +103,30 @@ export default function ProjectApplicantsPage() {
     }
   }, [projectId, router]);
 
-  const fetchApplicants = async (token: string, id: string) => {
+  // 지원자 한 페이지 요청. cursor가 없으면 첫 페이지입니다.
+  const fetchApplicantsPage = async (token: string, id: string, status: StatusFilter, cursor: string | null) => {
+    const apiUrl = process.env.NEXT_PUBLIC_API_URL || "http://localhost:5000";
+    const query = new URLSearchParams();
+    if (status) query.set("status", status);
+    if (cursor) query.set("cursor", cursor);
+    const response = await fetch(`${apiUrl}/applications/project/${id}?${query.toString()}`, {
+      headers: {
+        Authorization: `Bearer ${token}`,
+      },
+    });
+    return { response, data: await response.json() };
+  };
+
+  const fetchApplicants = async (token: string, id: string, status: StatusFilter = statusFilter) => {
     setLoading(true);
     try {
-      const apiUrl = process.env.NEXT_PUBLIC_API_URL || "http://localhost:5000";
-      const response = await fetch(`${apiUrl}/applications/project/${id}`, {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
-
-      const data = await response.json();
+      const { response, data } = await fetchApplicantsPage(token, id, status, null);
 
       if (response.ok) {
         setProject(data.project);
         setApplicants(data.applications || []);
+        setFacets(data.facets || null);
+        setNextCursor(data.has_more ? data.next_cursor : null);
       } else {
         setError(data.message || "지원자 정보를 불러올 수 없습니다.");
       }
@@ -107,6 +138,43 @@ export default function ProjectApplicantsPage() {
     }
   };
 
+  // '더 보기'를 누르면 다음 페이지를 목록 뒤에 붙입니다.
+  const loadMoreApplicants = async () => {
+    const token = document.cookie
+      .split("; ")
+      .find((row) => row.startsWith("token="))
+      ?.split("=")[1];
+    if (!token || !nextCursor || loadingMore) return;
+
+    setLoadingMore(true);
+    try {
+      const { response, data } = await fetchApplicantsPage(token, projectId, statusFilter, nextCursor);
+      if (response.ok) {
+        setApplicants((prev) => [...prev, ...(data.applications || [])]);
+        setFacets(data.facets || null);
+        setNextCursor(data.has_more ? data.next_cursor : null);
+      } else {
+        alert(data.message || "지원자 정보를 불러올 수 없습니다.");
+      }
+    } catch (err) {
+      console.error("지원자 정보 로딩 실패:", err);
+      alert("서버와 연결할 수 없습니다.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // 상태 탭을 바꾸면 해당 상태의 첫 페이지부터 다시 불러옵니다.
+  const handleFilterChange = (status: StatusFilter) => {
+    const token = document.cookie
+      .split("; ")
+      .find((row) => row.startsWith("token="))
+      ?.split("=")[1];
+    if (!token) return;
+    setStatusFilter(status);
+    fetchApplicants(token, projectId, status);
+  };
+
   const handleStatusChange = async (applicationId: number, newStatus: "ACCEPTED" | "REJECTED") => {
     const token = document.cookie
       .split("; ")
@@ -173,9 +241,24 @@ export default function ProjectApplicantsPage() {
         </button>
         <h1 className="text-3xl font-bold text-gray-900">{project?.title}</h1>
         <p className="text-gray-600 mt-1">
-          총 {applicants.length}명의 지원자가 있습니다.
+          총 {facets ? facets.total : applicants.length}명의 지원자가 있습니다.
         </p>
 
+        {/* 상태별 필터 (facets의 상태별 지원자 수 표시) */}
+        <div className="mt-4 flex gap-2">
+          {STATUS_FILTERS.map((filter) => (
+            <button
+              key={filter.value || "ALL"}
+              onClick={() => handleFilterChange(filter.value)}
+              className={`px-3 py-1 rounded-full text-sm font-medium ${
+                statusFilter === filter.value ? "bg-blue-600 text-white" : "bg-gray-100 text-gray-700 hover:bg-gray-200"
+              }`}
+            >
+              {filter.label} {facets ? facets[filter.facet] : ""}
+            </button>
+          ))}
+        </div>
+
         <div className="mt-8 space-y-6">
           {applicants.length > 0 ? (
             applicants.map((applicant) => (
@@ -243,10 +326,22 @@ export default function ProjectApplicantsPage() {
             ))
           ) : (
             <p className="text-center text-gray-500 py-8">
-              아직 지원자가 없습니다.
+              {statusFilter ? "해당 상태의 지원자가 없습니다." : "아직 지원자가 없습니다."}
             </p>
           )}
         </div>
+
+        {nextCursor && (
+          <div className="mt-6 text-center">
+            <button
+              onClick={loadMoreApplicants}
+              disabled={loadingMore}
+              className="px-4 py-2 text-sm font-medium text-blue-600 border border-blue-600 rounded-md hover:bg-blue-50 disabled:text-gray-400 disabled:border-gray-300"
+            >
+              {loadingMore ? "불러오는 중..." : "지원자 더 보기"}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );